@@ -15,6 +15,8 @@ setup(
     entry_points={
         "spacy_factories": [
             "temporal_normalization=temporal_normalization.factory:create_component",
+            "temporal_normalization_prefetch=temporal_normalization.factory:create_prefetch_component",
+            "temporal_language_gate=temporal_normalization.factory:create_language_gate",
         ],
     },
     package_data={
@@ -23,8 +25,12 @@ setup(
     install_requires=[
         "spacy>=3.8.7,<4.0.0",
         "py4j>=0.10.9.9",
-        "langdetect>=1.0.9"
+        "langdetect>=1.0.9",
+        "numpy>=1.19.0",
     ],
+    extras_require={
+        "arrow": ["pyarrow>=10.0.0"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.9",
@@ -1,5 +1,24 @@
-from .commons.print_utils import *  # noqa: F401, F403
-from .commons.temporal_models import *  # noqa: F401, F403
-from .commons.temporal_types import *  # noqa: F401, F403
-from .process.java_process import *  # noqa: F401, F403
-from .index import TemporalNormalization  # noqa: F401, F403
+# The public names are imported on first access, so that, e.g.,
+# ``from temporal_normalization import start_conn`` does not import spaCy.
+from . import commons, process
+from .commons.lazy_imports import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "commons": commons.__all__,
+        "process": process.__all__,
+        # the singletons named after their submodule (see ``attach``)
+        "commons.dbpedia_registry": ("dbpedia_registry",),
+        "commons.stage_metrics": ("stage_metrics",),
+        "process.java_output": ("java_output",),
+        "index": ("TemporalNormalization", "register_extensions", "time_series_batch"),
+        "incremental": ("IncrementalNormalization",),
+        "prefetch": ("TemporalNormalizationPrefetch",),
+        "gate": ("TemporalLanguageGate",),
+        "backfill": ("apply_backfill", "run_backfill"),
+        "batch": ("run_batch",),
+    },
+)
+
+del attach
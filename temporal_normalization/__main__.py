@@ -0,0 +1,4 @@
+from temporal_normalization.batch import main
+
+if __name__ == "__main__":
+    main()
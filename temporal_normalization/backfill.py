@@ -0,0 +1,190 @@
+import argparse
+
+from spacy import Language
+from spacy.tokens import Doc
+
+from temporal_normalization.commons.print_utils import console
+from temporal_normalization.commons.time_series_codec import (
+    decode_time_series_cached,
+    encode_time_series,
+)
+from temporal_normalization.process.load_shedding import BackfillQueue, OverloadPolicy
+
+
+def run_backfill(
+    path: str,
+    nlp: Language,
+    batch_size: int = 64,
+    limit: int | None = None,
+) -> int:
+    """
+    Drains the backfill queue of the docs deferred by the ``temporal_normalization``
+    component and stores their time series payloads.
+
+    Args:
+        path (str): The SQLite database of the backfill queue (``backfill_path``).
+        nlp (Language): The pipeline used to normalize the deferred texts. It must be
+                        the pipeline which deferred them (the same tokenizer, the same
+                        upstream components and the same settings of the
+                        ``temporal_normalization`` component), without overload
+                        limits, so the texts are normalized like the other docs.
+        batch_size (int): The number of texts read from the queue at once.
+                          Defaults to 64.
+        limit (int or None): The maximum number of texts to backfill. Defaults to None,
+                             i.e., until the queue is empty.
+
+    Returns:
+        int: The number of backfilled texts.
+
+    Raises:
+        ValueError: If the pipeline has no ``temporal_normalization`` component, or if
+                    its overload limits are enabled (the texts could be deferred
+                    again, into the queue being drained).
+        RuntimeError: If all the texts read from the queue are deferred again.
+
+    Example:
+        >>> run_backfill("temporal_normalization_backfill.db", nlp)
+    """
+
+    if "temporal_normalization" not in nlp.pipe_names:
+        raise ValueError(
+            "The pipeline must contain the temporal_normalization component."
+        )
+    if nlp.get_pipe("temporal_normalization").overload.enabled:
+        raise ValueError(
+            "The overload limits of the temporal_normalization component "
+            "(overload_queue_depth and overload_latency) must be disabled to drain "
+            "the backfill queue."
+        )
+
+    queue = BackfillQueue(path)
+    processed = 0
+
+    try:
+        while limit is None or processed < limit:
+            size = batch_size if limit is None else min(batch_size, limit - processed)
+            items = queue.pending(size)
+            if not items:
+                break
+
+            docs = nlp.pipe([text for _, text in items])
+            results = [
+                (backfill_id, doc._.time_series_payload)
+                for (backfill_id, _), doc in zip(items, docs)
+                if not doc._.normalization_deferred
+            ]
+            if not results:
+                raise RuntimeError(
+                    f"All the {len(items)} texts read from the backfill queue were "
+                    f"deferred again ({processed} texts backfilled)."
+                )
+
+            queue.complete(results)
+            processed += len(results)
+    finally:
+        queue.close()
+
+    return processed
+
+
+def apply_backfill(
+    doc: Doc, queue: BackfillQueue, spans_key: str | None = "temporal"
+) -> bool:
+    """
+    Assigns the backfilled time series to a deferred doc.
+
+    The tokens and the entities of the doc are left unchanged. The normalized spans
+    are written into the ``spans_key`` span group, and their time series can be read
+    through ``span._.time_series``. A normalized span which does not match the token
+    boundaries of the doc is expanded to the tokens it overlaps; the spans which cannot
+    be aligned at all (e.g., past the end of the text) are dropped with a warning.
+
+    Args:
+        doc (Doc): A doc marked with ``doc._.normalization_deferred``.
+        queue (BackfillQueue): The backfill queue of the component.
+        spans_key (str or None): The key of the span group of the normalized spans.
+                                 None leaves the span groups unchanged.
+                                 Defaults to ``temporal``.
+
+    Returns:
+        bool: Whether the doc has been backfilled.
+    """
+
+    if not doc._.normalization_deferred or doc._.backfill_id is None:
+        return False
+
+    done, payload = queue.result(doc._.backfill_id)
+    if not done:
+        return False
+
+    doc._.time_series_payload = payload
+    doc._.normalization_deferred = False
+
+    if spans_key is not None and payload is not None:
+        entries = decode_time_series_cached(payload)
+        aligned: dict[tuple[int, int], list] = {}
+        spans = {}
+        dropped = 0
+
+        for (start_char, end_char), time_series in entries.items():
+            span = doc.char_span(
+                start_char, end_char, label="DATETIME", alignment_mode="expand"
+            )
+            if span is None:
+                dropped += 1
+                continue
+
+            # the time series are read through the offsets of the expanded span
+            key = (span.start_char, span.end_char)
+            aligned.setdefault(key, []).extend(time_series)
+            spans[key] = span
+
+        if aligned.keys() != entries.keys():
+            doc._.time_series_payload = (
+                encode_time_series(aligned) if aligned else None
+            )
+        doc.spans[spans_key] = list(spans.values())
+
+        if dropped:
+            console.warning(
+                f"{dropped} backfilled spans of the doc {doc._.backfill_id} do not "
+                f"match its text and were dropped."
+            )
+
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Normalizes the docs deferred by the temporal_normalization component."
+    )
+    parser.add_argument("path", help="The SQLite database of the backfill queue.")
+    parser.add_argument(
+        "--model",
+        required=True,
+        help="The pipeline which deferred the docs (a spaCy package or the directory "
+        "of a pipeline saved with nlp.to_disk).",
+    )
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+
+    import spacy
+
+    import temporal_normalization.factory  # noqa: F401
+
+    nlp = spacy.load(args.model)
+    if "temporal_normalization" not in nlp.pipe_names:
+        nlp.add_pipe("temporal_normalization", last=True)
+    else:
+        # the saved overload limits would defer the texts again
+        nlp.get_pipe("temporal_normalization").overload = OverloadPolicy()
+
+    processed = run_backfill(
+        args.path, nlp, batch_size=args.batch_size, limit=args.limit
+    )
+    print(f"Backfilled {processed} texts.")
+
+
+if __name__ == "__main__":
+    main()
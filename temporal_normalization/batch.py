@@ -0,0 +1,385 @@
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+from collections import deque
+from itertools import islice
+from multiprocessing.util import Finalize
+from pathlib import Path
+from typing import Iterable, Iterator, TextIO
+
+from py4j.protocol import Py4JNetworkError
+
+from temporal_normalization.commons.print_utils import console
+from temporal_normalization.commons.temporal_models import (
+    extract_temporal_expressions,
+    TemporalExpression,
+)
+from temporal_normalization.process.java_process import start_conn, close_conn
+
+OUTPUT_FORMATS = ("jsonl", "parquet", "arrow", "npz")
+INPUT_FORMATS = ("text", "jsonl")
+
+CHECKPOINT_FILE = "_checkpoint"
+
+# An input record: its identifier and its text.
+Record = tuple[object, str]
+
+# The gateway of the Java process of the current worker process, or the error which
+# prevented it from starting.
+_worker_gateway = None
+_worker_error: Exception | None = None
+
+
+def run_batch(
+    input_path: str,
+    output_path: str,
+    output_format: str = "jsonl",
+    input_format: str | None = None,
+    id_field: str = "id",
+    text_field: str = "text",
+    workers: int = 1,
+    chunk_size: int = 1000,
+) -> tuple[int, int]:
+    """
+    Normalizes a stream of texts with ``workers`` processes, each with its own Java
+    process, and writes the results as JSONL or columnar files.
+
+    The input is split into chunks of ``chunk_size`` records. Each chunk is written
+    to its own part file, and the completed chunks are recorded in a checkpoint, so
+    an interrupted job skips them when it is run again with the same arguments. With
+    ``jsonl`` output, the parts are written to ``<output_path>.parts`` and merged into
+    ``output_path`` once all the chunks are done; with columnar output,
+    ``output_path`` is a directory with one part per chunk.
+
+    Args:
+        input_path (str): The input file (``-`` for stdin), with one text per line
+                          (``text``) or one JSON object per line (``jsonl``).
+        output_path (str): The output file (``jsonl``) or directory (columnar).
+        output_format (str): ``jsonl``, ``parquet``, ``arrow`` or ``npz``.
+                             Defaults to ``jsonl``.
+        input_format (str or None): ``text`` or ``jsonl``. Defaults to ``jsonl`` for
+                                    ``.jsonl`` files and ``text`` otherwise.
+        id_field (str): The identifier field of the JSONL records. The line number is
+                        used if it is missing. Defaults to ``id``.
+        text_field (str): The text field of the JSONL records. Defaults to ``text``.
+        workers (int): The number of worker processes. Defaults to 1.
+        chunk_size (int): The number of records of a chunk. Defaults to 1000.
+
+    A record whose normalization fails is written as ``{"id": ..., "error": ...}`` in
+    ``jsonl`` output and skipped in columnar output, and counted as failed; a lost
+    connection to the Java process still fails the chunk, which is retried when the
+    job is run again.
+
+    Returns:
+        tuple[int, int]: The number of records processed by this run and, among
+                         them, the number of failed records.
+
+    Example:
+        >>> run_batch("texts.txt", "results.jsonl", workers=4)
+    """
+
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unsupported output format: {output_format}. "
+            f"Please use one of {OUTPUT_FORMATS}."
+        )
+
+    if input_format is None:
+        input_format = "jsonl" if input_path.endswith(".jsonl") else "text"
+
+    parts_dir = Path(
+        f"{output_path}.parts" if output_format == "jsonl" else output_path
+    )
+    parts_dir.mkdir(parents=True, exist_ok=True)
+
+    settings = {
+        "input": input_path,
+        "input_format": input_format,
+        "output_format": output_format,
+        "chunk_size": chunk_size,
+    }
+    done = _read_checkpoint(parts_dir / CHECKPOINT_FILE, settings)
+    if done:
+        console.info(f"Resuming: {len(done)} chunks are already normalized.")
+
+    processed = 0
+    failed = 0
+    started = time.perf_counter()
+    context = multiprocessing.get_context()
+
+    with _open_input(input_path) as input_file, open(
+        parts_dir / CHECKPOINT_FILE, "a", encoding="utf-8"
+    ) as checkpoint, context.Pool(workers, initializer=_init_worker) as pool:
+        pending: deque = deque()
+        chunks = _chunks(
+            _read_records(input_file, input_format, id_field, text_field), chunk_size
+        )
+
+        for index, records in chunks:
+            if index in done:
+                continue
+
+            pending.append(
+                pool.apply_async(
+                    _normalize_chunk,
+                    (index, index * chunk_size, records, str(parts_dir), output_format),
+                )
+            )
+
+            # bounds the number of chunks held in memory
+            while len(pending) >= 2 * workers:
+                count, errors = _complete(
+                    pending.popleft(), checkpoint, processed, started
+                )
+                processed += count
+                failed += errors
+
+        while pending:
+            count, errors = _complete(pending.popleft(), checkpoint, processed, started)
+            processed += count
+            failed += errors
+
+        pool.close()
+        pool.join()
+
+    if output_format == "jsonl":
+        _merge_parts(parts_dir, output_path)
+
+    if failed:
+        console.warning(f"{failed} of {processed} records could not be normalized.")
+
+    return processed, failed
+
+
+def _complete(
+    result, checkpoint: TextIO, processed: int, started: float
+) -> tuple[int, int]:
+    index, count, errors = result.get()
+
+    checkpoint.write(
+        json.dumps({"chunk": index, "records": count, "errors": errors}) + "\n"
+    )
+    checkpoint.flush()
+    os.fsync(checkpoint.fileno())
+
+    total = processed + count
+    console.info(
+        f"Chunk {index} done: {total} records "
+        f"({total / (time.perf_counter() - started):.1f} records/s)"
+    )
+
+    return count, errors
+
+
+def _init_worker() -> None:
+    """
+    Starts the Java process of a worker, on a free port of its own, which is closed
+    when the worker exits.
+
+    An error is kept and raised by the first chunk of the worker instead: a pool whose
+    initializer raises replaces the worker over and over, so the job would never end.
+    """
+
+    global _worker_gateway, _worker_error
+
+    root_path = str(Path(__file__).resolve().parent.parent)
+    try:
+        java_process, _worker_gateway = start_conn(root_path, port=0)
+    except Exception as e:
+        _worker_error = e
+        return
+
+    Finalize(None, close_conn, (java_process, _worker_gateway), exitpriority=10)
+
+
+def _normalize_chunk(
+    index: int, start: int, records: list[Record], parts_dir: str, output_format: str
+) -> tuple[int, int, int]:
+    """
+    Normalizes the records of a chunk and writes them to a part file, atomically.
+    In columnar formats, the ``doc_id`` of a record is its position in the input.
+
+    Returns:
+        tuple[int, int, int]: The index of the chunk, its number of records and the
+                              number of records which could not be normalized.
+    """
+
+    if _worker_error is not None:
+        raise RuntimeError(
+            "The Java process of the worker did not start."
+        ) from _worker_error
+
+    suffix = "" if output_format == "npz" else f".{output_format}"
+    path = Path(parts_dir) / f"part-{index:06d}{suffix}"
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    errors = 0
+
+    if output_format == "jsonl":
+        with open(tmp_path, "w", encoding="utf-8") as output_file:
+            for record_id, text in records:
+                try:
+                    result = _to_json(record_id, _extract(text))
+                except Py4JNetworkError:
+                    raise
+                except Exception as e:
+                    errors += 1
+                    result = {"id": record_id, "error": f"{type(e).__name__}: {e}"}
+
+                output_file.write(json.dumps(result, ensure_ascii=False) + "\n")
+    else:
+        # imported on first use, since it imports numpy (and pyarrow)
+        from temporal_normalization.commons.columnar_export import ColumnarExporter
+
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        with ColumnarExporter(str(tmp_path), output_format) as exporter:
+            for i, (_, text) in enumerate(records):
+                try:
+                    expressions = _extract(text)
+                except Py4JNetworkError:
+                    raise
+                except Exception:
+                    errors += 1
+                    continue
+
+                exporter.write_expressions(expressions, start + i)
+
+        # a part written before an interruption, but not yet checkpointed
+        shutil.rmtree(path, ignore_errors=True)
+
+    os.replace(tmp_path, path)
+
+    return index, len(records), errors
+
+
+def _extract(text: str) -> list[TemporalExpression]:
+    if not text.strip():
+        return []
+
+    return extract_temporal_expressions(_worker_gateway, text)
+
+
+def _to_json(record_id, expressions: list[TemporalExpression]) -> dict:
+    return {
+        "id": record_id,
+        "expressions": [
+            {
+                "input_value": expression.input_value,
+                "prepared_value": expression.prepared_value,
+                "matches": expression.matches,
+                "time_series": [ts.to_json() for ts in expression.time_series],
+            }
+            for expression in expressions
+        ],
+    }
+
+
+def _open_input(input_path: str) -> TextIO:
+    if input_path == "-":
+        return open(sys.stdin.fileno(), "r", encoding="utf-8", closefd=False)
+
+    return open(input_path, "r", encoding="utf-8")
+
+
+def _read_records(
+    lines: Iterable[str], input_format: str, id_field: str, text_field: str
+) -> Iterator[Record]:
+    for line_number, line in enumerate(lines):
+        line = line.rstrip("\n")
+
+        if input_format == "text":
+            yield line_number, line
+            continue
+
+        if not line.strip():
+            continue
+
+        obj = json.loads(line)
+        yield obj.get(id_field, line_number), obj.get(text_field) or ""
+
+
+def _chunks(
+    records: Iterator[Record], chunk_size: int
+) -> Iterator[tuple[int, list[Record]]]:
+    index = 0
+    while chunk := list(islice(records, chunk_size)):
+        yield index, chunk
+        index += 1
+
+
+def _read_checkpoint(path: Path, settings: dict) -> set[int]:
+    """
+    Returns the chunks completed by a previous run, after checking that it used the
+    same settings (or writes the settings of a new run).
+    """
+
+    if not path.exists() or path.stat().st_size == 0:
+        path.write_text(json.dumps(settings) + "\n", encoding="utf-8")
+        return set()
+
+    with open(path, "r", encoding="utf-8") as checkpoint:
+        previous = json.loads(checkpoint.readline())
+        if previous != settings:
+            raise ValueError(
+                f"The checkpoint {path} was written with different settings "
+                f"({previous}). Please use another output path."
+            )
+
+        done = set()
+        for line in checkpoint:
+            try:
+                done.add(json.loads(line)["chunk"])
+            except (ValueError, KeyError):
+                # a line truncated by an interruption
+                continue
+
+    return done
+
+
+def _merge_parts(parts_dir: Path, output_path: str) -> None:
+    """Concatenates the JSONL parts in the order of the input and removes them."""
+
+    tmp_path = f"{output_path}.tmp"
+
+    with open(tmp_path, "wb") as output_file:
+        for part in sorted(parts_dir.glob("part-*.jsonl")):
+            with open(part, "rb") as part_file:
+                shutil.copyfileobj(part_file, output_file)
+
+    os.replace(tmp_path, output_path)
+    shutil.rmtree(parts_dir)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m temporal_normalization",
+        description="Normalizes the temporal expressions of a stream of texts.",
+    )
+    parser.add_argument("input", help="The input file, or - for stdin.")
+    parser.add_argument("output", help="The output file (jsonl) or directory.")
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default="jsonl")
+    parser.add_argument("--input-format", choices=INPUT_FORMATS, default=None)
+    parser.add_argument("--id-field", default="id")
+    parser.add_argument("--text-field", default="text")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    processed, failed = run_batch(
+        args.input,
+        args.output,
+        output_format=args.format,
+        input_format=args.input_format,
+        id_field=args.id_field,
+        text_field=args.text_field,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
+    print(f"Normalized {processed - failed} records ({failed} failed).")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,48 @@
-from .print_utils import *  # noqa: F401, F403
-from .temporal_models import *  # noqa: F401, F403
-from .temporal_types import *  # noqa: F401, F403
+from .lazy_imports import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "columnar_export": (
+            "COLUMNS",
+            "ColumnarExporter",
+            "FORMATS",
+            "MISSING_YEAR",
+            "STRING_COLUMNS",
+            "read_npz",
+        ),
+        "dbpedia_registry": ("DBpediaEntity", "DBpediaRegistry"),
+        "language_gate": (
+            "LanguageGate",
+            "SAMPLE_LENGTH",
+            "detect_language",
+            "sample_text",
+        ),
+        "print_utils": ("COLORS", "console"),
+        "stage_metrics": (
+            "DocTrace",
+            "METRIC_BUCKETS",
+            "METRIC_COUNTERS",
+            "METRIC_STAGES",
+            "StageMetrics",
+        ),
+        "temporal_bounds": (
+            "Bounds",
+            "DBPEDIA_PAGE",
+            "coarser_granularity",
+            "uri_bounds",
+        ),
+        "temporal_index": ("ENTRY_DTYPE", "TemporalIndex"),
+        "temporal_models": (
+            "DBpediaModel",
+            "EdgeModel",
+            "TemporalExpression",
+            "TimeSeries",
+            "extract_temporal_expressions",
+        ),
+        "temporal_types": ("TemporalType",),
+        "timeline_histogram": ("GRANULARITIES", "TimelineHistogram", "WEIGHTINGS"),
+    },
+)
+
+del attach
@@ -0,0 +1,334 @@
+import os
+from typing import Iterable
+
+import numpy as np
+
+from temporal_normalization.commons.temporal_models import (
+    _TEMPORAL_TYPES,
+    TemporalExpression,
+    TimeSeries,
+)
+from temporal_normalization.commons.time_series_codec import (
+    decode_time_series_cached,
+)
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - pyarrow is an optional dependency
+    pyarrow = None
+
+STRING_COLUMNS = (
+    "input_text",
+    "prepared_value",
+    "match",
+    "start_uri",
+    "end_uri",
+    "type",
+)
+COLUMNS = (
+    "doc_id",
+    "input_text",
+    "prepared_value",
+    "match",
+    "start_uri",
+    "end_uri",
+    "start_year",
+    "end_year",
+    "type",
+)
+
+# Missing years are written as nulls in Arrow/Parquet and as MISSING_YEAR in NumPy.
+MISSING_YEAR = np.iinfo(np.int32).min
+
+FORMATS = ("parquet", "arrow", "npz")
+
+
+class ColumnarExporter:
+    """
+    Writes the normalization results as columnar batches with a fixed schema:
+    ``doc_id``, ``input_text``, ``prepared_value``, ``match``, ``start_uri``,
+    ``end_uri``, ``start_year``, ``end_year`` and ``type`` (the matched type of the
+    start edge).
+
+    Rows are buffered and flushed every ``batch_size`` rows, so the memory stays
+    bounded regardless of the number of exported documents:
+        - ``parquet``: a single Parquet file, with one row group per batch.
+        - ``arrow``: a single Arrow IPC file, with one record batch per batch.
+        - ``npz``: a directory with one ``part-NNNNN.npz`` file per batch. String
+          columns are dictionary-encoded as ``<column>_codes`` (int32) and
+          ``<column>_values`` (unicode) arrays, so they can be loaded without pickle.
+
+    Example:
+        >>> with ColumnarExporter("results.parquet") as exporter:
+        ...     exporter.write_docs(nlp.pipe(texts))
+    """
+
+    def __init__(self, path: str, fmt: str | None = None, batch_size: int = 65536):
+        """
+        Args:
+            path (str): The output file (``parquet``, ``arrow``) or directory (``npz``).
+            fmt (str or None): The output format. Defaults to ``parquet`` if pyarrow
+                               is installed and ``npz`` otherwise.
+            batch_size (int): The number of rows of each batch. Defaults to 65536.
+        """
+
+        if fmt is None:
+            fmt = "parquet" if pyarrow is not None else "npz"
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}. Please use one of {FORMATS}.")
+        if fmt != "npz" and pyarrow is None:
+            raise ImportError(f'The "{fmt}" format requires pyarrow to be installed.')
+
+        self.path = path
+        self.fmt = fmt
+        self.batch_size = batch_size
+        self.rows = 0
+        self.batches = 0
+        self._columns: dict[str, list] = {column: [] for column in COLUMNS}
+        self._writer = None
+
+        if fmt == "npz":
+            os.makedirs(path, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write_time_series(
+        self,
+        time_series: Iterable[TimeSeries],
+        doc_id: int = -1,
+        match: str | None = None,
+    ) -> None:
+        """
+        Appends one row for each time series.
+
+        Args:
+            time_series (Iterable[TimeSeries]): The time series to export.
+            doc_id (int): The identifier of the document.
+            match (str or None): The matched text (e.g., the text of the span). If
+                                 None, one row is written for each matched value of
+                                 each time series.
+        """
+
+        for ts in time_series:
+            start_uri, end_uri, matched_type = _edge_fields(ts)
+            matches = (match,) if match is not None else ts.matches or (None,)
+
+            for matched_value in matches:
+                self._append(
+                    doc_id,
+                    ts.input_value,
+                    ts.prepared_value,
+                    matched_value,
+                    start_uri,
+                    end_uri,
+                    ts.start_year,
+                    ts.end_year,
+                    matched_type,
+                )
+
+    def write_doc(self, doc, doc_id: int = -1) -> None:
+        """
+        Appends the time series of all the spans of a processed spaCy document, using
+        the text of each span as ``match``.
+        """
+
+        payload = doc._.time_series_payload
+        if payload is None:
+            return
+
+        for (start_char, end_char), time_series in decode_time_series_cached(
+            payload
+        ).items():
+            self.write_time_series(time_series, doc_id, doc.text[start_char:end_char])
+
+    def write_docs(self, docs: Iterable, start_id: int = 0) -> None:
+        """Appends a stream of processed spaCy documents, numbered from ``start_id``."""
+
+        for doc_id, doc in enumerate(docs, start_id):
+            self.write_doc(doc, doc_id)
+
+    def write_expressions(
+        self, expressions: Iterable[TemporalExpression], doc_id: int = -1
+    ) -> None:
+        """Appends the expressions returned by ``extract_temporal_expressions``."""
+
+        for expression in expressions:
+            self.write_time_series(expression.time_series, doc_id)
+
+    def flush(self) -> None:
+        """Writes the buffered rows as a new batch."""
+
+        if not self._columns["doc_id"]:
+            return
+
+        if self.fmt == "npz":
+            self._write_npz()
+        else:
+            self._write_arrow()
+
+        self.batches += 1
+        self._columns = {column: [] for column in COLUMNS}
+
+    def close(self) -> None:
+        """Flushes the buffered rows and closes the output."""
+
+        self.flush()
+
+        if self.fmt != "npz":
+            if self._writer is None:
+                # write the schema even if there are no rows
+                self._open_arrow_writer()
+            self._writer.close()
+            self._writer = None
+
+    def _append(self, *values) -> None:
+        for column, value in zip(COLUMNS, values):
+            self._columns[column].append(value)
+
+        self.rows += 1
+        if len(self._columns["doc_id"]) >= self.batch_size:
+            self.flush()
+
+    def _write_npz(self) -> None:
+        arrays = {
+            "doc_id": np.array(self._columns["doc_id"], dtype=np.int64),
+            "start_year": _years(self._columns["start_year"]),
+            "end_year": _years(self._columns["end_year"]),
+        }
+
+        for column in STRING_COLUMNS:
+            values, codes = _dictionary_encode(self._columns[column])
+            arrays[f"{column}_codes"] = codes
+            arrays[f"{column}_values"] = values
+
+        np.savez(os.path.join(self.path, f"part-{self.batches:05d}.npz"), **arrays)
+
+    def _write_arrow(self) -> None:
+        if self._writer is None:
+            self._open_arrow_writer()
+
+        batch = pyarrow.record_batch(
+            [
+                pyarrow.array(self._columns[field.name], type=field.type)
+                for field in _arrow_schema()
+            ],
+            schema=_arrow_schema(),
+        )
+
+        self._writer.write_batch(batch)
+
+    def _open_arrow_writer(self) -> None:
+        if self.fmt == "parquet":
+            self._writer = pyarrow.parquet.ParquetWriter(self.path, _arrow_schema())
+        else:
+            self._writer = pyarrow.ipc.new_file(self.path, _arrow_schema())
+
+
+def read_npz(path: str) -> dict[str, np.ndarray]:
+    """
+    Reads the batches written by ``ColumnarExporter`` in the ``npz`` format and
+    returns the decoded columns. Missing strings are decoded as empty strings.
+
+    Args:
+        path (str): The output directory of the exporter.
+
+    Returns:
+        dict[str, np.ndarray]: The columns of all the batches.
+    """
+
+    parts = sorted(name for name in os.listdir(path) if name.endswith(".npz"))
+    columns: dict[str, list[np.ndarray]] = {column: [] for column in COLUMNS}
+
+    for name in parts:
+        with np.load(os.path.join(path, name)) as part:
+            for column in ("doc_id", "start_year", "end_year"):
+                columns[column].append(part[column])
+            for column in STRING_COLUMNS:
+                values = part[f"{column}_values"]
+                codes = part[f"{column}_codes"]
+                # -1 codes stand for missing strings
+                columns[column].append(np.append(values, "")[codes])
+
+    return {
+        column: np.concatenate(arrays) if arrays else np.empty(0)
+        for column, arrays in columns.items()
+    }
+
+
+def _arrow_schema():
+    return pyarrow.schema(
+        [
+            ("doc_id", pyarrow.int64()),
+            ("input_text", pyarrow.string()),
+            ("prepared_value", pyarrow.string()),
+            ("match", pyarrow.string()),
+            ("start_uri", pyarrow.string()),
+            ("end_uri", pyarrow.string()),
+            ("start_year", pyarrow.int32()),
+            ("end_year", pyarrow.int32()),
+            ("type", pyarrow.string()),
+        ]
+    )
+
+
+def _edge_fields(ts: TimeSeries) -> tuple[str | None, str | None, str | None]:
+    """
+    Returns the start URI, the end URI and the matched type of the start edge,
+    without building the models of lazy time series.
+    """
+
+    if ts.is_materialized:
+        edges = ts.edges
+        start = edges.start if edges is not None else None
+        end = edges.end if edges is not None else None
+        matched_type = start.matched_type if start is not None else None
+
+        return (
+            start.uri if start is not None else None,
+            end.uri if end is not None else None,
+            matched_type.value if matched_type is not None else None,
+        )
+
+    edges = ts.to_json().get("edges") or {}
+    start = edges.get("start") or {}
+    end = edges.get("end") or {}
+
+    # the unknown types are exported as missing, like in the materialized models
+    matched_type = _TEMPORAL_TYPES.get(start.get("matchedType"))
+
+    return (
+        start.get("uri"),
+        end.get("uri"),
+        matched_type.value if matched_type is not None else None,
+    )
+
+
+def _years(values: list[int | None]) -> np.ndarray:
+    return np.array(
+        [MISSING_YEAR if value is None else value for value in values],
+        dtype=np.int32,
+    )
+
+
+def _dictionary_encode(values: list[str | None]) -> tuple[np.ndarray, np.ndarray]:
+    codes_by_value: dict[str, int] = {}
+    codes = np.empty(len(values), dtype=np.int32)
+
+    for i, value in enumerate(values):
+        if value is None:
+            codes[i] = -1
+        else:
+            code = codes_by_value.get(value)
+            if code is None:
+                code = codes_by_value[value] = len(codes_by_value)
+            codes[i] = code
+
+    return np.array(list(codes_by_value), dtype=str), codes
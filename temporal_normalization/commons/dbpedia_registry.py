@@ -0,0 +1,191 @@
+import threading
+from itertools import islice
+from operator import attrgetter
+
+from temporal_normalization.commons.temporal_bounds import uri_bounds
+from temporal_normalization.commons.temporal_types import TemporalType
+
+
+class DBpediaEntity:
+    """
+    An immutable DBpedia entity (e.g., a century, a millennium or a year), shared by
+    all the ``DBpediaModel`` occurrences which refer to it.
+
+    Instances should be obtained through ``dbpedia_registry.intern`` rather than
+    created directly.
+
+    Attributes:
+        uri (str or None): The unique identifier (URI) of the DBpedia entity.
+        label (str or None): A human-readable name for the entity.
+        matched_type (TemporalType or None): The temporal type of the entity,
+            if applicable.
+        start_year (int or None): The first year of the period (negative for BC).
+        end_year (int or None): The last year of the period (negative for BC).
+        granularity (TemporalType or None): The granularity of the period
+            (``YEAR``, ``CENTURY`` or ``MILLENNIUM``).
+    """
+
+    __slots__ = (
+        "_uri",
+        "_label",
+        "_matched_type",
+        "_start_year",
+        "_end_year",
+        "_granularity",
+    )
+
+    uri: str | None = property(attrgetter("_uri"))
+    label: str | None = property(attrgetter("_label"))
+    matched_type: TemporalType | None = property(attrgetter("_matched_type"))
+    start_year: int | None = property(attrgetter("_start_year"))
+    end_year: int | None = property(attrgetter("_end_year"))
+    granularity: TemporalType | None = property(attrgetter("_granularity"))
+
+    def __init__(
+        self, uri: str | None, label: str | None, matched_type: TemporalType | None
+    ):
+        bounds = uri_bounds(uri)
+
+        self._uri = uri
+        self._label = label
+        self._matched_type = matched_type
+        self._start_year, self._end_year, self._granularity = (
+            bounds if bounds is not None else (None, None, None)
+        )
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, DBpediaEntity):
+            return NotImplemented
+        return self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __reduce__(self):
+        # Unpickled entities (e.g., received from worker processes) are interned
+        # again, so they are shared with the entities of the current process.
+        return _intern_entity, self.key()
+
+    def __repr__(self):
+        return f"DBpediaEntity(label={self._label}, uri={self._uri})"
+
+    def key(self) -> tuple[str | None, str | None, TemporalType | None]:
+        return self._uri, self._label, self._matched_type
+
+
+class DBpediaRegistry:
+    """
+    A process-wide, bounded registry which interns the DBpedia entities, so that
+    identical periods share one immutable instance regardless of how many times they
+    occur in the processed expressions.
+
+    Once ``max_size`` distinct entities have been registered, new entities are no
+    longer interned (they are still returned, but not shared), which keeps the memory
+    bounded even for unexpected inputs.
+
+    Attributes:
+        max_size (int): The maximum number of interned entities.
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        self.max_size = max_size
+        self._entities: dict[tuple, DBpediaEntity] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._overflows = 0
+
+    def __len__(self):
+        return len(self._entities)
+
+    def intern(
+        self, uri: str | None, label: str | None, matched_type: TemporalType | None
+    ) -> DBpediaEntity:
+        """
+        Returns the shared entity identified by ``(uri, label, matched_type)``,
+        registering it if it has not been seen before.
+
+        Args:
+            uri (str or None): The URI of the DBpedia entity.
+            label (str or None): The label of the DBpedia entity.
+            matched_type (TemporalType or None): The temporal type of the entity.
+
+        Returns:
+            DBpediaEntity: The interned entity (or a new, unshared entity if the
+                           registry is full).
+        """
+
+        # The key uses the value of the temporal type rather than the Enum member,
+        # since hashing Enum members is considerably slower than hashing strings.
+        key = (uri, label, matched_type._value_ if matched_type is not None else None)
+        entity = self._entities.get(key)
+
+        if entity is not None:
+            self._hits += 1
+            return entity
+
+        with self._lock:
+            entity = self._entities.get(key)
+
+            if entity is not None:
+                self._hits += 1
+                return entity
+
+            self._misses += 1
+            entity = DBpediaEntity(uri, label, matched_type)
+
+            if len(self._entities) < self.max_size:
+                self._entities[key] = entity
+            else:
+                self._overflows += 1
+
+        return entity
+
+    def clear(self) -> None:
+        """Removes all the interned entities and resets the statistics."""
+
+        with self._lock:
+            self._entities = {}
+            self._hits = 0
+            self._misses = 0
+            self._overflows = 0
+
+    def sample(self, count: int) -> list[DBpediaEntity]:
+        """Returns up to ``count`` interned entities (the first registered ones)."""
+
+        return list(islice(self._entities.values(), count))
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns a snapshot of the registry statistics.
+
+        The hit counter is updated without locking, so it is approximate when
+        entities are interned from several threads.
+
+        Returns:
+            dict[str, int]: The number of interned entities (``size``), the maximum
+                            size (``max_size``), the number of lookups which returned
+                            a shared entity (``hits``), the number of lookups which
+                            created an entity (``misses``) and the number of entities
+                            which were not interned because the registry was full
+                            (``overflows``).
+        """
+
+        return {
+            "size": len(self._entities),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "overflows": self._overflows,
+        }
+
+
+dbpedia_registry = DBpediaRegistry()
+
+
+def _intern_entity(
+    uri: str | None, label: str | None, matched_type: TemporalType | None
+) -> DBpediaEntity:
+    return dbpedia_registry.intern(uri, label, matched_type)
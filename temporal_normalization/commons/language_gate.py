@@ -0,0 +1,185 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+# The number of characters of a text past which only a sample of it is checked.
+SAMPLE_LENGTH = 1000
+
+# The number of windows of the sample of a long text (its start, middle and end).
+_SAMPLE_WINDOWS = 3
+
+_MISSING = object()
+
+# The langdetect detector factory, whose language profiles are loaded on first use.
+_factory = None
+_factory_lock = threading.Lock()
+
+
+def detect_language(
+    text: str, seed: int = 0, sample_length: int = SAMPLE_LENGTH
+) -> str:
+    """
+    Detects the language of a text with langdetect, with a fixed seed so the same
+    text always gets the same language. Only a sample of the texts longer than
+    ``sample_length`` characters is checked (see ``sample_text``).
+
+    Args:
+        text (str): The text.
+        seed (int): The seed of the random sampling of langdetect. Defaults to 0.
+        sample_length (int): The maximum number of characters checked.
+                             Defaults to 1000.
+
+    Returns:
+        str: The ISO 639-1 code of the detected language (e.g., ``ro``).
+
+    Raises:
+        LangDetectException: If the text has no features to detect (e.g., only
+                             digits and punctuation).
+    """
+
+    detector = _get_factory().create()
+    detector.seed = seed
+    detector.append(sample_text(text, sample_length))
+
+    return detector.detect()
+
+
+def sample_text(text: str, sample_length: int = SAMPLE_LENGTH) -> str:
+    """
+    Returns the text, or, if it is longer than ``sample_length`` characters, three
+    evenly spaced windows of it (its start, middle and end).
+    """
+
+    if len(text) <= sample_length:
+        return text
+
+    window = sample_length // _SAMPLE_WINDOWS
+    step = (len(text) - window) // (_SAMPLE_WINDOWS - 1)
+
+    return " ".join(
+        text[start : start + window]
+        for start in range(0, step * _SAMPLE_WINDOWS, step)
+    )
+
+
+class LanguageGate:
+    """
+    Detects the language of the texts sent to the Java process, so the texts which
+    are not in the target language can be skipped.
+
+    The language of each text is detected once (see ``detect_language``) and cached
+    by the hash of the text. The texts which are too short for a reliable detection,
+    or whose language cannot be detected, are accepted.
+
+    Example:
+        >>> gate = LanguageGate("ro")
+        >>> gate.accepts("În secolul XX, tehnologia a avansat semnificativ.")
+        True
+    """
+
+    def __init__(
+        self,
+        target_lang: str = "ro",
+        sample_length: int = SAMPLE_LENGTH,
+        min_length: int = 40,
+        cache_size: int = 4096,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            target_lang (str): The ISO 639-1 code of the accepted language.
+                               Defaults to ``ro``.
+            sample_length (int): The maximum number of characters checked per text.
+                                 Defaults to 1000.
+            min_length (int): The number of characters under which a text is accepted
+                              without detection. Defaults to 40.
+            cache_size (int): The number of detected languages kept. Defaults to 4096.
+            seed (int): The seed of the random sampling of langdetect. Defaults to 0.
+        """
+
+        self.target_lang = target_lang
+        self.sample_length = sample_length
+        self.min_length = min_length
+        self.cache_size = cache_size
+        self.seed = seed
+        self.detections = 0
+        self.hits = 0
+        self._languages: OrderedDict[bytes, str | None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._languages)
+
+    def detect(self, text: str) -> str | None:
+        """
+        Returns the language of the text, or None if the text is too short or its
+        language cannot be detected.
+        """
+
+        if len(text.strip()) < self.min_length:
+            return None
+
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+        # lock-free lookup; the cache is only changed under the lock
+        language = self._languages.get(key, _MISSING)
+        if language is not _MISSING:
+            self.hits += 1
+            return language
+
+        self.detections += 1
+        try:
+            language = detect_language(text, self.seed, self.sample_length)
+        except Exception:
+            language = None
+
+        with self._lock:
+            self._languages[key] = language
+            if len(self._languages) > self.cache_size:
+                self._languages.popitem(last=False)
+
+        return language
+
+    def accepts(self, text: str) -> bool:
+        """Returns whether the text is in the target language (or undetected)."""
+
+        return self.accepts_language(self.detect(text))
+
+    def accepts_language(self, language: str | None) -> bool:
+        """Returns whether a language returned by ``detect`` is accepted."""
+
+        return language is None or language == self.target_lang
+
+    def stats(self) -> dict:
+        return {
+            "target_lang": self.target_lang,
+            "detections": self.detections,
+            "cache_hits": self.hits,
+            "cached": len(self._languages),
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._languages.clear()
+            self.detections = 0
+            self.hits = 0
+
+
+def _get_factory():
+    global _factory
+
+    if _factory is None:
+        # imported on first use, since langdetect loads its language profiles
+        from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
+
+        with _factory_lock:
+            if _factory is None:
+                factory = DetectorFactory()
+                factory.load_profile(PROFILES_DIRECTORY)
+                _factory = factory
+
+    return _factory
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,66 @@
+import importlib
+import sys
+from typing import Callable, Iterable
+
+
+def attach(
+    package: str, exports: dict[str, Iterable[str]]
+) -> tuple[Callable[[str], object], Callable[[], list[str]], list[str]]:
+    """
+    Returns the ``__getattr__``, ``__dir__`` and ``__all__`` of a package whose public
+    names are imported from their submodules on first access (PEP 562), so importing
+    one name does not import the dependencies of every submodule (e.g., spaCy or
+    numpy).
+
+    A name cannot be exported by a direct submodule with the same name (e.g.,
+    ``stage_metrics`` from ``stage_metrics``): the object would shadow the submodule,
+    so ``import package.stage_metrics`` would not return the module. Such objects are
+    exported by the parent package instead (e.g., ``commons.stage_metrics``).
+
+    Args:
+        package (str): The ``__name__`` of the package.
+        exports (dict[str, Iterable[str]]): The public names of each submodule, keyed
+                                            by the submodule path relative to the
+                                            package (e.g., ``commons.temporal_models``).
+
+    Raises:
+        ValueError: If a name is exported by a direct submodule with the same name.
+
+    Returns:
+        tuple: The ``__getattr__`` and ``__dir__`` functions and the ``__all__`` list
+               of the package.
+
+    Example:
+        >>> __getattr__, __dir__, __all__ = attach(
+        ...     __name__, {"temporal_models": ("TimeSeries",)}
+        ... )
+    """
+
+    modules = {name: module for module, names in exports.items() for name in names}
+    shadowing = sorted(name for name, module in modules.items() if module == name)
+    if shadowing:
+        raise ValueError(
+            f"{package}: {', '.join(shadowing)} would shadow the submodule of the same "
+            f"name"
+        )
+
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str):
+        module = modules.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(f"{package}.{module}"), name)
+        namespace[name] = value
+
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(modules))
+
+    return __getattr__, __dir__, sorted(modules)
+
+
+if __name__ == "__main__":
+    pass
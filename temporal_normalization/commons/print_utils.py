@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from langdetect import detect
+from temporal_normalization.commons.language_gate import detect_language
 
 
 # https://godoc.org/github.com/whitedevops/colors
@@ -48,12 +48,15 @@ class console:
     @staticmethod
     def lang_warning(query: str, target_lang: str):
         try:
-            if detect(query) != target_lang:
-                console.warning(
-                    f'Detected language: "{detect(query)}" but required: "{target_lang}"'
-                )
+            language = detect_language(query)
         except Exception as e:
             console.warning(f'⚠️ Language could not be detected: {e}')
+            return
+
+        if language != target_lang:
+            console.warning(
+                f'Detected language: "{language}" but required: "{target_lang}"'
+            )
 
     @staticmethod
     def tokens_table(document):
@@ -0,0 +1,333 @@
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Iterator
+
+# The stages timed while a doc is normalized.
+METRIC_STAGES = (
+    "java",  # the normalization of a text by the Java process (Py4J call)
+    "serialize",  # the transfer of the JSON result from the Java process
+    "json",  # json.loads of the result
+    "build",  # the construction of the time series models
+    "find_matches",  # the search of the matched values in the text
+    "retokenize",  # retokenize output mode (includes filter_spans)
+    "filter_spans",  # the update of doc.ents
+    "span_group",  # spans output mode
+    "encode",  # the encoding of the doc-level time series payload
+)
+
+# The events counted while docs are normalized.
+METRIC_COUNTERS = (
+    "docs",  # docs processed by the component
+    "java_calls",  # texts sent to the Java process
+    "expressions",  # valid temporal expressions returned by the Java process
+    "matches",  # matches written into the docs
+    "fallback_matches",  # matches not aligned with the tokens (substring fallback)
+    "errors",  # docs whose normalization failed
+    "deferred",  # docs deferred to the backfill queue
+    "language_skipped",  # docs skipped by the language gate
+)
+
+# The upper bounds (in seconds) of the buckets of the stage histograms.
+METRIC_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _StageTimer:
+    __slots__ = ("_metrics", "_stage", "_started")
+
+    def __init__(self, metrics: "StageMetrics", stage: str):
+        self._metrics = metrics
+        self._stage = stage
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._metrics.observe(self._stage, time.perf_counter() - self._started)
+        return False
+
+
+class DocTrace:
+    """
+    The stage durations (in seconds) and the counters recorded by the current thread
+    while a doc is traced (see ``StageMetrics.trace``).
+    """
+
+    __slots__ = ("stages", "counters")
+
+    def __init__(self):
+        self.stages: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+
+
+class _Histogram:
+    __slots__ = ("buckets", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets = [0] * (len(METRIC_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect_left(METRIC_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns the upper bound of the bucket holding the ``q`` quantile (the maximum
+        observed value for the last bucket).
+        """
+
+        rank = q * self.count
+        seen = 0
+
+        for i, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                if i == len(METRIC_BUCKETS):
+                    return self.max
+                return min(METRIC_BUCKETS[i], self.max)
+
+        return self.max
+
+
+class StageMetrics:
+    """
+    Process-wide, low-overhead instrumentation of the temporal normalization: a
+    histogram of the (monotonic clock) duration of each stage and a counter of each
+    event, shared by all the components and threads of the process.
+
+    The metrics are disabled by default. While they are disabled (and no doc is
+    traced), ``timer`` returns a shared no-op context manager and ``count`` returns
+    immediately, so the instrumented code paths cost a function call.
+
+    Example:
+        >>> stage_metrics.enable()
+        >>> docs = list(nlp.pipe(texts))
+        >>> stage_metrics.stats()["stages"]["java"]
+        {'count': 1000, 'total_s': 2.41, 'mean_ms': 2.41, 'p50_ms': 2.5, ...}
+        >>> print(stage_metrics.to_openmetrics())
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._traces = 0
+        self._histograms: dict[str, _Histogram] = {}
+        self._counters: dict[str, int] = {}
+        self.reset()
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Clears the histograms and the counters."""
+
+        with self._lock:
+            self._histograms = {stage: _Histogram() for stage in METRIC_STAGES}
+            self._counters = dict.fromkeys(METRIC_COUNTERS, 0)
+
+    def timer(self, stage: str) -> _StageTimer | _NullTimer:
+        """
+        Returns a context manager which records the duration of its block in the
+        histogram of the stage.
+
+        Args:
+            stage (str): The name of the stage (see ``METRIC_STAGES``).
+        """
+
+        if not self.enabled and not self._traces:
+            return _NULL_TIMER
+
+        return _StageTimer(self, stage)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Records a duration, in seconds, in the histogram of the stage."""
+
+        if self._traces:
+            trace = getattr(self._local, "trace", None)
+            if trace is not None:
+                trace.stages[stage] = trace.stages.get(stage, 0.0) + seconds
+
+        if not self.enabled:
+            return
+
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = _Histogram()
+            histogram.observe(seconds)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Increments a counter (see ``METRIC_COUNTERS``)."""
+
+        if self._traces:
+            trace = getattr(self._local, "trace", None)
+            if trace is not None:
+                trace.counters[name] = trace.counters.get(name, 0) + value
+
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    @contextmanager
+    def trace(self, trace: DocTrace | None = None) -> Iterator[DocTrace]:
+        """
+        Records the stage durations and the counters of the current thread into a
+        ``DocTrace`` for the duration of the block, whether the metrics are enabled
+        or not. The stages run in other threads (e.g., parallel shards or prefetched
+        docs) are not included, unless the trace is continued there.
+
+        Args:
+            trace (DocTrace or None): The trace to continue, e.g., the trace of a doc
+                                      whose Java call runs in a dispatch thread.
+                                      Defaults to a new trace.
+        """
+
+        if trace is None:
+            trace = DocTrace()
+        previous = getattr(self._local, "trace", None)
+        self._local.trace = trace
+
+        with self._lock:
+            self._traces += 1
+        try:
+            yield trace
+        finally:
+            with self._lock:
+                self._traces -= 1
+            self._local.trace = previous
+
+    def stats(self) -> dict:
+        """
+        Returns a snapshot of the metrics.
+
+        Returns:
+            dict: The counters (``counters``) and, for each stage (``stages``), the
+                  number of observations, their total duration (in seconds), their
+                  mean and maximum and the estimated 50th, 95th and 99th percentiles
+                  (in milliseconds, rounded up to the histogram buckets).
+        """
+
+        with self._lock:
+            stages = {
+                stage: {
+                    "count": histogram.count,
+                    "total_s": round(histogram.total, 6),
+                    **_summary(histogram),
+                }
+                for stage, histogram in self._histograms.items()
+            }
+
+            return {
+                "enabled": self.enabled,
+                "counters": dict(self._counters),
+                "stages": stages,
+            }
+
+    def to_openmetrics(self, prefix: str = "temporal_normalization") -> str:
+        """
+        Exports the metrics in the OpenMetrics (Prometheus) text format.
+
+        Args:
+            prefix (str): The prefix of the metric names.
+                          Defaults to ``temporal_normalization``.
+
+        Returns:
+            str: The exposition, terminated by ``# EOF``.
+        """
+
+        with self._lock:
+            histograms = {
+                stage: (list(histogram.buckets), histogram.count, histogram.total)
+                for stage, histogram in self._histograms.items()
+            }
+            counters = dict(self._counters)
+
+        name = f"{prefix}_stage_seconds"
+        lines = [
+            f"# TYPE {name} histogram",
+            f"# UNIT {name} seconds",
+            f"# HELP {name} Duration of the normalization stages.",
+        ]
+
+        for stage, (buckets, count, total) in histograms.items():
+            cumulative = 0
+            for bound, bucket in zip(METRIC_BUCKETS + (None,), buckets):
+                cumulative += bucket
+                le = "+Inf" if bound is None else repr(bound)
+                lines.append(
+                    f'{name}_bucket{{stage="{stage}",le="{le}"}} {cumulative}'
+                )
+            lines.append(f'{name}_count{{stage="{stage}"}} {count}')
+            lines.append(f'{name}_sum{{stage="{stage}"}} {total!r}')
+
+        for counter, value in counters.items():
+            lines.append(f"# TYPE {prefix}_{counter} counter")
+            lines.append(f"{prefix}_{counter}_total {value}")
+
+        lines.append("# EOF")
+
+        return "\n".join(lines) + "\n"
+
+
+def _summary(histogram: _Histogram) -> dict[str, float | None]:
+    if not histogram.count:
+        return dict.fromkeys(("mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"))
+
+    return {
+        "mean_ms": round(histogram.total / histogram.count * 1000, 3),
+        "p50_ms": round(histogram.quantile(0.5) * 1000, 3),
+        "p95_ms": round(histogram.quantile(0.95) * 1000, 3),
+        "p99_ms": round(histogram.quantile(0.99) * 1000, 3),
+        "max_ms": round(histogram.max * 1000, 3),
+    }
+
+
+stage_metrics = StageMetrics()
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,124 @@
+import re
+
+from temporal_normalization.commons.temporal_types import TemporalType
+
+DBPEDIA_PAGE = "https://dbpedia.org/page/"
+
+# Years are represented as integers without a year 0: 1 BC is -1, 1 AD is 1.
+Bounds = tuple[int, int, TemporalType]
+
+_URI_PATTERN = re.compile(
+    r"(?:.*/)?(\d+)(?:(?:st|nd|rd|th)_(century|millennium))?(_BC)?"
+)
+_SPANS = {"century": 100, "millennium": 1000}
+_GRANULARITIES = {
+    None: TemporalType.YEAR,
+    "century": TemporalType.CENTURY,
+    "millennium": TemporalType.MILLENNIUM,
+}
+_GRANULARITY_RANKS = {
+    TemporalType.DATE: 0,
+    TemporalType.YEAR: 1,
+    TemporalType.CENTURY: 2,
+    TemporalType.MILLENNIUM: 3,
+    TemporalType.EPOCH: 4,
+}
+_MAX_BOUNDS = 100_000
+_MISSING = object()
+
+_bounds: dict[str, Bounds | None] = {}
+
+
+def uri_bounds(uri: str | None) -> Bounds | None:
+    """
+    Returns the years covered by a DBpedia period URI (a year, a century or a
+    millennium, e.g. ``https://dbpedia.org/page/2nd_century_BC``).
+
+    The bounds are looked up in a URI table, which contains the common centuries
+    and millennia from the start and is filled in with any other URI the first
+    time it is seen, so each URI is parsed at most once.
+
+    Args:
+        uri (str or None): The URI of the DBpedia period.
+
+    Returns:
+        tuple[int, int, TemporalType] or None: The first year, the last year and the
+            granularity of the period (negative years are BC), or None if the URI
+            does not identify a year, a century or a millennium.
+
+    Example:
+        >>> uri_bounds("https://dbpedia.org/page/2nd_century_BC")
+        (-200, -101, <TemporalType.CENTURY: 'century'>)
+        >>> uri_bounds("https://dbpedia.org/page/20th_century")
+        (1901, 2000, <TemporalType.CENTURY: 'century'>)
+    """
+
+    if uri is None:
+        return None
+
+    bounds = _bounds.get(uri, _MISSING)
+
+    if bounds is _MISSING:
+        bounds = _parse_bounds(uri)
+        if len(_bounds) < _MAX_BOUNDS:
+            _bounds[uri] = bounds
+
+    return bounds
+
+
+def coarser_granularity(
+    first: TemporalType | None, second: TemporalType | None
+) -> TemporalType | None:
+    """
+    Returns the coarser of two granularities (e.g., ``CENTURY`` for ``YEAR`` and
+    ``CENTURY``), ignoring the missing ones.
+    """
+
+    if first is None:
+        return second
+    if second is None:
+        return first
+
+    rank = _GRANULARITY_RANKS.get
+    return first if rank(first, 0) >= rank(second, 0) else second
+
+
+def _parse_bounds(uri: str) -> Bounds | None:
+    match = _URI_PATTERN.fullmatch(uri)
+    if match is None:
+        return None
+
+    number, unit, before_christ = match.groups()
+    number = int(number)
+    if number == 0:
+        return None
+
+    span = _SPANS.get(unit, 1)
+    first, last = (number - 1) * span + 1, number * span
+
+    if before_christ:
+        first, last = -last, -first
+
+    return first, last, _GRANULARITIES[unit]
+
+
+def _ordinal(number: int) -> str:
+    if 11 <= number % 100 <= 13:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+
+    return f"{number}{suffix}"
+
+
+def _precompute() -> None:
+    for unit, (max_ad, max_bc) in (("century", (30, 100)), ("millennium", (10, 30))):
+        for number in range(1, max(max_ad, max_bc) + 1):
+            uri = f"{DBPEDIA_PAGE}{_ordinal(number)}_{unit}"
+            if number <= max_ad:
+                _bounds[uri] = _parse_bounds(uri)
+            if number <= max_bc:
+                _bounds[f"{uri}_BC"] = _parse_bounds(f"{uri}_BC")
+
+
+_precompute()
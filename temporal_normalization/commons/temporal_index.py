@@ -0,0 +1,379 @@
+import json
+import os
+from typing import Iterable
+
+import numpy as np
+
+from temporal_normalization.commons.temporal_models import (
+    TemporalExpression,
+    TimeSeries,
+)
+from temporal_normalization.commons.time_series_codec import (
+    decode_time_series_cached,
+)
+
+ENTRY_DTYPE = np.dtype(
+    [
+        ("start_year", np.int32),
+        ("end_year", np.int32),
+        ("doc_id", np.int64),
+        ("start_char", np.int32),
+        ("end_char", np.int32),
+    ]
+)
+
+_META_FILE = "meta.json"
+_ENTRIES_FILE = "entries.npy"
+_MAX_END_FILE = "max_end.npy"
+_FORMAT_VERSION = 1
+
+
+class TemporalIndex:
+    """
+    A corpus-level index of the normalized time series, which answers overlap,
+    containment and point queries over years in logarithmic time.
+
+    The index is a logarithmic set of static interval trees: new entries are
+    buffered and, once the buffer is full, turned into a tree which is merged with
+    the trees of the same size, so inserting is cheap on average and queries only
+    visit a logarithmic number of trees. Each tree is an implicit augmented interval
+    tree over sorted NumPy arrays, which can be saved to disk and memory-mapped.
+
+    Years are inclusive and negative for BC (see ``uri_bounds``). Entries created
+    from standalone ``TemporalExpression`` results have no character offsets, so
+    their ``start_char`` and ``end_char`` are -1.
+
+    Example:
+        >>> index = TemporalIndex()
+        >>> index.add_doc(0, doc)
+        >>> index.overlapping(1850, 1870)["doc_id"]
+    """
+
+    def __init__(self, buffer_size: int = 4096):
+        """
+        Args:
+            buffer_size (int): The number of entries buffered before they are turned
+                               into a tree. Defaults to 4096.
+        """
+
+        self.buffer_size = buffer_size
+        self._trees: list[_IntervalTree] = []
+        self._buffer: list[tuple[int, int, int, int, int]] = []
+
+    def __len__(self):
+        return sum(len(tree) for tree in self._trees) + len(self._buffer)
+
+    def add(
+        self,
+        doc_id: int,
+        start_year: int,
+        end_year: int,
+        start_char: int = -1,
+        end_char: int = -1,
+    ) -> None:
+        """
+        Adds an interval to the index.
+
+        Args:
+            doc_id (int): The identifier of the document.
+            start_year (int): The first year of the interval.
+            end_year (int): The last year of the interval.
+            start_char (int): The start offset of the span in the document.
+            end_char (int): The end offset of the span in the document.
+        """
+
+        if start_year > end_year:
+            start_year, end_year = end_year, start_year
+
+        self._buffer.append((start_year, end_year, doc_id, start_char, end_char))
+
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def add_time_series(
+        self,
+        doc_id: int,
+        time_series: Iterable[TimeSeries],
+        start_char: int = -1,
+        end_char: int = -1,
+    ) -> None:
+        """
+        Adds the intervals of the time series which have numeric bounds.
+        """
+
+        for ts in time_series:
+            if ts.start_year is not None and ts.end_year is not None:
+                self.add(doc_id, ts.start_year, ts.end_year, start_char, end_char)
+
+    def add_doc(self, doc_id: int, doc) -> None:
+        """
+        Adds the time series of all the spans of a processed spaCy document.
+
+        Args:
+            doc_id (int): The identifier of the document.
+            doc (Doc): A document processed by the ``temporal_normalization`` component.
+        """
+
+        payload = doc._.time_series_payload
+        if payload is None:
+            return
+
+        for (start_char, end_char), time_series in decode_time_series_cached(
+            payload
+        ).items():
+            self.add_time_series(doc_id, time_series, start_char, end_char)
+
+    def add_expressions(
+        self, doc_id: int, expressions: Iterable[TemporalExpression]
+    ) -> None:
+        """
+        Adds the time series of the expressions returned by
+        ``extract_temporal_expressions``.
+        """
+
+        for expression in expressions:
+            self.add_time_series(doc_id, expression.time_series)
+
+    def flush(self) -> None:
+        """Turns the buffered entries into a tree and merges the trees of similar size."""
+
+        if not self._buffer:
+            return
+
+        tree = _IntervalTree(np.array(self._buffer, dtype=ENTRY_DTYPE))
+        self._buffer = []
+
+        while self._trees and len(self._trees[-1]) <= len(tree):
+            tree = _IntervalTree.merge(self._trees.pop(), tree)
+
+        self._trees.append(tree)
+
+    def compact(self) -> None:
+        """Merges all the entries into a single tree."""
+
+        self.flush()
+
+        if len(self._trees) > 1:
+            self._trees = [_IntervalTree.merge(*self._trees)]
+
+    def overlapping(self, start_year: int, end_year: int) -> np.ndarray:
+        """
+        Returns the entries whose interval overlaps the ``[start_year, end_year]``
+        interval (e.g., which spans refer to any time between 1850 and 1870).
+
+        Returns:
+            np.ndarray: The matching entries, as a structured array of ``ENTRY_DTYPE``.
+        """
+
+        return self._query(start_year, end_year, None)
+
+    def at(self, year: int) -> np.ndarray:
+        """Returns the entries whose interval contains the given year."""
+
+        return self._query(year, year, None)
+
+    def within(self, start_year: int, end_year: int) -> np.ndarray:
+        """
+        Returns the entries whose interval is contained in the
+        ``[start_year, end_year]`` interval.
+        """
+
+        return self._query(
+            start_year,
+            end_year,
+            lambda entries: (entries["start_year"] >= start_year)
+            & (entries["end_year"] <= end_year),
+        )
+
+    def containing(self, start_year: int, end_year: int) -> np.ndarray:
+        """
+        Returns the entries whose interval contains the whole
+        ``[start_year, end_year]`` interval.
+        """
+
+        return self._query(
+            start_year,
+            end_year,
+            lambda entries: (entries["start_year"] <= start_year)
+            & (entries["end_year"] >= end_year),
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Compacts the index and saves it into the ``path`` directory as ``.npy``
+        files, which ``load`` can memory-map.
+        """
+
+        self.compact()
+        os.makedirs(path, exist_ok=True)
+
+        tree = self._trees[0] if self._trees else _IntervalTree.empty()
+        np.save(os.path.join(path, _ENTRIES_FILE), tree.entries)
+        np.save(os.path.join(path, _MAX_END_FILE), tree.max_end)
+
+        with open(os.path.join(path, _META_FILE), "w", encoding="utf-8") as meta_file:
+            json.dump(
+                {"version": _FORMAT_VERSION, "size": len(tree)},
+                meta_file,
+            )
+
+    @staticmethod
+    def load(
+        path: str, mmap: bool = True, buffer_size: int = 4096
+    ) -> "TemporalIndex":
+        """
+        Loads an index saved with ``save``.
+
+        Args:
+            path (str): The directory of the saved index.
+            mmap (bool): Whether to memory-map the arrays instead of reading them
+                         into memory. Defaults to True.
+            buffer_size (int): The buffer size of the loaded index.
+
+        Returns:
+            TemporalIndex: The loaded index. New entries can still be added; they
+                           are kept in memory until the index is saved again.
+        """
+
+        with open(os.path.join(path, _META_FILE), "r", encoding="utf-8") as meta_file:
+            meta = json.load(meta_file)
+
+        if meta.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported temporal index version: {meta.get('version')}.")
+
+        mmap_mode = "r" if mmap else None
+        entries = np.load(os.path.join(path, _ENTRIES_FILE), mmap_mode=mmap_mode)
+        max_end = np.load(os.path.join(path, _MAX_END_FILE), mmap_mode=mmap_mode)
+
+        index = TemporalIndex(buffer_size)
+        if len(entries):
+            index._trees.append(_IntervalTree(entries, max_end))
+
+        return index
+
+    def _query(self, start_year: int, end_year: int, condition) -> np.ndarray:
+        results = [tree.overlapping(start_year, end_year) for tree in self._trees]
+
+        if self._buffer:
+            buffer = np.array(self._buffer, dtype=ENTRY_DTYPE)
+            results.append(
+                buffer[
+                    (buffer["start_year"] <= end_year)
+                    & (buffer["end_year"] >= start_year)
+                ]
+            )
+
+        entries = (
+            np.concatenate(results) if results else np.empty(0, dtype=ENTRY_DTYPE)
+        )
+
+        return entries[condition(entries)] if condition is not None else entries
+
+
+class _IntervalTree:
+    """
+    An implicit augmented interval tree (as in Heng Li's cgranges): the entries are
+    sorted by their start year, the entry at index ``i`` is a node of the tree whose
+    level is the number of trailing 1 bits of ``i``, and ``max_end[i]`` holds the
+    maximum end year of the subtree rooted at ``i``.
+    """
+
+    def __init__(self, entries: np.ndarray, max_end: np.ndarray | None = None):
+        if max_end is None:
+            entries = entries[np.argsort(entries["start_year"], kind="stable")]
+            max_end = _build_max_end(entries["end_year"])
+
+        self.entries = entries
+        self.max_end = max_end
+        self.max_level = _max_level(len(entries))
+
+    def __len__(self):
+        return len(self.entries)
+
+    @staticmethod
+    def empty() -> "_IntervalTree":
+        return _IntervalTree(np.empty(0, dtype=ENTRY_DTYPE))
+
+    @staticmethod
+    def merge(*trees: "_IntervalTree") -> "_IntervalTree":
+        return _IntervalTree(np.concatenate([tree.entries for tree in trees]))
+
+    def overlapping(self, start_year: int, end_year: int) -> np.ndarray:
+        n = len(self.entries)
+        if n == 0:
+            return self.entries[:0]
+
+        starts = self.entries["start_year"]
+        ends = self.entries["end_year"]
+        max_end = self.max_end
+        found: list[int] = []
+
+        # (level, node, whether the left child has been processed)
+        stack = [(self.max_level, (1 << self.max_level) - 1, False)]
+
+        while stack:
+            level, node, left_done = stack.pop()
+
+            if level <= 3:
+                # small subtree: scan all its nodes
+                first = node >> level << level
+                last = min(first + (1 << (level + 1)) - 1, n)
+                for i in range(first, last):
+                    if starts[i] > end_year:
+                        break
+                    if ends[i] >= start_year:
+                        found.append(i)
+            elif not left_done:
+                left = node - (1 << (level - 1))
+                stack.append((level, node, True))
+                if left >= n or max_end[left] >= start_year:
+                    stack.append((level - 1, left, False))
+            elif node < n and starts[node] <= end_year:
+                if ends[node] >= start_year:
+                    found.append(node)
+                stack.append((level - 1, node + (1 << (level - 1)), False))
+
+        return self.entries[np.array(found, dtype=np.int64)]
+
+
+def _max_level(n: int) -> int:
+    level = 0
+    while (1 << (level + 1)) <= n:
+        level += 1
+    return level
+
+
+def _build_max_end(ends: np.ndarray) -> np.ndarray:
+    """
+    Computes the maximum end year of each subtree of the implicit tree, one level
+    at a time.
+    """
+
+    n = len(ends)
+    max_end = np.array(ends, dtype=ends.dtype, copy=True)
+    if n == 0:
+        return max_end
+
+    last_i = (n - 1) & ~1
+    last = int(max_end[last_i])
+    level = 1
+
+    while (1 << level) <= n:
+        x = 1 << (level - 1)
+        nodes = np.arange((x << 1) - 1, n, x << 2)
+
+        if len(nodes):
+            left = max_end[nodes - x]
+            right_nodes = nodes + x
+            right = np.full(len(nodes), last, dtype=max_end.dtype)
+            in_range = right_nodes < n
+            right[in_range] = max_end[right_nodes[in_range]]
+            max_end[nodes] = np.maximum(np.maximum(ends[nodes], left), right)
+
+        last_i = last_i - x if (last_i >> level) & 1 else last_i + x
+        if last_i < n and max_end[last_i] > last:
+            last = int(max_end[last_i])
+
+        level += 1
+
+    return max_end
@@ -1,15 +1,44 @@
 import json
+from operator import attrgetter
 
 from py4j.java_gateway import JavaObject, JavaGateway
 
+from temporal_normalization.commons.dbpedia_registry import (
+    DBpediaEntity,
+    dbpedia_registry,
+)
+from temporal_normalization.commons.stage_metrics import stage_metrics
+from temporal_normalization.commons.temporal_bounds import (
+    coarser_granularity,
+    uri_bounds,
+)
 from temporal_normalization.commons.temporal_types import TemporalType
 
+_TEMPORAL_TYPES: dict[str, TemporalType] = {
+    temporal_type.value: temporal_type for temporal_type in TemporalType
+}
+_intern = dbpedia_registry.intern
+
+
+def _readonly(slot: str) -> property:
+    """Exposes a private slot as a public, read-only attribute."""
+
+    return property(attrgetter(slot))
+
+
+def _get_slots(obj) -> tuple:
+    return tuple([getattr(obj, name) for name in obj.__slots__])
+
 
 class TemporalExpression:
     """
     A model representing a temporal expression, extracted and processed
     from a Java object.
 
+    In lazy mode, only ``matches`` is decoded up front. The ``time_series`` (and the
+    ``edges`` and ``periods`` of each ``TimeSeries``) are built on first access from
+    the raw JSON payload and then cached.
+
     Attributes:
         is_valid (bool): A flag that specifies whether the text processed
             through timespan-normalization library is a temporal expression.
@@ -18,30 +47,57 @@ class TemporalExpression:
         time_series (list[TimeSeries]): The list of normalized temporal expressions.
         matches (list[str]): A unique list of matched values found in the normalized
             entities.
+        lazy (bool): Whether the time series are built on first access.
     """
 
-    def __init__(self, java_object: JavaObject):
-        serialize = java_object.serialize()
-        json_obj = json.loads(serialize)
+    def __init__(self, java_object: JavaObject, lazy: bool = False):
+        with stage_metrics.timer("serialize"):
+            serialize = java_object.serialize()
+        with stage_metrics.timer("json"):
+            json_obj = json.loads(serialize)
 
         # fmt: off
         self.is_valid = TemporalExpression.is_valid_json(json_obj)
         self.input_value: str | None = json_obj["inputValue"] if self.is_valid else None
         self.prepared_value: str | None = json_obj["preparedValue"] if self.is_valid else None
-        self.time_series: list[TimeSeries] = [
-            TimeSeries(item, self.input_value, self.prepared_value) for item in json_obj["timeSeries"]
-        ] if self.is_valid else []
-        self.matches: list[str] = list(
-            set(
-                [
-                    matched_value
-                    for ts in self.time_series
-                    for matched_value in ts.matches
-                ]
+        self.lazy = lazy
+        self._raw_time_series: list[dict] = json_obj["timeSeries"] if self.is_valid else []
+        self._time_series: list[TimeSeries] | None = None
+
+        if lazy:
+            self.matches: list[str] = list(
+                dict.fromkeys(
+                    [
+                        period.get("matchedValue")
+                        for item in self._raw_time_series
+                        for period in item.get("periods", ())
+                    ]
+                )
+            )
+        else:
+            self.matches: list[str] = list(
+                dict.fromkeys(
+                    [
+                        matched_value
+                        for ts in self.time_series
+                        for matched_value in ts.matches
+                    ]
+                )
             )
-        )
         # fmt: on
 
+    @property
+    def time_series(self) -> "list[TimeSeries]":
+        if self._time_series is None:
+            with stage_metrics.timer("build"):
+                self._time_series = [
+                    TimeSeries(item, self.input_value, self.prepared_value, self.lazy)
+                    for item in self._raw_time_series
+                ]
+            self._raw_time_series = []
+
+        return self._time_series
+
     def __str__(self):
         if self.input_value is None:
             return "TemporalExpression(None)"
@@ -57,7 +113,7 @@ class TemporalExpression:
 
 
 def extract_temporal_expressions(
-    gateway: JavaGateway, text: str
+    gateway: JavaGateway, text: str, lazy: bool = False
 ) -> list[TemporalExpression]:
     """
     Extracts valid temporal expressions from the given text using the Java temporal
@@ -67,17 +123,24 @@ def extract_temporal_expressions(
         gateway (JavaGateway): Active Py4J gateway connected to the Java temporal
             normalization process.
         text (str): Input text from which to extract temporal expressions.
+        lazy (bool): Whether to decode only the matched values up front and build
+            the time series on first access. Defaults to False.
 
     Returns:
         list[TemporalExpression]: A list containing valid temporal expressions.
     """
 
     expressions: list[TemporalExpression] = []
-    java_object = gateway.jvm.ro.webdata.normalization.timespan.ro.TimeExpression(text)
-    temporal_expression = TemporalExpression(java_object)
+    with stage_metrics.timer("java"):
+        java_object = gateway.jvm.ro.webdata.normalization.timespan.ro.TimeExpression(
+            text
+        )
+    temporal_expression = TemporalExpression(java_object, lazy)
+    stage_metrics.count("java_calls")
 
     if temporal_expression.is_valid:
         expressions.append(temporal_expression)
+        stage_metrics.count("expressions")
 
     return expressions
 
@@ -87,29 +150,138 @@ class TimeSeries:
     A data structure representing a temporal expression that has been normalized
     into a list of periods and temporal edges.
 
+    Instances are slotted and their public attributes are read-only, so they can be
+    safely shared between spans, documents and threads. ``periods`` and ``matches``
+    are still lists, built once, and should not be modified in place. Lazy instances
+    keep the raw JSON object and build ``edges`` and ``periods`` on first access.
+
     Attributes:
         input_value (str or None): The original temporal expression before processing.
         prepared_value (str or None): The temporal expression after processing.
-        edges (list[EdgeModel]): A list of temporal intervals represented as edges.
-        periods (list[DBpediaModel]): A list of normalized DBpedia entities
+        edges (EdgeModel or None): The temporal interval represented as edges.
+        periods (list[DBpediaModel]): The normalized DBpedia entities
             extracted from the expression.
-        matches (list[str]): A unique list of matched values found in the normalized
-            entities.
+        matches (list[str]): A unique list of matched values found in the
+            normalized entities.
+        start_year (int or None): The first year covered by the edges (negative
+            for BC).
+        end_year (int or None): The last year covered by the edges (negative
+            for BC).
+        granularity (TemporalType or None): The coarser granularity of the edges
+            (``YEAR``, ``CENTURY`` or ``MILLENNIUM``).
     """
 
-    def __init__(self, data: dict, input_value: str, prepared_value: str):
-        self.input_value = input_value
-        self.prepared_value = prepared_value
-        self.edges: EdgeModel = EdgeModel(data["edges"]) if "edges" in data else None
-        self.periods: list[DBpediaModel] = (
-            [DBpediaModel(item) for item in data["periods"]]
-            if "periods" in data
-            else []
-        )
-        self.matches: list[str] = list(
-            set([item.matched_value for item in self.periods])
+    __slots__ = (
+        "_input_value",
+        "_prepared_value",
+        "_edges",
+        "_periods",
+        "_matches",
+        "_data",
+        "_start_year",
+        "_end_year",
+        "_granularity",
+    )
+
+    input_value: str | None = _readonly("_input_value")
+    prepared_value: str | None = _readonly("_prepared_value")
+    matches: list[str] = _readonly("_matches")
+    start_year: int | None = _readonly("_start_year")
+    end_year: int | None = _readonly("_end_year")
+    granularity: TemporalType | None = _readonly("_granularity")
+
+    def __init__(
+        self, data: dict, input_value: str, prepared_value: str, lazy: bool = False
+    ):
+        self._input_value = input_value
+        self._prepared_value = prepared_value
+
+        if lazy:
+            self._data = data
+            self._edges = None
+            self._periods = None
+            self._matches = list(
+                dict.fromkeys(
+                    [item.get("matchedValue") for item in data.get("periods", ())]
+                )
+            )
+        else:
+            self._data = None
+            self._build(data)
+            self._matches = list(
+                dict.fromkeys([item._matched_value for item in self._periods])
+            )
+
+        # The bounds are looked up in the precomputed URI table once, so they can
+        # be read without parsing the URIs or the labels over and over again.
+        edges = data.get("edges") or {}
+        start = uri_bounds((edges.get("start") or {}).get("uri"))
+        end = uri_bounds((edges.get("end") or {}).get("uri"))
+
+        self._start_year = start[0] if start is not None else None
+        self._end_year = end[1] if end is not None else None
+        self._granularity = coarser_granularity(
+            start[2] if start is not None else None,
+            end[2] if end is not None else None,
         )
 
+    @property
+    def is_materialized(self) -> bool:
+        """Whether the ``edges`` and ``periods`` models have been built."""
+
+        return self._data is None
+
+    @property
+    def edges(self) -> "EdgeModel | None":
+        if self._data is not None:
+            self._materialize()
+        return self._edges
+
+    @property
+    def periods(self) -> "list[DBpediaModel]":
+        if self._data is not None:
+            self._materialize()
+        return self._periods
+
+    def to_json(self) -> dict:
+        """
+        Returns the time series as a JSON object shaped like the one returned by the
+        TeN Framework, without building the models of lazy instances.
+        """
+
+        if self._data is not None:
+            return self._data
+
+        json_obj: dict = {"periods": [period.to_json() for period in self._periods]}
+        if self._edges is not None:
+            json_obj["edges"] = self._edges.to_json()
+
+        return json_obj
+
+    def _build(self, data: dict) -> None:
+        edges = data.get("edges")
+
+        self._edges = EdgeModel(edges) if edges is not None else None
+        self._periods = [DBpediaModel(item) for item in data.get("periods", ())]
+
+    def _materialize(self) -> None:
+        data = self._data
+
+        if data is not None:
+            self._build(data)
+            self._data = None
+
+    def __eq__(self, other):
+        if not isinstance(other, TimeSeries):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def _key(self) -> tuple:
+        return self.input_value, self.prepared_value, self.edges, tuple(self.periods)
+
     def __repr__(self):
         return f"TimeSeries(edges={self.edges}, periods={self.periods})"
 
@@ -124,8 +296,12 @@ class TimeSeries:
 
 class DBpediaModel:
     """
-    A model representing an entity from DBpedia, storing key attributes related
-    to the entity.
+    A model representing an occurrence of an entity from DBpedia, storing key
+    attributes related to the entity.
+
+    The entity itself (``uri``, ``label`` and ``matched_type``) is interned through
+    ``dbpedia_registry`` and shared by all the occurrences, while ``matched_value``
+    is specific to each occurrence. Instances are slotted and immutable.
 
     Attributes:
         uri (str): The unique identifier (URI) of the DBpedia entity.
@@ -133,24 +309,53 @@ class DBpediaModel:
         matched_value (str): The original matched value from the input data.
         matched_type (TemporalType or None): The temporal type of the entity,
         if applicable.
+        start_year (int or None): The first year of the period (negative for BC).
+        end_year (int or None): The last year of the period (negative for BC).
+        granularity (TemporalType or None): The granularity of the period.
+        entity (DBpediaEntity): The shared DBpedia entity.
     """
 
+    __slots__ = ("_entity", "_matched_value")
+
+    entity: DBpediaEntity = _readonly("_entity")
+    uri: str | None = _readonly("_entity._uri")
+    label: str | None = _readonly("_entity._label")
+    matched_value: str | None = _readonly("_matched_value")
+    matched_type: TemporalType | None = _readonly("_entity._matched_type")
+    start_year: int | None = _readonly("_entity._start_year")
+    end_year: int | None = _readonly("_entity._end_year")
+    granularity: TemporalType | None = _readonly("_entity._granularity")
+
     def __init__(self, data: dict):
-        self.uri: str = data["uri"] if "uri" in data else None
-        self.label: str = data["label"] if "label" in data else None
-        self.matched_value: str = (
-            data["matchedValue"] if "matchedValue" in data else None
+        get = data.get
+
+        self._entity = _intern(
+            get("uri"), get("label"), _TEMPORAL_TYPES.get(get("matchedType"))
         )
-        try:
-            self.matched_type: TemporalType = (
-                TemporalType(data["matchedType"]) if "matchedType" in data else None
-            )
-        except ValueError:
-            self.matched_type = None
+        self._matched_value = get("matchedValue")
+
+    def __eq__(self, other):
+        if not isinstance(other, DBpediaModel):
+            return NotImplemented
+        return _get_slots(self) == _get_slots(other)
+
+    def __hash__(self):
+        return hash(_get_slots(self))
 
     def __repr__(self):
         return f"DBpediaModel(label={self.label}, matched_value={self.matched_value})"
 
+    def to_json(self) -> dict:
+        matched_type = self.matched_type.value if self.matched_type else None
+        json_obj = {
+            "uri": self.uri,
+            "label": self.label,
+            "matchedValue": self.matched_value,
+            "matchedType": matched_type,
+        }
+
+        return {key: value for key, value in json_obj.items() if value is not None}
+
     def serialize(self, indent: str = ""):
         matched_type = self.matched_type.value if self.matched_type else None
 
@@ -167,20 +372,45 @@ class EdgeModel:
     A model representing time interval represented as DBpedia entities.
     This edge represents the starting and ending points of a time period.
 
+    Instances are slotted and immutable.
+
     Attributes:
         start (DBpediaModel): The starting entity of the time period.
         end (DBpediaModel): The ending entity of the time period.
     """
 
+    __slots__ = ("_start", "_end")
+
+    start: "DBpediaModel | None" = _readonly("_start")
+    end: "DBpediaModel | None" = _readonly("_end")
+
     def __init__(self, data: dict):
-        self.start: DBpediaModel = (
-            DBpediaModel(data["start"]) if "start" in data else None
-        )
-        self.end: DBpediaModel = DBpediaModel(data["end"]) if "end" in data else None
+        start = data.get("start")
+        end = data.get("end")
+
+        self._start = DBpediaModel(start) if start is not None else None
+        self._end = DBpediaModel(end) if end is not None else None
+
+    def __eq__(self, other):
+        if not isinstance(other, EdgeModel):
+            return NotImplemented
+        return _get_slots(self) == _get_slots(other)
+
+    def __hash__(self):
+        return hash(_get_slots(self))
 
     def __repr__(self):
         return f"EdgeModel(start={self.start}, end={self.end})"
 
+    def to_json(self) -> dict:
+        json_obj = {}
+        if self.start is not None:
+            json_obj["start"] = self.start.to_json()
+        if self.end is not None:
+            json_obj["end"] = self.end.to_json()
+
+        return json_obj
+
     def serialize(self, indent: str = ""):
         start = self.start.serialize("\t")
         end = self.end.serialize("\t")
@@ -0,0 +1,313 @@
+import struct
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+
+from temporal_normalization.commons.temporal_models import DBpediaModel, TimeSeries
+from temporal_normalization.commons.temporal_types import TemporalType
+
+# Binary layout (all integers are little-endian unsigned 32-bit values):
+#
+#   header        MAGIC (4 bytes) | version (1 byte)
+#   counts        no. of strings | blob size in bytes | no. of entities
+#                 | no. of ints in the body
+#   string table  length (in characters) of each string, followed by the UTF-8
+#                 blob of all the strings
+#   entity table  (uri, label, matched type) triplets of indices
+#   body          no. of spans, then for each span:
+#                     start_char | end_char | no. of time series, then for each series:
+#                         input value | prepared value | has edges
+#                         [edge start occurrence | edge end occurrence]
+#                         no. of periods | period occurrences
+#
+# An occurrence is an (entity, matched value) pair of indices. Missing values
+# (including missing edges) are encoded as ``NONE``.
+MAGIC = b"TNTS"
+FORMAT_VERSION = 1
+NONE = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<4sB4I")
+_TEMPORAL_TYPES: list[TemporalType] = list(TemporalType)
+_TYPE_CODES: dict[str, int] = {
+    temporal_type.value: code for code, temporal_type in enumerate(_TEMPORAL_TYPES)
+}
+
+# The most recently decoded payloads (see ``decode_time_series_cached``).
+_DECODED_CACHE_SIZE = 256
+_decoded: OrderedDict[bytes, dict[tuple[int, int], list[TimeSeries]]] = OrderedDict()
+_decoded_lock = threading.Lock()
+
+
+def encode_time_series(entries: dict[tuple[int, int], list[TimeSeries]]) -> bytes:
+    """
+    Encodes the time series attached to the spans of a document into a compact,
+    versioned binary payload.
+
+    URIs, labels and matched values are stored once in an interned string table,
+    while each distinct DBpedia entity is stored once in an entity table. The rest
+    of the payload only references these tables by integer indices.
+
+    Lazy time series are encoded from their raw JSON object, without building
+    their models.
+
+    Args:
+        entries (dict[tuple[int, int], list[TimeSeries]]): The time series attached
+            to each span, keyed by the ``(start_char, end_char)`` offsets of the span.
+
+    Returns:
+        bytes: The encoded payload.
+    """
+
+    strings: dict[str, int] = {}
+    entities: dict[tuple[int, int, int], int] = {}
+    entity_table = array("I")
+    body = array("I", [len(entries)])
+
+    def intern_string(value: str | None) -> int:
+        if value is None:
+            return NONE
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    def add_entity(
+        uri: str | None, label: str | None, matched_type: str | None
+    ) -> int:
+        key = (
+            intern_string(uri),
+            intern_string(label),
+            _TYPE_CODES.get(matched_type, NONE),
+        )
+        index = entities.get(key)
+        if index is None:
+            index = entities[key] = len(entities)
+            entity_table.extend(key)
+        return index
+
+    def add_model(model: DBpediaModel | None) -> None:
+        if model is None:
+            body.extend((NONE, NONE))
+            return
+
+        matched_type = model.matched_type
+        index = add_entity(
+            model.uri,
+            model.label,
+            matched_type._value_ if matched_type is not None else None,
+        )
+        body.extend((index, intern_string(model.matched_value)))
+
+    def add_json(item: dict | None) -> None:
+        if item is None:
+            body.extend((NONE, NONE))
+            return
+
+        get = item.get
+        index = add_entity(get("uri"), get("label"), get("matchedType"))
+        body.extend((index, intern_string(get("matchedValue"))))
+
+    for (start_char, end_char), time_series in entries.items():
+        body.extend((start_char, end_char, len(time_series)))
+
+        for ts in time_series:
+            body.append(intern_string(ts.input_value))
+            body.append(intern_string(ts.prepared_value))
+
+            if ts.is_materialized:
+                edges, periods = ts.edges, ts.periods
+                add_occurrence = add_model
+                edge_start = edges.start if edges is not None else None
+                edge_end = edges.end if edges is not None else None
+            else:
+                json_obj = ts.to_json()
+                edges, periods = json_obj.get("edges"), json_obj.get("periods", ())
+                add_occurrence = add_json
+                edge_start = edges.get("start") if edges is not None else None
+                edge_end = edges.get("end") if edges is not None else None
+
+            if edges is not None:
+                body.append(1)
+                add_occurrence(edge_start)
+                add_occurrence(edge_end)
+            else:
+                body.append(0)
+
+            body.append(len(periods))
+            for period in periods:
+                add_occurrence(period)
+
+    blob = "".join(strings).encode("utf-8")
+    lengths = array("I", [len(value) for value in strings])
+
+    if sys.byteorder == "big":
+        for ints in (lengths, entity_table, body):
+            ints.byteswap()
+
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(strings), len(blob), len(entities), len(body)
+    )
+
+    return b"".join(
+        [
+            header,
+            lengths.tobytes(),
+            blob,
+            entity_table.tobytes(),
+            body.tobytes(),
+        ]
+    )
+
+
+def decode_time_series(payload: bytes) -> dict[tuple[int, int], list[TimeSeries]]:
+    """
+    Decodes a payload created by ``encode_time_series`` and rebuilds the
+    ``TimeSeries`` objects attached to each span. The time series are lazy, so their
+    ``edges`` and ``periods`` are only built when they are accessed.
+
+    Args:
+        payload (bytes): The encoded payload.
+
+    Returns:
+        dict[tuple[int, int], list[TimeSeries]]: The time series attached to each
+            span, keyed by the ``(start_char, end_char)`` offsets of the span.
+
+    Raises:
+        ValueError: If the payload is not a time series payload or if it has been
+            encoded using an unsupported format version.
+    """
+
+    if len(payload) < _HEADER.size:
+        raise ValueError("Invalid time series payload: truncated header.")
+
+    magic, version, n_strings, blob_size, n_entities, n_ints = _HEADER.unpack_from(
+        payload
+    )
+
+    if magic != MAGIC:
+        raise ValueError("Invalid time series payload: unknown format.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported time series payload version: {version}.")
+
+    offset = _HEADER.size
+    lengths = _read_ints(payload, offset, n_strings)
+    offset += 4 * n_strings
+
+    blob = payload[offset : offset + blob_size].decode("utf-8")
+    offset += blob_size
+
+    strings: list[str] = []
+    position = 0
+    for length in lengths:
+        strings.append(blob[position : position + length])
+        position += length
+
+    entity_table = _read_ints(payload, offset, 3 * n_entities)
+    offset += 12 * n_entities
+    body = _read_ints(payload, offset, n_ints)
+
+    def string_at(index: int) -> str | None:
+        return None if index == NONE else strings[index]
+
+    entities: list[dict] = []
+    for i in range(0, len(entity_table), 3):
+        uri, label, matched_type = entity_table[i : i + 3]
+        entity = {}
+        if uri != NONE:
+            entity["uri"] = strings[uri]
+        if label != NONE:
+            entity["label"] = strings[label]
+        if matched_type != NONE:
+            entity["matchedType"] = _TEMPORAL_TYPES[matched_type].value
+        entities.append(entity)
+
+    next_int = iter(body).__next__
+
+    def next_occurrence() -> dict | None:
+        index, matched_value = next_int(), next_int()
+        if index == NONE:
+            return None
+
+        entity = dict(entities[index])
+        if matched_value != NONE:
+            entity["matchedValue"] = strings[matched_value]
+        return entity
+
+    entries: dict[tuple[int, int], list[TimeSeries]] = {}
+
+    for _ in range(next_int()):
+        start_char, end_char, n_series = next_int(), next_int(), next_int()
+        time_series: list[TimeSeries] = []
+
+        for _ in range(n_series):
+            input_value = string_at(next_int())
+            prepared_value = string_at(next_int())
+            data = {}
+
+            if next_int():
+                edges = {"start": next_occurrence(), "end": next_occurrence()}
+                data["edges"] = {
+                    key: value for key, value in edges.items() if value is not None
+                }
+
+            data["periods"] = [next_occurrence() for _ in range(next_int())]
+            time_series.append(
+                TimeSeries(data, input_value, prepared_value, lazy=True)
+            )
+
+        entries[(start_char, end_char)] = time_series
+
+    return entries
+
+
+def decode_time_series_cached(
+    payload: bytes,
+) -> dict[tuple[int, int], list[TimeSeries]]:
+    """
+    Same as ``decode_time_series``, but reuses the result of the last 256 decoded
+    payloads, so the spans of the same document do not decode the payload over and
+    over again.
+
+    The returned dictionary is shared between calls and must not be modified.
+    """
+
+    # lookups are not locked (nor reordered), so the hits stay as cheap as possible
+    entries = _decoded.get(payload)
+    if entries is not None:
+        return entries
+
+    entries = decode_time_series(payload)
+
+    with _decoded_lock:
+        _decoded[payload] = entries
+        if len(_decoded) > _DECODED_CACHE_SIZE:
+            _decoded.popitem(last=False)
+
+    return entries
+
+
+def decoded_cache_items() -> list[tuple[bytes, dict]]:
+    """Returns the payloads held by ``decode_time_series_cached`` and their entries."""
+
+    with _decoded_lock:
+        return list(_decoded.items())
+
+
+def clear_decoded_cache() -> None:
+    with _decoded_lock:
+        _decoded.clear()
+
+
+def _read_ints(payload: bytes, offset: int, count: int) -> array:
+    ints = array("I")
+    ints.frombytes(payload[offset : offset + 4 * count])
+
+    if sys.byteorder == "big":
+        ints.byteswap()
+
+    return ints
+
+
+if __name__ == "__main__":
+    pass
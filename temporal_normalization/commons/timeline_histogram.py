@@ -0,0 +1,289 @@
+from typing import Iterable
+
+import numpy as np
+
+from temporal_normalization.commons.temporal_models import (
+    TemporalExpression,
+    TimeSeries,
+)
+from temporal_normalization.commons.temporal_types import TemporalType
+from temporal_normalization.commons.time_series_codec import (
+    decode_time_series_cached,
+)
+
+# (width, origin) of the bins of each granularity, on the astronomical year axis
+# (1 BC is 0, 2 BC is -1), so the bins line up with the DBpedia centuries and
+# millennia (e.g., the 1st century covers the years 1-100).
+GRANULARITIES: dict[str, tuple[int, int]] = {
+    "year": (1, 0),
+    "decade": (10, 0),
+    "century": (100, 1),
+    "millennium": (1000, 1),
+}
+WEIGHTINGS = ("overlap", "count")
+
+_CHUNK_SIZE = 65536
+
+
+class TimelineHistogram:
+    """
+    An interval-weighted histogram of the normalized time series over a timeline of
+    years, centuries, decades or millennia.
+
+    The bounds of the time series are gathered into arrays and added in chunks, so
+    the histogram is computed in vectorized NumPy code instead of visiting each bin
+    of each interval. Histograms with the same granularity and weighting can be
+    merged, so partial histograms computed by parallel workers (e.g., one for each
+    shard of the corpus) can be aggregated without scanning the documents again.
+
+    Weightings:
+        - ``overlap``: each interval has a total weight of 1, spread over the bins
+          in proportion to the number of years of the interval falling into each
+          bin (e.g., "1891-1910" adds 0.5 to the 19th and 0.5 to the 20th century).
+        - ``count``: each interval adds 1 to every bin it overlaps.
+
+    Example:
+        >>> histogram = TimelineHistogram("century")
+        >>> histogram.add_docs(nlp.pipe(texts))
+        >>> histogram.to_dict()
+        {(1801, 1900): 12.5, (1901, 2000): 3.5}
+    """
+
+    def __init__(
+        self, granularity: str | TemporalType = "century", weighting: str = "overlap"
+    ):
+        """
+        Args:
+            granularity (str or TemporalType): The size of the bins: ``year``,
+                ``decade``, ``century`` or ``millennium``. Defaults to ``century``.
+            weighting (str): How the intervals are weighted: ``overlap`` or
+                ``count``. Defaults to ``overlap``.
+        """
+
+        if isinstance(granularity, TemporalType):
+            granularity = granularity.value
+        if granularity not in GRANULARITIES:
+            raise ValueError(
+                f"Unsupported granularity: {granularity}. "
+                f"Please use one of {tuple(GRANULARITIES)}."
+            )
+        if weighting not in WEIGHTINGS:
+            raise ValueError(
+                f"Unsupported weighting: {weighting}. Please use one of {WEIGHTINGS}."
+            )
+
+        self.granularity = granularity
+        self.weighting = weighting
+        self.intervals = 0
+        self._width, self._origin = GRANULARITIES[granularity]
+        self._offset = 0
+        self._counts = np.zeros(0, dtype=np.float64)
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+    def __len__(self):
+        self._flush()
+        return len(self._counts)
+
+    def __add__(self, other: "TimelineHistogram") -> "TimelineHistogram":
+        result = TimelineHistogram(self.granularity, self.weighting)
+        return result.merge(self).merge(other)
+
+    def __iadd__(self, other: "TimelineHistogram") -> "TimelineHistogram":
+        return self.merge(other)
+
+    def __getstate__(self):
+        self._flush()
+        return self.__dict__
+
+    @property
+    def counts(self) -> np.ndarray:
+        """The weight of each bin, from the earliest to the latest bin."""
+
+        self._flush()
+        return self._counts
+
+    @property
+    def bins(self) -> tuple[np.ndarray, np.ndarray]:
+        """The first and the last year of each bin (negative years are BC)."""
+
+        self._flush()
+        first = self._origin + self._width * (
+            self._offset + np.arange(len(self._counts), dtype=np.int64)
+        )
+
+        return _historical(first), _historical(first + self._width - 1)
+
+    @property
+    def total(self) -> float:
+        """The sum of the weights of all the bins."""
+
+        return float(self.counts.sum())
+
+    def add_intervals(self, start_years, end_years) -> None:
+        """
+        Adds a batch of intervals.
+
+        Args:
+            start_years (array-like of int): The first year of each interval
+                (negative for BC).
+            end_years (array-like of int): The last year of each interval
+                (negative for BC).
+        """
+
+        starts = _astronomical(np.asarray(start_years, dtype=np.int64))
+        ends = _astronomical(np.asarray(end_years, dtype=np.int64))
+        if len(starts) != len(ends):
+            raise ValueError("The start and end years must have the same length.")
+        if len(starts) == 0:
+            return
+
+        # intervals are half-open on the astronomical axis: [start, end + 1)
+        starts, ends = np.minimum(starts, ends), np.maximum(starts, ends) + 1
+
+        width, origin = self._width, self._origin
+        first_bin = (starts - origin) // width
+        last_bin = (ends - 1 - origin) // width
+
+        offset = int(first_bin.min())
+        size = int(last_bin.max()) - offset + 1
+        first_bin -= offset
+        last_bin -= offset
+
+        if self.weighting == "overlap":
+            years = (ends - starts).astype(np.float64)
+            density = width / years
+            # the first and the last bins are only partially covered
+            first_edge = origin + (first_bin + offset) * width
+            last_edge = origin + (last_bin + offset + 1) * width
+            head = (starts - first_edge) / years
+            tail = (last_edge - ends) / years
+        else:
+            density = np.ones(len(starts), dtype=np.float64)
+            head = tail = None
+
+        # each interval adds its density to all the bins in [first_bin, last_bin]
+        deltas = np.bincount(first_bin, density, size + 1)
+        deltas -= np.bincount(last_bin + 1, density, size + 1)
+        counts = np.cumsum(deltas[:size])
+
+        if head is not None:
+            counts -= np.bincount(first_bin, head, size)
+            counts -= np.bincount(last_bin, tail, size)
+
+        self._add_counts(offset, counts)
+        self.intervals += len(starts)
+
+    def add_time_series(self, time_series: Iterable[TimeSeries]) -> None:
+        """Adds the intervals of the time series which have numeric bounds."""
+
+        for ts in time_series:
+            start_year, end_year = ts.start_year, ts.end_year
+            if start_year is not None and end_year is not None:
+                self._starts.append(start_year)
+                self._ends.append(end_year)
+
+        if len(self._starts) >= _CHUNK_SIZE:
+            self._flush()
+
+    def add_doc(self, doc) -> None:
+        """
+        Adds the time series of all the spans of a processed spaCy document.
+
+        Args:
+            doc (Doc): A document processed by the ``temporal_normalization`` component.
+        """
+
+        payload = doc._.time_series_payload
+        if payload is None:
+            return
+
+        for time_series in decode_time_series_cached(payload).values():
+            self.add_time_series(time_series)
+
+    def add_docs(self, docs: Iterable) -> None:
+        """Adds a stream of processed spaCy documents."""
+
+        for doc in docs:
+            self.add_doc(doc)
+
+    def add_expressions(self, expressions: Iterable[TemporalExpression]) -> None:
+        """Adds the expressions returned by ``extract_temporal_expressions``."""
+
+        for expression in expressions:
+            self.add_time_series(expression.time_series)
+
+    def merge(self, other: "TimelineHistogram") -> "TimelineHistogram":
+        """
+        Adds the bins of another histogram (e.g., the partial histogram of a worker)
+        to this histogram.
+
+        Returns:
+            TimelineHistogram: This histogram.
+
+        Raises:
+            ValueError: If the histograms have different granularities or weightings.
+        """
+
+        if (other.granularity, other.weighting) != (self.granularity, self.weighting):
+            raise ValueError(
+                "Cannot merge histograms with different granularities or weightings."
+            )
+
+        self._add_counts(other._offset, other.counts)
+        self.intervals += other.intervals
+
+        return self
+
+    def to_dict(self) -> dict[tuple[int, int], float]:
+        """
+        Returns the non-empty bins, keyed by their ``(first_year, last_year)``
+        bounds (negative years are BC).
+        """
+
+        first, last = self.bins
+        counts = self._counts
+        non_empty = np.flatnonzero(counts)
+
+        return {(int(first[i]), int(last[i])): float(counts[i]) for i in non_empty}
+
+    def _flush(self) -> None:
+        if self._starts:
+            starts, ends = self._starts, self._ends
+            self._starts, self._ends = [], []
+            self.add_intervals(starts, ends)
+
+    def _add_counts(self, offset: int, counts: np.ndarray) -> None:
+        if len(counts) == 0:
+            return
+        if len(self._counts) == 0:
+            self._offset, self._counts = offset, np.array(counts, dtype=np.float64)
+            return
+
+        start = min(self._offset, offset)
+        end = max(self._offset + len(self._counts), offset + len(counts))
+
+        if start != self._offset or end != self._offset + len(self._counts):
+            merged = np.zeros(end - start, dtype=np.float64)
+            merged[self._offset - start : self._offset - start + len(self._counts)] = (
+                self._counts
+            )
+            self._offset, self._counts = start, merged
+
+        self._counts[offset - start : offset - start + len(counts)] += counts
+
+
+def _astronomical(years: np.ndarray) -> np.ndarray:
+    """Converts historical years (no year 0, 1 BC is -1) to astronomical years."""
+
+    return np.where(years < 0, years + 1, years)
+
+
+def _historical(years: np.ndarray) -> np.ndarray:
+    """Converts astronomical years (1 BC is 0) to historical years."""
+
+    return np.where(years <= 0, years - 1, years)
+
+
+if __name__ == "__main__":
+    pass
@@ -1,11 +1,114 @@
 from spacy import Language
 
 from temporal_normalization import TemporalNormalization
+from temporal_normalization.gate import TemporalLanguageGate
+from temporal_normalization.prefetch import TemporalNormalizationPrefetch
 
 try:
-    @Language.factory("temporal_normalization")
-    def create_component(nlp, name):
-        return TemporalNormalization(nlp, name)
+    @Language.factory(
+        "temporal_normalization",
+        default_config={
+            "lazy": False,
+            "ner_guided": False,
+            "candidate_labels": ["DATETIME", "PERIOD"],
+            "context_window": 32,
+            "output_mode": "retokenize",
+            "spans_key": "temporal",
+            "max_shard_length": 0,
+            "shard_overlap": 64,
+            "shard_workers": 4,
+            "adaptive_batching": False,
+            "min_batch_size": 1,
+            "max_batch_size": 256,
+            "max_in_flight": 8,
+            "target_latency": 0.05,
+            "overload_queue_depth": 0,
+            "overload_latency": 0.0,
+            "backfill_path": "temporal_normalization_backfill.db",
+            "collect_metrics": False,
+            "slow_doc_threshold": 0.0,
+            "slow_doc_capacity": 100,
+            "java_port": None,
+            "java_log_level": None,
+            "java_log_rate": None,
+        },
+    )
+    def create_component(
+        nlp,
+        name,
+        lazy: bool,
+        ner_guided: bool,
+        candidate_labels: list[str],
+        context_window: int,
+        output_mode: str,
+        spans_key: str,
+        max_shard_length: int,
+        shard_overlap: int,
+        shard_workers: int,
+        adaptive_batching: bool,
+        min_batch_size: int,
+        max_batch_size: int,
+        max_in_flight: int,
+        target_latency: float,
+        overload_queue_depth: int,
+        overload_latency: float,
+        backfill_path: str,
+        collect_metrics: bool,
+        slow_doc_threshold: float,
+        slow_doc_capacity: int,
+        java_port: int | None,
+        java_log_level: str | None,
+        java_log_rate: float | None,
+    ):
+        return TemporalNormalization(
+            nlp,
+            name,
+            lazy=lazy,
+            ner_guided=ner_guided,
+            candidate_labels=tuple(candidate_labels),
+            context_window=context_window,
+            output_mode=output_mode,
+            spans_key=spans_key,
+            max_shard_length=max_shard_length,
+            shard_overlap=shard_overlap,
+            shard_workers=shard_workers,
+            adaptive_batching=adaptive_batching,
+            min_batch_size=min_batch_size,
+            max_batch_size=max_batch_size,
+            max_in_flight=max_in_flight,
+            target_latency=target_latency,
+            overload_queue_depth=overload_queue_depth,
+            overload_latency=overload_latency,
+            backfill_path=backfill_path,
+            collect_metrics=collect_metrics,
+            slow_doc_threshold=slow_doc_threshold,
+            slow_doc_capacity=slow_doc_capacity,
+            java_port=java_port,
+            java_log_level=java_log_level,
+            java_log_rate=java_log_rate,
+        )
+
+    @Language.factory(
+        "temporal_normalization_prefetch",
+        default_config={"target": "temporal_normalization", "workers": 4},
+    )
+    def create_prefetch_component(nlp, name, target: str, workers: int):
+        return TemporalNormalizationPrefetch(nlp, name, target=target, workers=workers)
+
+    @Language.factory(
+        "temporal_language_gate",
+        default_config={"sample_length": 1000, "min_length": 40, "cache_size": 4096},
+    )
+    def create_language_gate(
+        nlp, name, sample_length: int, min_length: int, cache_size: int
+    ):
+        return TemporalLanguageGate(
+            nlp,
+            name,
+            sample_length=sample_length,
+            min_length=min_length,
+            cache_size=cache_size,
+        )
 except AttributeError:
     # spaCy 2.x
     pass
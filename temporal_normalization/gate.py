@@ -0,0 +1,99 @@
+from typing import Iterable, Iterator
+
+from spacy import Language
+from spacy.tokens import Doc
+from spacy.util import minibatch
+
+from temporal_normalization.commons.language_gate import LanguageGate, SAMPLE_LENGTH
+
+
+class TemporalLanguageGate:
+    """
+    spaCy pipeline component which detects the language of each doc and stores it in
+    ``doc._.detected_language``, so the ``temporal_normalization`` component does not
+    send the docs in another language than the pipeline (``nlp.lang``) to the Java
+    process.
+
+    The language of each text is detected once (see ``LanguageGate``), from a sample of
+    the long texts, and cached by the hash of the text. The texts which are too short
+    for a reliable detection, or whose language cannot be detected, are left without
+    a language and are normalized.
+
+    Example:
+        >>> nlp = spacy.load("ro_core_news_sm")
+        >>> nlp.add_pipe("temporal_language_gate", first=True)
+        >>> nlp.add_pipe("temporal_normalization", last=True)
+    """
+
+    def __init__(
+        self,
+        nlp: Language,
+        name: str,
+        sample_length: int = SAMPLE_LENGTH,
+        min_length: int = 40,
+        cache_size: int = 4096,
+    ):
+        """
+        Args:
+            nlp (Language): A spaCy language object.
+            name (str): The name of the component.
+            sample_length (int): The maximum number of characters of a doc checked by
+                                 the language detection. Defaults to 1000.
+            min_length (int): The number of characters under which the language of a
+                              doc is not detected. Defaults to 40.
+            cache_size (int): The number of detected languages kept. Defaults to 4096.
+        """
+
+        if not Doc.has_extension("detected_language"):
+            Doc.set_extension("detected_language", default=None)
+
+        self.nlp = nlp
+        self.name = name
+        self.gate = LanguageGate(nlp.lang, sample_length, min_length, cache_size)
+
+    def __call__(self, doc: Doc) -> Doc:
+        """
+        Detects the language of the doc.
+
+        Args:
+            doc (Doc): The input spaCy Doc object.
+
+        Returns:
+            Doc: The Doc object, with ``doc._.detected_language`` set.
+        """
+
+        doc._.detected_language = self.gate.detect(doc.text)
+        return doc
+
+    def pipe(self, stream: Iterable[Doc], batch_size: int = 128) -> Iterator[Doc]:
+        """
+        Detects the language of a stream of docs, batch by batch. The language of the
+        texts repeated in a batch is detected once.
+
+        Args:
+            stream (Iterable[Doc]): The input spaCy Doc objects.
+            batch_size (int): The number of docs of a batch. Defaults to 128.
+
+        Yields:
+            Doc: The Doc objects, with ``doc._.detected_language`` set.
+        """
+
+        for docs in minibatch(stream, batch_size):
+            languages: dict[str, str | None] = {}
+
+            for doc in docs:
+                text = doc.text
+                if text not in languages:
+                    languages[text] = self.gate.detect(text)
+                doc._.detected_language = languages[text]
+
+            yield from docs
+
+    def stats(self) -> dict:
+        """Returns the number of detections and cache hits (see ``LanguageGate``)."""
+
+        return self.gate.stats()
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,172 @@
+import hashlib
+from collections import OrderedDict
+from typing import Hashable
+
+from py4j.protocol import Py4JNetworkError
+from spacy.tokens import Doc
+
+from temporal_normalization.commons.stage_metrics import stage_metrics
+from temporal_normalization.index import (
+    _sentence_boundaries,
+    Match,
+    TemporalNormalization,
+)
+
+# The matches of a sentence, with offsets relative to the start of the sentence.
+SentenceMatches = list[Match]
+
+
+class IncrementalNormalization:
+    """
+    Re-normalizes edited documents incrementally.
+
+    The text of each document is split into sentences (using the spaCy sentence
+    boundaries, or the line breaks if the doc has no sentence boundaries), and the
+    matches of each sentence are stored together with a hash of its content. When an
+    edited version of the document is processed, only the sentences whose hash is not
+    known are sent to the Java process; the stored ``TimeSeries`` of the other
+    sentences are reused, with their offsets shifted to the new position of the
+    sentence. The cost of re-processing a document is therefore proportional to the
+    size of the edit.
+
+    Sentences are always normalized on their own, so the results may differ from the
+    results of the component for expressions spanning more than one sentence.
+
+    ``last_update`` reports the number of sentences of the last processed document,
+    the number of sentences whose matches were reused from its previous version
+    (without calling the Java process) and the number of distinct sentences which
+    were normalized (a new sentence repeated in the document is normalized once, and
+    is counted as neither).
+
+    Example:
+        >>> nlp = spacy.load("ro_core_news_sm")
+        >>> component = nlp.add_pipe("temporal_normalization", last=True)
+        >>> incremental = IncrementalNormalization(component)
+        >>> with nlp.select_pipes(disable=["temporal_normalization"]):
+        ...     doc = incremental(nlp(text), doc_id="article-1")
+        ...     doc = incremental(nlp(edited_text), doc_id="article-1")
+        >>> incremental.last_update
+        {'sentences': 120, 'reused': 118, 'normalized': 2}
+    """
+
+    def __init__(self, component: TemporalNormalization, max_docs: int = 1024):
+        """
+        Args:
+            component (TemporalNormalization): The component whose Java process,
+                                               settings and output mode are used.
+            max_docs (int): The maximum number of documents whose sentences are kept.
+                            The least recently processed documents are forgotten first.
+                            Defaults to 1024.
+        """
+
+        self.component = component
+        self.max_docs = max_docs
+        self.last_update: dict[str, int] = {"sentences": 0, "reused": 0, "normalized": 0}
+        self._docs: OrderedDict[Hashable, dict[bytes, SentenceMatches]] = (
+            OrderedDict()
+        )
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __call__(self, doc: Doc, doc_id: Hashable) -> Doc:
+        """
+        Normalizes the changed sentences of a document and annotates the doc with the
+        matches of all its sentences.
+
+        Args:
+            doc (Doc): The current version of the document, processed by the upstream
+                       components (but not by ``temporal_normalization``).
+            doc_id (Hashable): The identifier of the document.
+
+        Returns:
+            Doc: The annotated doc.
+        """
+
+        text = doc.text
+        starts = [0] + _sentence_boundaries(doc)
+        sentences = [
+            (start, end, _content_hash(text[start:end]))
+            for start, end in zip(starts, starts[1:] + [len(text)])
+            if start < end
+        ]
+
+        previous = self._docs.get(doc_id, {})
+        current: dict[bytes, SentenceMatches] = {}
+        changed: dict[bytes, tuple[int, int]] = {}
+        reused = 0
+
+        for start, end, key in sentences:
+            if key in previous:
+                current[key] = previous[key]
+                reused += 1
+            elif key not in changed:
+                changed[key] = (start, end)
+
+        try:
+            current.update(self._normalize(text, changed))
+        except Py4JNetworkError as e:
+            stage_metrics.count("errors")
+            print(f"⚠️ Py4J network error: {e}")
+            return doc
+        except Exception as e:
+            stage_metrics.count("errors")
+            print(f"⚠️ Unexpected error during extract_temporal_expressions: {e}")
+            return doc
+
+        matches: list[Match] = [
+            (start + match_start, start + match_end, time_series)
+            for start, _, key in sentences
+            for match_start, match_end, time_series in current[key]
+        ]
+        self.component._annotate(doc, matches)
+
+        self._docs.pop(doc_id, None)
+        self._docs[doc_id] = current
+        while len(self._docs) > self.max_docs:
+            self._docs.popitem(last=False)
+
+        self.last_update = {
+            "sentences": len(sentences),
+            "reused": reused,
+            "normalized": len(changed),
+        }
+
+        return doc
+
+    def forget(self, doc_id: Hashable) -> None:
+        """Drops the stored sentences of a document."""
+
+        self._docs.pop(doc_id, None)
+
+    def clear(self) -> None:
+        """Drops the stored sentences of all the documents."""
+
+        self._docs.clear()
+
+    def _normalize(
+        self, text: str, sentences: dict[bytes, tuple[int, int]]
+    ) -> dict[bytes, SentenceMatches]:
+        """
+        Normalizes the given sentences (in parallel, through the shards of the
+        component) and returns their matches, relative to the start of each sentence.
+        """
+
+        shards = [(start, end, start, end) for start, end in sentences.values()]
+        results = self.component._extract_shards(text, shards)
+
+        return {
+            key: [
+                (match_start - start, match_end - start, time_series)
+                for match_start, match_end, time_series in matches
+            ]
+            for (key, (start, _)), matches in zip(sentences.items(), results)
+        }
+
+
+def _content_hash(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+if __name__ == "__main__":
+    pass
@@ -1,8 +1,18 @@
 import gc
+import logging
 import re
+import signal
 import subprocess
 import time
+from bisect import bisect_right
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator
+from weakref import WeakKeyDictionary
 
 from py4j.java_gateway import JavaGateway
 from py4j.protocol import Py4JNetworkError
@@ -11,12 +21,49 @@ from spacy.tokens import Doc, Span
 from spacy.tokens._retokenize import Retokenizer
 from spacy.util import filter_spans
 
-from temporal_normalization import TimeSeries
+from temporal_normalization import console, TimeSeries
+from temporal_normalization.commons.stage_metrics import stage_metrics
 from temporal_normalization.commons.temporal_models import (
     extract_temporal_expressions,
     TemporalExpression,
 )
+from temporal_normalization.commons.time_series_codec import (
+    decode_time_series_cached,
+    encode_time_series,
+)
+from temporal_normalization.process.adaptive_batching import AdaptiveBatchController
+from temporal_normalization.process.diagnostics import DocProfiler, SlowDocLog
+from temporal_normalization.process.java_output import java_output, JavaOutput
 from temporal_normalization.process.java_process import start_conn, close_conn
+from temporal_normalization.process.load_shedding import BackfillQueue, OverloadPolicy
+from temporal_normalization.process.memory_stats import (
+    cache_memory_stats,
+    jvm_memory_stats,
+    process_memory_stats,
+    py4j_proxy_count,
+)
+
+# A match found in the text, i.e., its character offsets and the time series of the
+# expressions extracted from the text in which it was found.
+Match = tuple[int, int, list[TimeSeries]]
+
+# A part of the text sent to the Java process: the character offsets of the text
+# and of the region it owns (the text without the overlap with its neighbours).
+Shard = tuple[int, int, int, int]
+
+# What has to be done to get the matches of a doc: its text and shards, or the
+# future of its prefetched matches.
+Plan = tuple[str, list[Shard]] | Future
+
+CANDIDATE_LABELS = ("DATETIME", "PERIOD")
+OUTPUT_MODES = ("retokenize", "spans")
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+# The time series attached to the spans of the docs of the ``time_series_batch``
+# blocks, encoded into the doc payloads when the blocks end.
+_pending: WeakKeyDictionary[Doc, dict[tuple[int, int], list[TimeSeries]]] = (
+    WeakKeyDictionary()
+)
 
 
 class TemporalNormalization:
@@ -26,25 +73,222 @@ class TemporalNormalization:
     This component calls the ``start_conn`` method to extract temporal expressions, then
     aligns the matches with spaCy tokens using retokenization and sets a custom attribute
     containing associated time series metadata.
-    """
 
-    __FIELD = "time_series"
+    The time series metadata is stored at the doc level as a compact binary payload
+    (``doc._.time_series_payload``), so docs can be serialized with ``DocBin`` or
+    ``Doc.to_bytes``. The ``span._.time_series`` getter rebuilds the ``TimeSeries``
+    objects on demand.
+
+    In NER-guided mode, only the candidate entities tagged by the upstream NER
+    component (e.g., the ``DATETIME`` and ``PERIOD`` entities of ``ro_core_news_sm``),
+    together with a small context window, are sent to the Java process instead of the
+    whole text.
+
+    In ``spans`` output mode, the normalized spans are written into a span group
+    (``doc.spans["temporal"]`` by default) instead of being merged into single tokens
+    and added to ``doc.ents``, so the tokenization and the entities produced by the
+    other components are left unchanged.
+
+    Long texts can be split into shards of at most ``max_shard_length`` characters at
+    sentence boundaries (or line breaks, if the doc has no sentence boundaries), which
+    are normalized in parallel. Each shard is extended with ``shard_overlap`` characters
+    of its neighbours, so expressions crossing a boundary are found as a whole by the
+    shard in which they start.
+
+    The extraction can be started ahead of the upstream components by adding the
+    ``temporal_normalization_prefetch`` pipe at the start of the pipeline, in which
+    case this component only collects the completed results.
+
+    When the component processes a stream of docs (``nlp.pipe``) with
+    ``adaptive_batching`` enabled, the docs are dispatched to the Java process in
+    batches whose size and number in flight are tuned automatically from the observed
+    latency (see ``AdaptiveBatchController`` and ``dispatch_state``).
+
+    Past ``overload_queue_depth`` texts waiting to be normalized or past an
+    ``overload_latency`` budget, new docs are passed through without temporal
+    annotations: they are marked with ``doc._.normalization_deferred`` and their texts
+    are stored in a durable backfill queue (``backfill_path``), which is drained later
+    by ``run_backfill``.
+
+    The docs whose ``doc._.detected_language`` (set by the ``temporal_language_gate``
+    component, see ``TemporalLanguageGate``) is not the language of the pipeline are
+    passed through without being sent to the Java process.
+
+    With ``collect_metrics`` enabled, the duration of each stage (the Java call, the
+    JSON decoding, the model construction, the retokenization, ...) and the number of
+    docs, expressions, matches and errors are recorded by ``stage_metrics`` and
+    reported by ``stats`` and ``openmetrics``.
+    """
 
-    def __init__(self, nlp: Language, name: str):
+    def __init__(
+        self,
+        nlp: Language,
+        name: str,
+        lazy: bool = False,
+        ner_guided: bool = False,
+        candidate_labels: tuple[str, ...] = CANDIDATE_LABELS,
+        context_window: int = 32,
+        output_mode: str = "retokenize",
+        spans_key: str = "temporal",
+        max_shard_length: int = 0,
+        shard_overlap: int = 64,
+        shard_workers: int = 4,
+        adaptive_batching: bool = False,
+        min_batch_size: int = 1,
+        max_batch_size: int = 256,
+        max_in_flight: int = 8,
+        target_latency: float = 0.05,
+        overload_queue_depth: int = 0,
+        overload_latency: float = 0.0,
+        backfill_path: str = "temporal_normalization_backfill.db",
+        collect_metrics: bool = False,
+        slow_doc_threshold: float = 0.0,
+        slow_doc_capacity: int = 100,
+        java_port: int | None = None,
+        java_log_level: str | None = None,
+        java_log_rate: float | None = None,
+    ):
         """
-        Initialize the component and register a custom extension on spaCy spans.
+        Initialize the component and register the custom extensions on spaCy docs and spans.
 
         Args:
             nlp (Language): A spaCy language object.
             name (str): The name of the component (unused, but typically required by spaCy).
+            lazy (bool): Whether to decode only the matched values of the extracted
+                         expressions up front and build their time series on first
+                         access. Defaults to False.
+            ner_guided (bool): Whether to normalize only the candidate entities
+                               (plus a context window) instead of the whole text.
+                               Docs without entity annotations are processed as a
+                               whole. Defaults to False.
+            candidate_labels (tuple[str, ...]): The labels of the candidate entities.
+                                                Defaults to ``DATETIME`` and ``PERIOD``.
+            context_window (int): The number of characters added on each side of a
+                                  candidate entity, extended to whole words.
+                                  Defaults to 32.
+            output_mode (str): ``retokenize`` to merge the normalized spans into
+                               single tokens and add them to ``doc.ents``, or
+                               ``spans`` to write them into the ``spans_key`` span
+                               group without changing the tokens or the entities.
+                               Defaults to ``retokenize``.
+            spans_key (str): The key of the span group used in ``spans`` output
+                             mode. Defaults to ``temporal``.
+            max_shard_length (int): The maximum number of characters of a shard,
+                                    without its overlap. 0 disables sharding.
+                                    Defaults to 0.
+            shard_overlap (int): The number of characters of the neighbouring shards
+                                 added on each side of a shard, extended to whole
+                                 words. Defaults to 64.
+            shard_workers (int): The number of shards normalized in parallel.
+                                 Defaults to 4.
+            adaptive_batching (bool): Whether ``pipe`` dispatches the docs in batches
+                                      tuned from the observed latency. Defaults to
+                                      False.
+            min_batch_size (int): The minimum number of docs of a batch. Defaults to 1.
+            max_batch_size (int): The maximum number of docs of a batch.
+                                  Defaults to 256.
+            max_in_flight (int): The maximum number of batches dispatched at the same
+                                 time. Defaults to 8.
+            target_latency (float): The target latency of a Java call, in seconds.
+                                    Defaults to 0.05.
+            overload_queue_depth (int): The number of texts waiting to be normalized
+                                        past which new docs are deferred. Only the
+                                        texts dispatched by ``adaptive_batching`` or
+                                        queued by the prefetch pipe wait, since the
+                                        docs processed one by one never do. 0
+                                        disables the limit. Defaults to 0.
+            overload_latency (float): The smoothed latency of a Java call (in seconds)
+                                      past which new docs are deferred. 0 disables
+                                      the limit. Defaults to 0.
+            backfill_path (str): The SQLite database of the backfill queue of the
+                                 deferred docs. Defaults to
+                                 ``temporal_normalization_backfill.db``.
+            collect_metrics (bool): Whether to enable the process-wide stage timers
+                                    and counters (see ``stats``). Defaults to False.
+            slow_doc_threshold (float): The duration (in seconds) past which a doc is
+                                        captured in ``slow_docs``. 0 disables the
+                                        capture. Defaults to 0.
+            slow_doc_capacity (int): The maximum number of captured slow docs.
+                                     Defaults to 100.
+            java_port (int or None): The port of the gateway of the Java process, or 0
+                                     for any free port, so several pipelines (e.g.,
+                                     one per worker process) can run side by side.
+                                     Defaults to None (the default Py4J port).
+            java_log_level (str or None): The level (e.g., ``DEBUG``) at which the
+                                          stdout lines of the Java process are logged
+                                          when it cannot be inferred from their
+                                          content. Defaults to None (``INFO``).
+            java_log_rate (float or None): The maximum number of lines of the Java
+                                           process logged per second. 0 disables the
+                                           limit. Defaults to None (50).
         """
 
-        Span.set_extension(TemporalNormalization.__FIELD, default=None, force=True)
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(
+                f"Unsupported output mode: {output_mode}. "
+                f"Please use one of {OUTPUT_MODES}."
+            )
+
+        register_extensions()
         self.nlp = nlp
         self.count = 0
+        self.lazy = lazy
+        self.ner_guided = ner_guided
+        self.candidate_labels = tuple(candidate_labels)
+        self.context_window = context_window
+        self.output_mode = output_mode
+        self.spans_key = spans_key
+        self.max_shard_length = max_shard_length
+        self.shard_overlap = shard_overlap
+        self.shard_workers = shard_workers
+        self.adaptive_batching = adaptive_batching
+        self.batch_controller = AdaptiveBatchController(
+            min_batch_size=min_batch_size,
+            max_batch_size=max_batch_size,
+            max_in_flight=max_in_flight,
+            target_latency=target_latency,
+        )
+        self.overload = OverloadPolicy(overload_queue_depth, overload_latency)
+        if overload_queue_depth > 0 and not adaptive_batching:
+            console.warning(
+                "overload_queue_depth only limits the texts dispatched by "
+                "adaptive_batching or queued by the temporal_normalization_prefetch "
+                "pipe: the docs processed one by one never wait to be normalized."
+            )
+        self.backfill_path = backfill_path
+        self._backfill: BackfillQueue | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._dispatch_executor: ThreadPoolExecutor | None = None
+        self._prefetched: WeakKeyDictionary[Doc, tuple[str, Future]] = (
+            WeakKeyDictionary()
+        )
+        self._warned_no_ents = False
+
+        self.slow_docs: SlowDocLog | None = (
+            SlowDocLog(slow_doc_threshold, slow_doc_capacity)
+            if slow_doc_threshold > 0
+            else None
+        )
+        self._profiler: DocProfiler | None = None
+
+        if collect_metrics:
+            stage_metrics.enable()
+
+        # the lines of the Java process go to the shared ``java_output``, unless the
+        # component has its own log settings
+        java_log_settings = {}
+        if java_log_level is not None:
+            java_log_settings["stdout_level"] = _log_level(java_log_level)
+        if java_log_rate is not None:
+            java_log_settings["max_lines_per_second"] = java_log_rate
+        self.java_output: JavaOutput = (
+            JavaOutput(**java_log_settings) if java_log_settings else java_output
+        )
 
         root_path = str(Path(__file__).resolve().parent.parent)
-        java_process, gateway = start_conn(root_path)
+        java_process, gateway = start_conn(
+            root_path, output=self.java_output, port=java_port
+        )
         self.java_process: subprocess.Popen = java_process
         self.gateway: JavaGateway = gateway
 
@@ -62,6 +306,288 @@ class TemporalNormalization:
             Doc: The modified Doc object with temporal expressions processed.
         """
 
+        self._tick()
+
+        normalize = self._normalize
+        if self.slow_docs is not None:
+            normalize = self._normalize_traced
+
+        profiler = self._profiler
+
+        if profiler is not None and not profiler.done:
+            profiler.run(normalize, doc)
+        else:
+            normalize(doc)
+
+        return doc
+
+    def pipe(self, stream: Iterable[Doc], batch_size: int = 128) -> Iterator[Doc]:
+        """
+        Apply the component to a stream of spaCy Doc objects.
+
+        With ``adaptive_batching`` enabled, the docs are dispatched in batches to a pool
+        of threads. The size of the batches and the number of batches in flight are
+        tuned after each batch by ``batch_controller``; no more docs are read from the
+        stream while the window of batches in flight is full. Otherwise, the docs are
+        processed one by one.
+
+        Args:
+            stream (Iterable[Doc]): The input spaCy Doc objects.
+            batch_size (int): Ignored, the batch size is tuned automatically.
+
+        Yields:
+            Doc: The processed Doc objects, in the order of the stream.
+        """
+
+        if not self.adaptive_batching:
+            for doc in stream:
+                yield self(doc)
+            return
+
+        controller = self.batch_controller
+        if self._dispatch_executor is None:
+            self._dispatch_executor = ThreadPoolExecutor(
+                controller.max_in_flight,
+                thread_name_prefix="temporal_normalization_dispatch",
+            )
+
+        stream = iter(stream)
+        pending: deque[tuple[list[Doc], list | None, Future]] = deque()
+
+        while True:
+            batch = list(islice(stream, controller.batch_size))
+
+            if batch:
+                plans: list = []
+                # the trace and the duration of each doc, if slow docs are captured
+                traces: list | None = [] if self.slow_docs is not None else None
+
+                for doc in batch:
+                    self._tick()
+                    if traces is None:
+                        plans.append(self._dispatch_plan(doc))
+                        continue
+
+                    started = time.perf_counter()
+                    with stage_metrics.trace() as trace:
+                        plans.append(self._dispatch_plan(doc))
+                    traces.append([trace, time.perf_counter() - started])
+
+                future = self._dispatch_executor.submit(
+                    self._extract_batch, plans, traces
+                )
+                pending.append((batch, traces, future))
+
+                if len(pending) < controller.in_flight:
+                    continue
+
+            if not pending:
+                break
+
+            docs, traces, future = pending.popleft()
+            waited = not future.done()
+            results, latency = future.result()
+            controller.observe(latency, len(pending), waited)
+
+            for i, (doc, result) in enumerate(zip(docs, results)):
+                if traces is None:
+                    self._complete(doc, result)
+                    yield doc
+                    continue
+
+                trace, duration = traces[i]
+                started = time.perf_counter()
+                with stage_metrics.trace(trace):
+                    self._complete(doc, result)
+                duration += time.perf_counter() - started
+
+                self.slow_docs.record(doc.text, duration, trace)
+                yield doc
+
+    @property
+    def dispatch_state(self) -> dict:
+        """
+        The current batch size and window of the adaptive dispatch, the smoothed call
+        latency, the queue depth and the reason of the last adjustment.
+        """
+
+        return self.batch_controller.state()
+
+    @property
+    def overload_state(self) -> dict:
+        """
+        The number of texts waiting to be normalized, the smoothed call latency, the
+        number of deferred docs and the reason of the last deferral.
+        """
+
+        return self.overload.state()
+
+    def stats(self) -> dict:
+        """
+        Returns a snapshot of the stage timers and counters of the process (see
+        ``StageMetrics.stats``), together with the dispatch and overload states.
+        """
+
+        return {
+            **stage_metrics.stats(),
+            "dispatch": self.dispatch_state,
+            "overload": self.overload_state,
+        }
+
+    def openmetrics(self) -> str:
+        """
+        Returns the stage timers and counters of the process in the OpenMetrics
+        (Prometheus) text format.
+        """
+
+        return stage_metrics.to_openmetrics()
+
+    def memory_stats(self) -> dict:
+        """
+        Reports the memory used by the normalization stack: the heap, non-heap and
+        garbage collections of the JVM (queried through the gateway), the resident set
+        size of the Java and Python processes, the number of Python proxies of the Java
+        objects of the gateway (see ``py4j_proxy_count``) and the approximate bytes held by the caches of decoded time
+        series and DBpedia entities. Cheap enough to be polled every few seconds.
+
+        Returns:
+            dict: The ``jvm``, ``java_process``, ``python_process``, ``py4j_proxies``,
+                  ``prefetched_docs`` and ``caches`` statistics. The ``jvm`` statistics
+                  are None if the Java process cannot be reached.
+        """
+
+        try:
+            jvm = jvm_memory_stats(self.gateway)
+        except Exception as e:
+            console.warning(f"The JVM memory usage could not be queried: {e}")
+            jvm = None
+
+        java_pid = getattr(self.java_process, "pid", None)
+
+        return {
+            "jvm": jvm,
+            "java_process": process_memory_stats(java_pid) if java_pid else None,
+            "python_process": process_memory_stats(),
+            "py4j_proxies": py4j_proxy_count(self.gateway),
+            "prefetched_docs": len(self._prefetched),
+            "caches": cache_memory_stats(),
+        }
+
+    def profile(self, docs: int = 100, path: str | None = None) -> DocProfiler:
+        """
+        Profiles the next docs processed by ``__call__`` with ``cProfile``, then dumps
+        the statistics to ``path`` and prints the most expensive functions. It can be
+        called from another thread while the pipeline is running. With
+        ``adaptive_batching``, the Java call of each doc dispatched by ``pipe`` is
+        profiled, in its dispatch thread.
+
+        Args:
+            docs (int): The number of docs to profile. Defaults to 100.
+            path (str or None): The file the statistics are dumped to. None only
+                                prints them. Defaults to None.
+
+        Returns:
+            DocProfiler: The profiler, whose ``report`` is set once it is done.
+        """
+
+        self._profiler = DocProfiler(docs, path)
+        return self._profiler
+
+    def profile_on_signal(
+        self,
+        docs: int = 100,
+        path: str = "temporal_normalization.prof",
+        signum: int | None = None,
+    ) -> None:
+        """
+        Installs a signal handler (``SIGUSR1`` by default) which profiles the next docs
+        (see ``profile``), so a running process can be profiled with, e.g.,
+        ``kill -USR1 <pid>``. Must be called from the main thread.
+
+        Args:
+            docs (int): The number of docs profiled after each signal. Defaults to 100.
+            path (str): The file the statistics are dumped to.
+                        Defaults to ``temporal_normalization.prof``.
+            signum (int or None): The signal number. Defaults to ``SIGUSR1``.
+        """
+
+        if signum is None:
+            if not hasattr(signal, "SIGUSR1"):
+                raise ValueError("SIGUSR1 is not available; please pass a signal.")
+            signum = signal.SIGUSR1
+
+        signal.signal(signum, lambda *_: self.profile(docs, path))
+
+    def _gated(self, doc: Doc) -> bool:
+        """
+        Skips the doc if it is detected in another language than the pipeline.
+
+        Returns:
+            bool: Whether the doc is skipped.
+        """
+
+        if self._accepts_language(doc):
+            return False
+
+        stage_metrics.count("language_skipped")
+        return True
+
+    def _accepts_language(self, doc: Doc) -> bool:
+        """
+        Returns whether the doc has no detected language (e.g., without a
+        ``temporal_language_gate`` component) or is in the language of the pipeline.
+        """
+
+        language = doc._.detected_language
+        return language is None or language == self.nlp.lang
+
+    def _shed(self, doc: Doc) -> bool:
+        """
+        Defers the doc to the backfill queue if the Java process is overloaded.
+
+        Returns:
+            bool: Whether the doc has been deferred.
+        """
+
+        reason = self.overload.check()
+        if reason is None:
+            return False
+
+        if self._backfill is None:
+            self._backfill = BackfillQueue(self.backfill_path)
+
+        self.overload.record_deferral(reason)
+        stage_metrics.count("deferred")
+
+        doc._.normalization_deferred = True
+        doc._.backfill_id = self._backfill.put(doc.text, reason)
+
+        return True
+
+    def _normalize(self, doc: Doc) -> None:
+        try:
+            if self._gated(doc) or (doc not in self._prefetched and self._shed(doc)):
+                return
+
+            self._annotate(doc, self._resolve(self._plan(doc)))
+        except Py4JNetworkError as e:
+            stage_metrics.count("errors")
+            print(f"⚠️ Py4J network error: {e}")
+        except Exception as e:
+            stage_metrics.count("errors")
+            print(f"⚠️ Unexpected error during extract_temporal_expressions: {e}")
+
+    def _normalize_traced(self, doc: Doc) -> None:
+        """Normalizes the doc and captures it in ``slow_docs`` if it is too slow."""
+
+        started = time.perf_counter()
+        with stage_metrics.trace() as trace:
+            self._normalize(doc)
+
+        self.slow_docs.record(doc.text, time.perf_counter() - started, trace)
+
+    def _tick(self) -> None:
+        stage_metrics.count("docs")
         self.count += 1
 
         if self.count % 1000 == 0:
@@ -70,18 +596,218 @@ class TemporalNormalization:
             gc.collect()
             time.sleep(0.01)
 
+    def _plan(self, doc: Doc) -> Plan:
+        """
+        Returns the future of the prefetched matches of the doc, or the text and the
+        shards to normalize.
+        """
+
+        prefetched = self._prefetched.pop(doc, None)
+
+        if prefetched is not None and prefetched[0] == doc.text:
+            return prefetched[1]
+
+        shards = _shard_segments(
+            doc, self._segments(doc), self.max_shard_length, self.shard_overlap
+        )
+
+        return doc.text, shards
+
+    def _resolve(self, plan: Plan | list[Match]) -> list[Match]:
+        """Returns the matches of a plan, normalizing the text if needed."""
+
+        if isinstance(plan, Future):
+            return plan.result()
+        if isinstance(plan, tuple):
+            self.overload.accept()
+            return self._timed_extract(*plan)
+
+        return plan
+
+    def _timed_extract(self, text: str, shards: list[Shard]) -> list[Match]:
+        """
+        Normalizes the shards of an accepted text and reports the latency of the call to
+        the overload policy.
+        """
+
+        started = time.perf_counter()
         try:
-            expressions: list[TemporalExpression] = extract_temporal_expressions(
-                self.gateway, doc.text
-            )
-            str_matches: list[str] = _prepare_str_patterns(expressions)
-            _retokenize(doc, str_matches, expressions)
+            return self._extract_matches(text, shards)
+        finally:
+            self.overload.done(time.perf_counter() - started)
+
+    def _dispatch_plan(self, doc: Doc) -> Plan | Exception | None:
+        """
+        Returns the plan of a doc dispatched by the adaptive ``pipe``, None if the doc
+        is skipped by the language gate or deferred, or the error raised while
+        planning it.
+        """
+
+        try:
+            if self._gated(doc) or (doc not in self._prefetched and self._shed(doc)):
+                return None
+
+            plan = self._plan(doc)
+            if isinstance(plan, tuple):
+                # counted before the next doc is checked, so the texts of this batch
+                # and of the batches in flight count towards the queue depth until
+                # their calls are done
+                self.overload.accept()
+            return plan
+        except Exception as e:
+            return e
+
+    def _complete(
+        self, doc: Doc, result: Plan | list[Match] | Exception | None
+    ) -> None:
+        """Writes the result of a doc dispatched by the adaptive ``pipe`` into it."""
+
+        if result is None:
+            # skipped by the language gate or deferred to the backfill queue
+            return
+
+        try:
+            if isinstance(result, Exception):
+                raise result
+            self._annotate(doc, self._resolve(result))
         except Py4JNetworkError as e:
+            stage_metrics.count("errors")
             print(f"⚠️ Py4J network error: {e}")
         except Exception as e:
+            stage_metrics.count("errors")
             print(f"⚠️ Unexpected error during extract_temporal_expressions: {e}")
 
-        return doc
+    def _extract_batch(
+        self, plans: list, traces: list | None = None
+    ) -> tuple[list, float]:
+        """
+        Normalizes the texts of a batch, in a dispatch thread.
+
+        The Java call of each text is added to the trace and the duration of its doc
+        (see ``traces`` in ``pipe``), and run under the profiler if one is active.
+
+        Returns:
+            tuple[list, float]: The matches (or the exception) of each plan, and the
+                                average latency of the Java calls, in seconds.
+        """
+
+        results: list = []
+        calls = 0
+        started = time.perf_counter()
+
+        for i, plan in enumerate(plans):
+            if isinstance(plan, tuple):
+                calls += 1
+                call_started = time.perf_counter()
+                try:
+                    if traces is None:
+                        plan = self._profiled_extract(plan)
+                    else:
+                        with stage_metrics.trace(traces[i][0]):
+                            plan = self._profiled_extract(plan)
+                except Exception as e:
+                    plan = e
+                if traces is not None:
+                    traces[i][1] += time.perf_counter() - call_started
+            results.append(plan)
+
+        elapsed = time.perf_counter() - started
+
+        return results, elapsed / calls if calls else 0.0
+
+    def _profiled_extract(self, plan: tuple[str, list[Shard]]) -> list[Match]:
+        profiler = self._profiler
+
+        if profiler is not None and not profiler.done:
+            return profiler.run(self._timed_extract, *plan)
+
+        return self._timed_extract(*plan)
+
+    def _segments(self, doc: Doc) -> list[tuple[int, int]]:
+        """
+        Returns the character offsets of the parts of the text which are sent to the
+        Java process: the candidate windows in NER-guided mode, or the whole text.
+        """
+
+        if not self.ner_guided:
+            return [(0, len(doc.text))]
+
+        if not doc.has_annotation("ENT_IOB"):
+            if not self._warned_no_ents:
+                console.warning(
+                    "NER-guided mode requires an upstream NER component. "
+                    "The whole text of the docs without entities is normalized."
+                )
+                self._warned_no_ents = True
+            return [(0, len(doc.text))]
+
+        return _candidate_windows(doc, self.candidate_labels, self.context_window)
+
+    def _extract_text(self, text: str) -> list[Match]:
+        """
+        Normalizes the whole text, independently of the doc annotations. Used by the
+        prefetch pipe, before the upstream components have processed the doc.
+        """
+
+        shards = _shard_segments(
+            text, [(0, len(text))], self.max_shard_length, self.shard_overlap
+        )
+
+        return self._timed_extract(text, shards)
+
+    def _annotate(self, doc: Doc, matches: list[Match]) -> None:
+        """Writes the matches into the doc, according to the output mode."""
+
+        stage_metrics.count("matches", len(matches))
+
+        if self.output_mode == "spans":
+            with stage_metrics.timer("span_group"):
+                _assign_span_group(doc, matches, self.spans_key)
+        else:
+            with stage_metrics.timer("retokenize"):
+                _retokenize(doc, matches)
+
+    def _extract_matches(self, text: str, shards: list[Shard]) -> list[Match]:
+        """
+        Normalizes the shards and returns the matches found in the regions they own,
+        sorted by their offsets.
+        """
+
+        results = self._extract_shards(text, shards)
+        matches = [match for result in results for match in result]
+
+        return _drop_overlapping(matches) if len(shards) > 1 else matches
+
+    def _extract_shards(self, text: str, shards: list[Shard]) -> list[list[Match]]:
+        """
+        Normalizes the shards (in parallel, if there are more of them) and returns the
+        matches found in the region owned by each shard.
+        """
+
+        extract_shard = partial(self._extract_shard, text)
+
+        if len(shards) > 1 and self.shard_workers > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.shard_workers, thread_name_prefix="temporal_normalization"
+                )
+            results = list(self._executor.map(extract_shard, shards))
+        else:
+            results = [extract_shard(shard) for shard in shards]
+
+        return results
+
+    def _extract_shard(self, text: str, shard: Shard) -> list[Match]:
+        start_char, end_char, own_start, own_end = shard
+        shard_text = text[start_char:end_char]
+        expressions: list[TemporalExpression] = extract_temporal_expressions(
+            self.gateway, shard_text, self.lazy
+        )
+
+        with stage_metrics.timer("find_matches"):
+            matches = _find_matches(shard_text, expressions, start_char)
+
+        return [match for match in matches if own_start <= match[0] < own_end]
 
     def __del__(self):
         """
@@ -97,9 +823,138 @@ class TemporalNormalization:
         network sockets that might otherwise persist after the Python process ends.
         """
 
+        if getattr(self, "_backfill", None) is not None:
+            self._backfill.close()
+
+        for executor in (
+            getattr(self, "_executor", None),
+            getattr(self, "_dispatch_executor", None),
+        ):
+            if executor is not None:
+                executor.shutdown(wait=False)
+
         close_conn(self.java_process, self.gateway)
 
 
+def register_extensions() -> None:
+    """
+    Registers the ``doc._.time_series_payload``, ``doc._.normalization_deferred``,
+    ``doc._.backfill_id``, ``doc._.detected_language`` and ``span._.time_series``
+    extensions.
+
+    The component registers them automatically. Call this function before reading the
+    ``time_series`` of docs deserialized in a process which does not run the component
+    (e.g., when loading a ``DocBin``).
+    """
+
+    Doc.set_extension("time_series_payload", default=None, force=True)
+    Doc.set_extension("normalization_deferred", default=False, force=True)
+    Doc.set_extension("backfill_id", default=None, force=True)
+    Doc.set_extension("detected_language", default=None, force=True)
+    Span.set_extension(
+        "time_series",
+        getter=_get_time_series,
+        setter=_set_time_series,
+        force=True,
+    )
+
+
+def _get_time_series(span: Span) -> list[TimeSeries] | None:
+    """
+    Rebuilds the time series attached to a span from the doc-level payload.
+
+    Args:
+        span (Span): The span whose time series are requested.
+
+    Returns:
+        list[TimeSeries] or None: The time series attached to the span, or None if
+                                  the span has no time series.
+    """
+
+    entries = _get_doc_time_series(span.doc)
+    time_series = entries.get((span.start_char, span.end_char))
+
+    return list(time_series) if time_series is not None else None
+
+
+def _set_time_series(span: Span, value: list[TimeSeries] | None) -> None:
+    """
+    Attaches the time series to a span by updating the doc-level payload, or the
+    buffered time series of the doc inside a ``time_series_batch`` block.
+
+    Args:
+        span (Span): The span to enrich.
+        value (list[TimeSeries] or None): The time series to attach. None removes
+                                          the time series previously attached.
+    """
+
+    doc = span.doc
+    entries = _pending.get(doc)
+    buffered = entries is not None
+    if not buffered:
+        entries = dict(_get_doc_time_series(doc))
+
+    key = (span.start_char, span.end_char)
+    if value is None:
+        entries.pop(key, None)
+    else:
+        entries[key] = list(value)
+
+    if not buffered:
+        _set_doc_time_series(doc, entries)
+
+
+@contextmanager
+def time_series_batch(doc: Doc) -> Iterator[Doc]:
+    """
+    Buffers the time series attached through ``span._.time_series`` to the spans of
+    the doc, and encodes the doc-level payload once at the end of the block instead of
+    after each assignment (which re-encodes the time series of every span).
+
+    The buffered time series are read back by ``span._.time_series``, but the payload
+    (e.g., serialized by ``DocBin``) is only updated when the block ends.
+
+    Args:
+        doc (Doc): The doc whose spans are enriched.
+
+    Example:
+        >>> with time_series_batch(doc):
+        ...     for span, time_series in results:
+        ...         span._.time_series = time_series
+    """
+
+    if doc in _pending:
+        # a nested block, encoded by the outer one
+        yield doc
+        return
+
+    _pending[doc] = dict(_get_doc_time_series(doc))
+    try:
+        yield doc
+    finally:
+        _set_doc_time_series(doc, _pending.pop(doc))
+
+
+def _get_doc_time_series(doc: Doc) -> dict[tuple[int, int], list[TimeSeries]]:
+    entries = _pending.get(doc)
+    if entries is not None:
+        return entries
+
+    payload = doc._.time_series_payload
+    return decode_time_series_cached(payload) if payload is not None else {}
+
+
+def _set_doc_time_series(
+    doc: Doc, entries: dict[tuple[int, int], list[TimeSeries]]
+) -> None:
+    if doc in _pending:
+        _pending[doc] = entries
+        return
+
+    with stage_metrics.timer("encode"):
+        doc._.time_series_payload = encode_time_series(entries) if entries else None
+
+
 def _prepare_str_patterns(expressions: list[TemporalExpression]) -> list[str]:
     """
     Collect all string matches from a list of temporal expressions.
@@ -120,41 +975,251 @@ def _prepare_str_patterns(expressions: list[TemporalExpression]) -> list[str]:
     return matches
 
 
-def _retokenize(
-    doc: Doc, str_matches: list[str], expressions: list[TemporalExpression]
-) -> None:
+def _candidate_windows(
+    doc: Doc, labels: tuple[str, ...], context_window: int
+) -> list[tuple[int, int]]:
+    """
+    Returns the character offsets of the candidate entities, extended by the context
+    window to whole words on each side. Overlapping windows are merged.
+
+    Args:
+        doc (Doc): The spaCy Doc, annotated by an NER component.
+        labels (tuple[str, ...]): The labels of the candidate entities.
+        context_window (int): The number of characters added on each side.
+
+    Returns:
+        list[tuple[int, int]]: The sorted, non-overlapping windows.
+    """
+
+    text = doc.text
+    windows: list[tuple[int, int]] = []
+
+    for ent in doc.ents:
+        if ent.label_ not in labels:
+            continue
+
+        start, end = _word_bounds(
+            text, ent.start_char - context_window, ent.end_char + context_window
+        )
+
+        if windows and start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], max(end, windows[-1][1]))
+        else:
+            windows.append((start, end))
+
+    return windows
+
+
+def _shard_segments(
+    doc: Doc | str, segments: list[tuple[int, int]], max_length: int, overlap: int
+) -> list[Shard]:
+    """
+    Splits the segments longer than ``max_length`` into shards, at the sentence
+    boundaries of the doc (or at line breaks, if the doc has no sentence boundaries).
+    Sentences longer than ``max_length`` are split at whitespace.
+
+    Args:
+        doc (Doc or str): The spaCy Doc, or its text.
+        segments (list[tuple[int, int]]): The parts of the text to normalize.
+        max_length (int): The maximum number of characters of a shard, without its
+                          overlap. 0 disables sharding.
+        overlap (int): The number of characters of the neighbouring shards added on
+                       each side of a shard.
+
+    Returns:
+        list[Shard]: The shards, sorted by their offsets.
+    """
+
+    if max_length <= 0:
+        return [(start, end, start, end) for start, end in segments]
+
+    text = doc if isinstance(doc, str) else doc.text
+    boundaries: list[int] | None = None
+    shards: list[Shard] = []
+
+    for segment_start, segment_end in segments:
+        if segment_end - segment_start <= max_length:
+            shards.append((segment_start, segment_end, segment_start, segment_end))
+            continue
+
+        if boundaries is None:
+            boundaries = _sentence_boundaries(doc)
+
+        own_start = segment_start
+        while own_start < segment_end:
+            limit = own_start + max_length
+
+            if limit >= segment_end:
+                own_end = segment_end
+            else:
+                i = bisect_right(boundaries, limit) - 1
+                if i >= 0 and boundaries[i] > own_start:
+                    own_end = boundaries[i]
+                else:
+                    whitespace = max(
+                        text.rfind(" ", own_start + 1, limit + 1),
+                        text.rfind("\n", own_start + 1, limit + 1),
+                    )
+                    own_end = whitespace if whitespace > own_start else limit
+
+            start, end = _word_bounds(
+                text,
+                own_start - overlap,
+                own_end + overlap,
+                segment_start,
+                segment_end,
+            )
+            shards.append((start, end, own_start, own_end))
+            own_start = own_end
+
+    return shards
+
+
+def _sentence_boundaries(doc: Doc | str) -> list[int]:
+    """
+    Returns the sorted character offsets at which the sentences (or the lines, if the
+    doc has no sentence boundaries or is a plain text) of the doc start.
+    """
+
+    if isinstance(doc, str):
+        return [match.end() for match in re.finditer(r"\n+", doc)]
+
+    if doc.has_annotation("SENT_START"):
+        return [sent.start_char for sent in doc.sents][1:]
+
+    return [match.end() for match in re.finditer(r"\n+", doc.text)]
+
+
+def _word_bounds(
+    text: str, start: int, end: int, lower: int = 0, upper: int | None = None
+) -> tuple[int, int]:
+    """
+    Clamps the ``[start, end)`` range to ``[lower, upper)`` and extends it to whole
+    words, so the words at its edges are not cut.
+    """
+
+    upper = len(text) if upper is None else upper
+    start, end = max(lower, start), min(upper, end)
+
+    while start > lower and not text[start - 1].isspace():
+        start -= 1
+    while end < upper and not text[end].isspace():
+        end += 1
+
+    return start, end
+
+
+def _drop_overlapping(matches: list[Match]) -> list[Match]:
+    """
+    Sorts the matches by their offsets and drops the ones overlapping a previous match,
+    preferring the longer match when two matches start at the same offset (e.g., when
+    a shard only sees the end of an expression found as a whole by the previous shard).
+    """
+
+    kept: list[Match] = []
+
+    for match in sorted(matches, key=lambda item: (item[0], item[0] - item[1])):
+        if not kept or match[0] >= kept[-1][1]:
+            kept.append(match)
+
+    return kept
+
+
+def _find_matches(
+    text: str, expressions: list[TemporalExpression], offset: int = 0
+) -> list[Match]:
+    """
+    Finds the matched values of the extracted expressions in the text they were
+    extracted from.
+
+    Args:
+        text (str): The text sent to the Java process.
+        expressions (list[TemporalExpression]): The expressions extracted from the text.
+        offset (int): The offset of the text in the doc. Defaults to 0.
+
+    Returns:
+        list[Match]: The doc-level offsets of each match, together with the time series
+                     of the expressions.
+    """
+
+    str_matches: list[str] = _prepare_str_patterns(expressions)
+    if len(str_matches) == 0:
+        return []
+
+    regex_matches: list[str] = [rf"{re.escape(item)}" for item in str_matches]
+    pattern = f"({'|'.join(regex_matches)})"
+    time_series: list[TimeSeries] = [
+        ts for expression in expressions for ts in expression.time_series
+    ]
+
+    return [
+        (match.start() + offset, match.end() + offset, time_series)
+        for match in re.finditer(pattern, text, re.IGNORECASE)
+    ]
+
+
+def _assign_span_group(doc: Doc, matches: list[Match], spans_key: str) -> None:
+    """
+    Writes the matched temporal expressions into a span group and attaches their time
+    series metadata, without retokenizing the doc or changing its entities.
+
+    Matches which do not align with the token boundaries (e.g., "1850-1870" when the
+    tokenizer keeps it as one token with other characters) are expanded to the tokens
+    they overlap. Matches expanded to the same span share the span.
+
+    Args:
+        doc (Doc): The spaCy Doc to be annotated.
+        matches (list[Match]): The matches found by ``_find_matches``.
+        spans_key (str): The key of the span group.
+    """
+
+    doc_time_series = dict(_get_doc_time_series(doc))
+    spans: dict[tuple[int, int], Span] = {}
+
+    for start_char, end_char, time_series in matches:
+        span = doc.char_span(
+            start_char, end_char, label="DATETIME", alignment_mode="expand"
+        )
+        if span is None:
+            continue
+
+        matched_ts = [ts for ts in time_series if _matched(span.text, ts.matches)]
+        if not len(matched_ts):
+            continue
+
+        key = (span.start_char, span.end_char)
+        if key in spans:
+            # keep the time series of the previous matches of the same span
+            matched_ts = list(dict.fromkeys(doc_time_series[key] + matched_ts))
+
+        spans[key] = span
+        doc_time_series[key] = matched_ts
+
+    doc.spans[spans_key] = list(spans.values())
+    _set_doc_time_series(doc, doc_time_series)
+
+
+def _retokenize(doc: Doc, matches: list[Match]) -> None:
     """
     Retokenizes the doc to align with matched temporal expressions and attaches
     time series metadata to the identified spans.
 
-    Matches are found using regular expressions. If a valid span can be created
-    from character offsets, the span is assigned a ``time_series`` extension and
-    optionally added to the doc's entity list.
+    If a valid span can be created from the character offsets of a match, the span
+    is assigned a ``time_series`` extension and optionally added to the doc's entity
+    list.
 
     Args:
         doc (Doc): The spaCy Doc to be modified.
-        str_matches (list[str]): The raw text patterns matched from expressions.
-        expressions (list[TemporalExpression]): Original extracted expressions,
-                                                each with time series metadata.
+        matches (list[Match]): The matches found by ``_find_matches``, each with the
+                               time series of the expressions it was found in.
     """
 
-    regex_matches: list[str] = [rf"{re.escape(item)}" for item in str_matches]
-    pattern = f"({'|'.join(regex_matches)})"
-    matches = (
-        list(re.finditer(pattern, doc.text, re.IGNORECASE))
-        if len(regex_matches) > 0
-        else []
-    )
+    doc_time_series = dict(_get_doc_time_series(doc))
 
     with doc.retokenize() as retokenizer:
         retokenized_entities: list[Span] = []
 
-        for match in matches:
-            if not isinstance(match, re.Match):
-                print(f"Invalid match object: {match!r}")
-                continue
-
-            start_char, end_char = match.start(), match.end()
+        for start_char, end_char, time_series in matches:
             start_token, end_token = None, None
 
             for token in doc:
@@ -167,29 +1232,30 @@ def _retokenize(
             if start_token is not None and end_token is not None:
                 # use exact token boundaries to create a custom `Span` for well-defined
                 # time expressions with known character offsets.
-                entity, existed_entity = _create_span(doc, start_char, end_char, start_token, end_token)
-                time_series: list[TimeSeries] = [ts for expression in expressions for ts in expression.time_series]
+                entity, _ = _create_span(doc, start_char, end_char, start_token, end_token)
                 matched_ts = [ts for ts in time_series if _matched(entity.text, ts.matches)]
-                _retokenize_entity(doc, matched_ts, entity, existed_entity, retokenized_entities, retokenizer)
+                _retokenize_entity(doc, matched_ts, entity, doc_time_series, retokenized_entities, retokenizer)
             else:
                 # For more ambiguous or loosely defined expressions, such as "martie -iunie 2013"
                 # or "dintre secolele al XV-lea și al XVIII-lea", iterates through existing entities
                 # and looks for substring matches to associate any relevant entries in `TimeSeries`
                 # with the entity.
+                stage_metrics.count("fallback_matches")
                 for entity in doc.ents:
                     if entity not in retokenized_entities:
-                        time_series: list[TimeSeries] = [ts for expression in expressions for ts in expression.time_series]
                         matched_ts = [ts for ts in time_series if _is_substring(entity.text, ts.matches)]
-                        _retokenize_entity(doc, matched_ts, entity, True, retokenized_entities, retokenizer)
+                        _retokenize_entity(doc, matched_ts, entity, doc_time_series, retokenized_entities, retokenizer)
 
             # fmt: on
 
+    _set_doc_time_series(doc, doc_time_series)
+
 
 def _retokenize_entity(
     doc: Doc,
     matched_ts: list[TimeSeries],
     entity: Span,
-    existed_entity: bool,
+    doc_time_series: dict[tuple[int, int], list[TimeSeries]],
     retokenized_entities: list[Span],
     retokenizer: Retokenizer,
 ) -> None:
@@ -201,7 +1267,8 @@ def _retokenize_entity(
         doc (Doc): The processed spaCy document.
         matched_ts (list[TimeSeries]): The matched time series.
         entity (Span): The named entity to enrich.
-        existed_entity (bool): Whether the entity already exists in doc.ents.
+        doc_time_series (dict): Accumulator for the time series attached to the spans
+                                of the doc, keyed by character offsets.
         retokenized_entities (list): Accumulator for entities that require retokenization.
         retokenizer (Doc.retokenize): The spaCy retokenizer context.
     """
@@ -209,7 +1276,7 @@ def _retokenize_entity(
     if not len(matched_ts):
         return None
 
-    _assign_time_series(matched_ts, entity, existed_entity)
+    _assign_time_series(matched_ts, entity, doc_time_series)
     _update_doc_ents(doc, entity)
     _merge_entity(doc, entity, retokenized_entities, retokenizer)
 
@@ -217,21 +1284,25 @@ def _retokenize_entity(
 
 
 def _assign_time_series(
-    matched_ts: list[TimeSeries], entity: Span, existed_entity: bool
+    matched_ts: list[TimeSeries],
+    entity: Span,
+    doc_time_series: dict[tuple[int, int], list[TimeSeries]],
 ) -> None:
     """
     Attaches matched TimeSeries to a given entity.
 
+    The time series are collected by character offsets and encoded into the doc-level
+    payload once all the entities have been processed, since the offsets are not
+    affected by retokenization.
+
     Args:
         matched_ts (list[TimeSeries]): The matched time series.
         entity (Span): The named entity to enrich.
-        existed_entity (bool): Whether the entity already exists in doc.ents.
+        doc_time_series (dict): Accumulator for the time series attached to the spans
+                                of the doc, keyed by character offsets.
     """
 
-    if existed_entity:
-        entity._.time_series = matched_ts
-    else:
-        entity._.set("time_series", matched_ts)
+    doc_time_series[(entity.start_char, entity.end_char)] = matched_ts
 
 
 def _update_doc_ents(doc: Doc, entity: Span) -> None:
@@ -249,7 +1320,8 @@ def _update_doc_ents(doc: Doc, entity: Span) -> None:
         # E.g.: entity not in all_ents => "În secolul XX, tehnologia a avansat semnificativ."
         all_ents.append(entity)
 
-    doc.ents = filter_spans(all_ents)
+    with stage_metrics.timer("filter_spans"):
+        doc.ents = filter_spans(all_ents)
 
 
 def _merge_entity(
@@ -339,5 +1411,16 @@ def _create_span(
     return Span(doc, start_token, end_token + 1, label="DATETIME"), False
 
 
+def _log_level(name: str) -> int:
+    """Returns the ``logging`` level of the given name (e.g., ``DEBUG``)."""
+
+    if name.upper() not in LOG_LEVELS:
+        raise ValueError(
+            f"Unsupported log level: {name}. Please use one of {LOG_LEVELS}."
+        )
+
+    return logging.getLevelName(name.upper())
+
+
 if __name__ == "__main__":
     pass
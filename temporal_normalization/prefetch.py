@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from spacy import Language
+from spacy.tokens import Doc
+
+from temporal_normalization import console
+from temporal_normalization.index import TemporalNormalization
+
+
+class TemporalNormalizationPrefetch:
+    """
+    spaCy pipeline component which starts the extraction of the temporal expressions
+    as soon as a doc enters the pipeline.
+
+    The text of each doc is sent to the Java process in a background thread, while
+    the upstream components (e.g., ``tok2vec``, ``tagger``, ``parser`` and ``ner``)
+    process the doc. The ``temporal_normalization`` component (``target``) then only
+    collects the completed result, so the normalization latency is hidden behind the
+    rest of the pipeline.
+
+    The extraction cannot be started ahead in NER-guided mode, which needs the
+    entities of the doc, or when the Java process is overloaded, so the docs are then
+    left to the target component. The docs detected in another language by an upstream
+    ``temporal_language_gate`` component are not sent to the Java process.
+
+    Example:
+        >>> nlp = spacy.load("ro_core_news_sm")
+        >>> nlp.add_pipe("temporal_normalization_prefetch", first=True)
+        >>> nlp.add_pipe("temporal_normalization", last=True)
+    """
+
+    def __init__(
+        self,
+        nlp: Language,
+        name: str,
+        target: str = "temporal_normalization",
+        workers: int = 4,
+    ):
+        """
+        Args:
+            nlp (Language): A spaCy language object.
+            name (str): The name of the component.
+            target (str): The name of the ``temporal_normalization`` component which
+                          collects the results. Defaults to ``temporal_normalization``.
+            workers (int): The number of docs normalized in parallel. Defaults to 4.
+        """
+
+        self.nlp = nlp
+        self.name = name
+        self.target = target
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(
+            workers, thread_name_prefix="temporal_normalization_prefetch"
+        )
+        self._warned_no_target = False
+
+    def __call__(self, doc: Doc) -> Doc:
+        """
+        Starts the extraction of the temporal expressions of the doc in the background.
+
+        Args:
+            doc (Doc): The input spaCy Doc object.
+
+        Returns:
+            Doc: The unchanged Doc object.
+        """
+
+        component = self._get_target()
+        if component is None or component.ner_guided:
+            return doc
+
+        if not component._accepts_language(doc):
+            # left to the target component, which skips it
+            return doc
+
+        if component.overload.check() is not None:
+            # left to the target component, which defers it to the backfill queue
+            return doc
+
+        text = doc.text
+        component.overload.accept()
+        component._prefetched[doc] = (
+            text,
+            self._executor.submit(component._extract_text, text),
+        )
+
+        return doc
+
+    def _get_target(self) -> TemporalNormalization | None:
+        if self.target in self.nlp.pipe_names:
+            component = self.nlp.get_pipe(self.target)
+            if isinstance(component, TemporalNormalization):
+                return component
+
+        if not self._warned_no_target:
+            console.warning(
+                f'The "{self.target}" temporal normalization component was not found '
+                f"in the pipeline. The docs are not prefetched."
+            )
+            self._warned_no_target = True
+
+        return None
+
+    def __del__(self):
+        """Stops the background threads once the pending extractions are done."""
+
+        if getattr(self, "_executor", None) is not None:
+            self._executor.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    pass
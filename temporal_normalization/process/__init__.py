@@ -1 +1,27 @@
-from .java_process import *  # noqa: F401, F403
+from temporal_normalization.commons.lazy_imports import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    {
+        "adaptive_batching": ("AdaptiveBatchController",),
+        "diagnostics": ("DocProfiler", "SlowDocLog"),
+        "java_output": ("JavaOutput",),
+        "java_process": (
+            "check_java_version",
+            "close_conn",
+            "drain_stream",
+            "gateway_started",
+            "start_conn",
+        ),
+        "load_shedding": ("BackfillQueue", "OverloadPolicy"),
+        "memory_stats": (
+            "cache_memory_stats",
+            "deep_sizeof",
+            "jvm_memory_stats",
+            "process_memory_stats",
+            "py4j_proxy_count",
+        ),
+    },
+)
+
+del attach
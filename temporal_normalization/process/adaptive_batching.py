@@ -0,0 +1,133 @@
+import threading
+
+
+class AdaptiveBatchController:
+    """
+    Tunes the batch size and the number of batches in flight of the Java dispatch,
+    using an additive-increase/multiplicative-decrease (AIMD) scheme driven by the
+    observed latency of the Java calls and by the depth of the dispatch queue.
+
+    After each batch:
+        - if the smoothed latency of a call is above ``target_latency``, the Java
+          process is congested, so the window of batches in flight and the batch size
+          are halved;
+        - otherwise, if the batch was not done when it was collected (the Java process
+          is the bottleneck, but it still answers fast), one more batch is allowed in
+          flight;
+        - otherwise (the results were waiting to be collected), the batch size grows
+          by ``batch_size_step``, so fewer, larger batches are dispatched.
+
+    All the settings stay within the configured bounds.
+    """
+
+    def __init__(
+        self,
+        min_batch_size: int = 1,
+        max_batch_size: int = 256,
+        max_in_flight: int = 8,
+        target_latency: float = 0.05,
+        batch_size_step: int = 8,
+        smoothing: float = 0.3,
+    ):
+        """
+        Args:
+            min_batch_size (int): The minimum number of docs of a batch. Defaults to 1.
+            max_batch_size (int): The maximum number of docs of a batch. Defaults to 256.
+            max_in_flight (int): The maximum number of batches dispatched at the same
+                                 time. Defaults to 8.
+            target_latency (float): The target latency of a Java call, in seconds.
+                                    Defaults to 0.05.
+            batch_size_step (int): The additive increase of the batch size.
+                                   Defaults to 8.
+            smoothing (float): The weight of the last observation in the exponential
+                               moving average of the latency. Defaults to 0.3.
+        """
+
+        if not 1 <= min_batch_size <= max_batch_size:
+            raise ValueError("The batch size bounds must satisfy 1 <= min <= max.")
+        if max_in_flight < 1:
+            raise ValueError("At least one batch must be allowed in flight.")
+
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.max_in_flight = max_in_flight
+        self.target_latency = target_latency
+        self.batch_size_step = batch_size_step
+        self.smoothing = smoothing
+
+        self.batch_size = min_batch_size
+        self.in_flight = 1
+        self.latency: float | None = None
+        self.queue_depth = 0
+        self.adjustments = 0
+        self.last_reason = "initial settings"
+        self._lock = threading.Lock()
+
+    def observe(self, latency: float, queue_depth: int, waited: bool) -> None:
+        """
+        Records a completed batch and adjusts the settings.
+
+        Args:
+            latency (float): The average latency of the Java calls of the batch, in
+                             seconds.
+            queue_depth (int): The number of batches still in flight.
+            waited (bool): Whether the batch was still running when it was collected.
+        """
+
+        with self._lock:
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += self.smoothing * (latency - self.latency)
+            self.queue_depth = queue_depth
+
+            if self.latency > self.target_latency:
+                self._set(
+                    max(self.min_batch_size, self.batch_size // 2),
+                    max(1, self.in_flight // 2),
+                    f"call latency {self.latency * 1000:.1f} ms is above the "
+                    f"{self.target_latency * 1000:.1f} ms target: halved the batch "
+                    f"size and the window",
+                )
+            elif waited:
+                self._set(
+                    self.batch_size,
+                    min(self.max_in_flight, self.in_flight + 1),
+                    f"the batch was still running with {queue_depth} batches queued "
+                    f"behind it: widened the window",
+                )
+            else:
+                self._set(
+                    min(self.max_batch_size, self.batch_size + self.batch_size_step),
+                    self.in_flight,
+                    "the results were ready before they were collected: increased "
+                    "the batch size",
+                )
+
+    def state(self) -> dict:
+        """Returns the current settings and the reason of the last adjustment."""
+
+        with self._lock:
+            return {
+                "batch_size": self.batch_size,
+                "in_flight": self.in_flight,
+                "latency_ms": (
+                    round(self.latency * 1000, 3) if self.latency is not None else None
+                ),
+                "queue_depth": self.queue_depth,
+                "adjustments": self.adjustments,
+                "last_reason": self.last_reason,
+            }
+
+    def _set(self, batch_size: int, in_flight: int, reason: str) -> None:
+        if (batch_size, in_flight) == (self.batch_size, self.in_flight):
+            return
+
+        self.batch_size = batch_size
+        self.in_flight = in_flight
+        self.adjustments += 1
+        self.last_reason = reason
+
+
+if __name__ == "__main__":
+    pass
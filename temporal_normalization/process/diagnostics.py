@@ -0,0 +1,171 @@
+import cProfile
+import hashlib
+import io
+import pstats
+import threading
+import time
+from collections import deque
+
+from temporal_normalization.commons.print_utils import console
+from temporal_normalization.commons.stage_metrics import DocTrace
+
+
+class SlowDocLog:
+    """
+    A bounded ring buffer of the docs whose normalization took longer than a
+    threshold, with the breakdown of the time spent in each stage.
+
+    Only a hash and an excerpt of each text are kept, unless ``keep_text`` is set.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        capacity: int = 100,
+        excerpt_length: int = 200,
+        keep_text: bool = False,
+    ):
+        """
+        Args:
+            threshold (float): The duration (in seconds) past which a doc is captured.
+            capacity (int): The maximum number of captured docs. The oldest docs are
+                            dropped first. Defaults to 100.
+            excerpt_length (int): The number of characters of the excerpt.
+                                  Defaults to 200.
+            keep_text (bool): Whether to keep the whole text of the captured docs.
+                              Defaults to False.
+        """
+
+        self.threshold = threshold
+        self.excerpt_length = excerpt_length
+        self.keep_text = keep_text
+        self.captured = 0
+        self._entries: deque[dict] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def record(self, text: str, duration: float, trace: DocTrace) -> bool:
+        """
+        Captures the doc if its normalization took longer than the threshold.
+
+        Args:
+            text (str): The text of the doc.
+            duration (float): The duration of the normalization, in seconds.
+            trace (DocTrace): The stages and the counters recorded for the doc.
+
+        Returns:
+            bool: Whether the doc has been captured.
+        """
+
+        if duration < self.threshold:
+            return False
+
+        entry = {
+            "hash": hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest(),
+            "length": len(text),
+            "excerpt": text[: self.excerpt_length],
+            "duration_ms": round(duration * 1000, 3),
+            "stages_ms": {
+                stage: round(seconds * 1000, 3)
+                for stage, seconds in trace.stages.items()
+            },
+            "java_calls": trace.counters.get("java_calls", 0),
+            "expressions": trace.counters.get("expressions", 0),
+            "matches": trace.counters.get("matches", 0),
+            "captured_at": time.time(),
+        }
+        if self.keep_text:
+            entry["text"] = text
+
+        with self._lock:
+            self._entries.append(entry)
+            self.captured += 1
+
+        return True
+
+    def entries(self) -> list[dict]:
+        """Returns the captured docs, from the slowest to the fastest."""
+
+        with self._lock:
+            entries = list(self._entries)
+
+        return sorted(entries, key=lambda entry: entry["duration_ms"], reverse=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DocProfiler:
+    """
+    Runs ``cProfile`` over the next ``docs`` docs and then dumps the statistics to
+    ``path`` (readable with ``pstats`` or ``snakeviz``) and prints the most expensive
+    functions.
+    """
+
+    def __init__(self, docs: int, path: str | None = None, top: int = 25):
+        """
+        Args:
+            docs (int): The number of docs to profile.
+            path (str or None): The file the statistics are dumped to. None only
+                                prints them. Defaults to None.
+            top (int): The number of functions printed, sorted by cumulative time.
+                       Defaults to 25.
+        """
+
+        if docs < 1:
+            raise ValueError("At least one doc must be profiled.")
+
+        self.remaining = docs
+        self.path = path
+        self.top = top
+        self.report: str | None = None
+        self._profiler = cProfile.Profile()
+        self._lock = threading.Lock()
+
+    @property
+    def done(self) -> bool:
+        return self.remaining <= 0
+
+    def run(self, function, *args):
+        """
+        Calls the function under the profiler and counts one profiled doc. Only one
+        doc is profiled at a time; the docs processed concurrently by other threads
+        are run without the profiler.
+        """
+
+        if not self._lock.acquire(blocking=False):
+            return function(*args)
+
+        try:
+            if self.done:
+                return function(*args)
+
+            self._profiler.enable()
+            try:
+                return function(*args)
+            finally:
+                self._profiler.disable()
+                self.remaining -= 1
+                if self.done:
+                    self._dump()
+        finally:
+            self._lock.release()
+
+    def _dump(self) -> None:
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profiler, stream=stream)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+        self.report = stream.getvalue()
+
+        if self.path is not None:
+            stats.dump_stats(self.path)
+            console.info(f"Profile statistics written to {self.path}")
+
+        print(self.report)
+
+
+if __name__ == "__main__":
+    pass
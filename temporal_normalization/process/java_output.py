@@ -0,0 +1,143 @@
+import logging
+import re
+import threading
+import time
+from collections import deque
+
+_logger = logging.getLogger("temporal_normalization.java")
+
+_LEVEL_PATTERNS = (
+    (re.compile(r"\b(ERROR|SEVERE|FATAL)\b|Exception\b|^\s+at "), logging.ERROR),
+    (re.compile(r"\bWARN(ING)?\b"), logging.WARNING),
+    (re.compile(r"\b(DEBUG|TRACE|FINE|FINER|FINEST)\b"), logging.DEBUG),
+)
+
+
+class JavaOutput:
+    """
+    Routes the lines written by the Java process to the
+    ``temporal_normalization.java`` logger, instead of printing them.
+
+    The level of each line is inferred from its content (e.g., ``ERROR``, ``WARN``,
+    ``DEBUG`` or a stack trace), or else is ``stdout_level`` or ``stderr_level``.
+    At most ``max_lines_per_second`` lines (with bursts of ``burst`` lines) are logged;
+    the number of the other lines is logged once the rate allows it again.
+
+    All the lines, logged or not, are kept in a ring buffer of ``capacity`` lines,
+    for crash diagnostics (see ``recent``).
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1000,
+        stdout_level: int = logging.INFO,
+        stderr_level: int = logging.WARNING,
+        max_lines_per_second: float = 50.0,
+        burst: int = 100,
+    ):
+        """
+        Args:
+            capacity (int): The number of recent lines kept. Defaults to 1000.
+            stdout_level (int): The level of the stdout lines whose level cannot be
+                                inferred. Defaults to ``logging.INFO``.
+            stderr_level (int): The level of the stderr lines whose level cannot be
+                                inferred. Defaults to ``logging.WARNING``.
+            max_lines_per_second (float): The sustained number of logged lines per
+                                          second. 0 disables the limit.
+                                          Defaults to 50.
+            burst (int): The number of lines which can be logged at once.
+                         Defaults to 100.
+        """
+
+        self.stdout_level = stdout_level
+        self.stderr_level = stderr_level
+        self.max_lines_per_second = max_lines_per_second
+        self.burst = burst
+        self.suppressed = 0
+        self._lines: deque[tuple[float, str, str]] = deque(maxlen=capacity)
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._pending_suppressed = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, line: str, stream: str = "stdout") -> None:
+        """
+        Records a line of the Java process and logs it if the rate limit allows it.
+
+        Args:
+            line (str): The line, without the trailing line break.
+            stream (str): ``stdout`` or ``stderr``. Defaults to ``stdout``.
+        """
+
+        with self._lock:
+            self._lines.append((time.time(), stream, line))
+            allowed = self._take_token()
+            if not allowed:
+                self.suppressed += 1
+                self._pending_suppressed += 1
+                return
+
+            suppressed, self._pending_suppressed = self._pending_suppressed, 0
+
+        if suppressed:
+            _logger.warning(
+                "%d lines of the Java process were not logged (rate limit)", suppressed
+            )
+
+        level = self.stdout_level if stream == "stdout" else self.stderr_level
+        _logger.log(_infer_level(line, level), "[java %s] %s", stream, line)
+
+    def recent(self, count: int | None = None) -> list[str]:
+        """
+        Returns the most recent lines of the Java process, oldest first.
+
+        Args:
+            count (int or None): The number of lines. None returns all the kept lines.
+                                 Defaults to None.
+        """
+
+        with self._lock:
+            lines = list(self._lines)
+
+        if count is not None:
+            lines = lines[-count:] if count > 0 else []
+
+        return [f"[{stream}] {line}" for _, stream, line in lines]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lines.clear()
+            self.suppressed = 0
+            self._pending_suppressed = 0
+
+    def _take_token(self) -> bool:
+        if self.max_lines_per_second <= 0:
+            return True
+
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst,
+            self._tokens + (now - self._refilled_at) * self.max_lines_per_second,
+        )
+        self._refilled_at = now
+
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        return True
+
+
+def _infer_level(line: str, default: int) -> int:
+    for pattern, level in _LEVEL_PATTERNS:
+        if pattern.search(line):
+            return level
+
+    return default
+
+
+java_output = JavaOutput()
+
+
+if __name__ == "__main__":
+    pass
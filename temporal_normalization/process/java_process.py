@@ -1,23 +1,47 @@
 import io
+import os
 import re
 import shutil
 import subprocess
 import threading
 
-from py4j.java_gateway import JavaGateway, GatewayParameters, CallbackServerParameters
+from py4j.java_gateway import (
+    JavaGateway,
+    GatewayParameters,
+    CallbackServerParameters,
+    find_jar_path,
+)
 from py4j.protocol import Py4JNetworkError
 
 from temporal_normalization.commons.print_utils import console
+from temporal_normalization.process.java_output import java_output, JavaOutput
 
 
 gateway_started = threading.Event()
 
-def start_conn(root_path: str) -> tuple[subprocess.Popen, JavaGateway]:
+def start_conn(
+    root_path: str, output: JavaOutput | None = None, port: int | None = None
+) -> tuple[subprocess.Popen, JavaGateway]:
     """
     Starts the Java temporal normalization process and establishes a Py4J gateway connection.
 
+    The stdout and stderr lines of the Java process are routed to the
+    ``temporal_normalization.java`` logger, with a rate limit, and the most recent
+    lines are kept in memory (see ``JavaOutput``).
+
+    By default, the gateway of the Java process listens on the default Py4J port
+    (25333), so only one Java process can run at a time. With a ``port``, the Py4J
+    gateway server is started with the jar on its classpath and listens on that port
+    (0 for any free port, which is read back from its output), so several Java
+    processes (e.g., one per worker process) can run side by side. This Java process
+    exits when the Python process does.
+
     Args:
         root_path (str): The root directory of the project.
+        output (JavaOutput or None): The handler of the lines of the Java process.
+                                     Defaults to the shared ``java_output``.
+        port (int or None): The port of the gateway, or 0 for any free port.
+                            Defaults to None (the default Py4J port).
 
     Returns:
         tuple[subprocess.Popen, JavaGateway]:
@@ -37,27 +61,70 @@ def start_conn(root_path: str) -> tuple[subprocess.Popen, JavaGateway]:
         f"{root_path}/temporal_normalization/libs/temporal-normalization-2.1.0.jar"
     )
 
+    output = java_output if output is None else output
+
+    if port is None:
+        command = ["java", "-jar", jar_path, "--python"]
+    else:
+        py4j_path = find_jar_path()
+        if not py4j_path:
+            raise RuntimeError("The Py4J jar of the py4j package was not found.")
+        # The gateway server prints the port it is bound to as its first line, and
+        # exits when its stdin (kept open by this process) is closed.
+        command = [
+            "java",
+            "-cp",
+            os.pathsep.join((py4j_path, jar_path)),
+            "py4j.GatewayServer",
+            "--die-on-broken-pipe",
+            str(port),
+        ]
+
+    # set by this launch only, so a gateway started earlier is not mistaken for it
+    started = threading.Event()
+    gateway_started.clear()
+    bound_ports = []
+
     def stdout_callback(line: str):
-        if "Gateway Server Started" in line:
-            gateway_started.set()
-        print(line.strip())
+        if not started.is_set():
+            if port is None:
+                ready = "Gateway Server Started" in line
+            else:
+                ready = line.isdigit()
+                if ready:
+                    bound_ports.append(int(line))
+            if ready:
+                started.set()
+                gateway_started.set()
+        output(line, "stdout")
+
+    def stderr_callback(line: str):
+        output(line, "stderr")
 
     java_process = subprocess.Popen(
-        ["java", "-jar", jar_path, "--python"],
+        command,
+        stdin=None if port is None else subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
     )
 
     threading.Thread(target=drain_stream, args=(java_process.stdout, stdout_callback), daemon=True).start()
-    threading.Thread(target=drain_stream, args=(java_process.stderr,), daemon=True).start()
+    threading.Thread(target=drain_stream, args=(java_process.stderr, stderr_callback), daemon=True).start()
 
-    if not gateway_started.wait(timeout=10.0):
+    if not started.wait(timeout=10.0):
         java_process.terminate()
-        raise RuntimeError("Java Gateway did not start within 10 seconds")
+        recent = "\n".join(output.recent(20))
+        raise RuntimeError(
+            f"Java Gateway did not start within 10 seconds. Last output:\n{recent}"
+        )
+
+    gateway_parameters = GatewayParameters(auto_convert=True, read_timeout=None)
+    if bound_ports:
+        gateway_parameters.port = bound_ports[0]
 
     gateway = JavaGateway(
-        gateway_parameters=GatewayParameters(auto_convert=True, read_timeout=None),
+        gateway_parameters=gateway_parameters,
         callback_server_parameters=None,
     )
 
@@ -0,0 +1,211 @@
+import sqlite3
+import threading
+import time
+
+# Latency samples older than this (in seconds) are not used to detect an overload,
+# so the component recovers once it stops sending work to the Java process.
+_LATENCY_TTL = 1.0
+
+
+class OverloadPolicy:
+    """
+    Detects when the Java process is overloaded, from the number of texts waiting to
+    be normalized (queued or in progress) and from the recent latency of the calls.
+
+    A limit set to 0 is disabled.
+    """
+
+    def __init__(
+        self, max_queue_depth: int = 0, max_latency: float = 0.0, smoothing: float = 0.3
+    ):
+        """
+        Args:
+            max_queue_depth (int): The number of texts waiting to be normalized past
+                                   which new docs are deferred. Defaults to 0.
+            max_latency (float): The smoothed latency of a call (in seconds) past which
+                                 new docs are deferred. Defaults to 0.
+            smoothing (float): The weight of the last call in the exponential moving
+                               average of the latency. Defaults to 0.3.
+        """
+
+        self.max_queue_depth = max_queue_depth
+        self.max_latency = max_latency
+        self.smoothing = smoothing
+
+        self.queue_depth = 0
+        self.latency: float | None = None
+        self.deferred = 0
+        self.last_reason: str | None = None
+        self._last_sample = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_queue_depth > 0 or self.max_latency > 0
+
+    def accept(self, count: int = 1) -> None:
+        """Records texts queued for normalization."""
+
+        with self._lock:
+            self.queue_depth += count
+
+    def done(self, latency: float) -> None:
+        """Records a completed normalization call and its latency, in seconds."""
+
+        with self._lock:
+            self.queue_depth = max(0, self.queue_depth - 1)
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += self.smoothing * (latency - self.latency)
+            self._last_sample = time.monotonic()
+
+    def check(self) -> str | None:
+        """
+        Returns the reason why a new doc should be deferred, or None if the Java
+        process is not overloaded.
+        """
+
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            reason = None
+
+            if 0 < self.max_queue_depth <= self.queue_depth:
+                reason = (
+                    f"{self.queue_depth} texts are waiting to be normalized "
+                    f"(limit: {self.max_queue_depth})"
+                )
+            elif (
+                self.max_latency > 0
+                and self.latency is not None
+                and self.latency > self.max_latency
+                and time.monotonic() - self._last_sample < _LATENCY_TTL
+            ):
+                reason = (
+                    f"call latency {self.latency * 1000:.1f} ms is above the "
+                    f"{self.max_latency * 1000:.1f} ms budget"
+                )
+
+            return reason
+
+    def record_deferral(self, reason: str) -> None:
+        """Records a doc deferred for the given reason."""
+
+        with self._lock:
+            self.deferred += 1
+            self.last_reason = reason
+
+    def state(self) -> dict:
+        """Returns the current load, the number of deferred docs and the last reason."""
+
+        with self._lock:
+            return {
+                "queue_depth": self.queue_depth,
+                "latency_ms": (
+                    round(self.latency * 1000, 3) if self.latency is not None else None
+                ),
+                "deferred": self.deferred,
+                "last_reason": self.last_reason,
+            }
+
+
+class BackfillQueue:
+    """
+    A durable, local queue (an SQLite database) of the texts whose normalization has
+    been deferred, together with their results once they have been backfilled.
+
+    The results are stored as time series payloads (see ``encode_time_series``), so
+    they can be assigned to ``doc._.time_series_payload`` of the deferred docs.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): The path of the SQLite database. It is created if needed.
+        """
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS backfill ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "text TEXT NOT NULL, "
+            "reason TEXT, "
+            "enqueued_at REAL NOT NULL, "
+            "done INTEGER NOT NULL DEFAULT 0, "
+            "payload BLOB)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS backfill_pending ON backfill (done, id)"
+        )
+        self._connection.commit()
+
+    def __len__(self):
+        """Returns the number of texts which have not been backfilled yet."""
+
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM backfill WHERE done = 0"
+            ).fetchone()
+        return count
+
+    def put(self, text: str, reason: str | None = None) -> int:
+        """
+        Enqueues a text and returns its backfill identifier.
+        """
+
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO backfill (text, reason, enqueued_at) VALUES (?, ?, ?)",
+                (text, reason, time.time()),
+            )
+            self._connection.commit()
+        return cursor.lastrowid
+
+    def pending(self, limit: int = 64) -> list[tuple[int, str]]:
+        """Returns the oldest texts which have not been backfilled yet."""
+
+        with self._lock:
+            return self._connection.execute(
+                "SELECT id, text FROM backfill WHERE done = 0 ORDER BY id LIMIT ?",
+                (limit,),
+            ).fetchall()
+
+    def complete(self, results: list[tuple[int, bytes | None]]) -> None:
+        """
+        Stores the time series payloads of backfilled texts (None if the text has no
+        temporal expressions).
+        """
+
+        with self._lock:
+            self._connection.executemany(
+                "UPDATE backfill SET done = 1, payload = ? WHERE id = ?",
+                [(payload, backfill_id) for backfill_id, payload in results],
+            )
+            self._connection.commit()
+
+    def result(self, backfill_id: int) -> tuple[bool, bytes | None]:
+        """
+        Returns whether the text has been backfilled, and its time series payload.
+        """
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT done, payload FROM backfill WHERE id = ?", (backfill_id,)
+            ).fetchone()
+
+        if row is None:
+            return False, None
+        return bool(row[0]), row[1]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,215 @@
+import os
+import sys
+from enum import Enum
+
+from py4j.finalizer import ThreadSafeFinalizer
+from py4j.java_gateway import JavaGateway
+
+from temporal_normalization.commons.dbpedia_registry import (
+    DBpediaEntity,
+    dbpedia_registry,
+)
+from temporal_normalization.commons.time_series_codec import decoded_cache_items
+
+# The number of interned entities measured to estimate the size of the registry.
+_REGISTRY_SAMPLE = 100
+
+# The approximate size of the decoded payloads and the number of their materialized
+# time series when it was measured, so it is measured again when more are built.
+_decoded_sizes: dict[bytes, tuple[int, int]] = {}
+
+
+def jvm_memory_stats(gateway: JavaGateway) -> dict:
+    """
+    Queries the memory usage of the JVM through the management beans of
+    ``java.lang.management.ManagementFactory`` (about 20 Py4J calls).
+
+    Args:
+        gateway (JavaGateway): The gateway connected to the Java process.
+
+    Returns:
+        dict: The heap and non-heap memory used, committed and maximum (in bytes; -1
+              if undefined) and, for each garbage collector, the number of
+              collections and their accumulated time (in milliseconds).
+    """
+
+    management = gateway.jvm.java.lang.management.ManagementFactory
+    memory = management.getMemoryMXBean()
+    heap = memory.getHeapMemoryUsage()
+    non_heap = memory.getNonHeapMemoryUsage()
+
+    return {
+        "heap_used": heap.getUsed(),
+        "heap_committed": heap.getCommitted(),
+        "heap_max": heap.getMax(),
+        "non_heap_used": non_heap.getUsed(),
+        "non_heap_committed": non_heap.getCommitted(),
+        "gc": {
+            collector.getName(): {
+                "count": collector.getCollectionCount(),
+                "time_ms": collector.getCollectionTime(),
+            }
+            for collector in management.getGarbageCollectorMXBeans()
+        },
+    }
+
+
+def process_memory_stats(pid: int | None = None) -> dict | None:
+    """
+    Returns the resident set size of a process, read from ``/proc`` (Linux only).
+
+    Args:
+        pid (int or None): The process identifier. Defaults to the current process.
+
+    Returns:
+        dict or None: The current (``rss``) and peak (``peak_rss``) resident set size,
+                      in bytes, or None if it cannot be read.
+    """
+
+    pid = os.getpid() if pid is None else pid
+    values = {}
+
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="utf-8") as status:
+            for line in status:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "VmHWM"):
+                    values[key] = int(value.split()[0]) * 1024
+    except (OSError, ValueError):
+        return None
+
+    if "VmRSS" not in values:
+        return None
+
+    return {"rss": values["VmRSS"], "peak_rss": values.get("VmHWM")}
+
+
+def py4j_proxy_count(gateway: JavaGateway | None = None) -> int:
+    """
+    Returns the number of live Python proxies of Java objects (``JavaObject``), which
+    keep their Java objects alive in the gateway until they are garbage collected on
+    the Python side.
+
+    This is a Python-side approximation of the objects held by the gateway: it is
+    read from the Py4J finalizers, so it misses the Java objects referenced by the
+    gateway without a proxy (e.g., when the memory management of the gateway is
+    disabled).
+
+    Args:
+        gateway (JavaGateway or None): The gateway whose proxies are counted.
+                                       Defaults to None (all the gateways).
+    """
+
+    finalizers = ThreadSafeFinalizer.finalizers
+    if gateway is None:
+        return len(finalizers)
+
+    # the finalizers are keyed by the address and the port of the gateway, followed
+    # by the identifier of the Java object, which does not start with a digit
+    parameters = gateway.gateway_parameters
+    prefix = f"{parameters.address}{parameters.port}"
+    start = len(prefix)
+
+    return sum(
+        1
+        for key in list(finalizers)
+        if key.startswith(prefix) and not key[start : start + 1].isdigit()
+    )
+
+
+def cache_memory_stats() -> dict:
+    """
+    Estimates the memory held by the caches of decoded time series and by the
+    DBpedia entity registry.
+
+    The size of each decoded payload is measured by walking its ``TimeSeries``
+    objects (excluding the shared DBpedia entities), once, and again when more of its
+    lazy time series have been materialized; the size of the registry is
+    extrapolated from a sample of its entities, so the estimate is cheap enough to
+    be polled every few seconds.
+
+    Returns:
+        dict: The number of decoded payloads in cache, the bytes of their payloads
+              and the approximate bytes of their time series, and the number of
+              interned entities and their approximate bytes.
+    """
+
+    items = decoded_cache_items()
+    payloads = {payload for payload, _ in items}
+
+    for payload in [payload for payload in _decoded_sizes if payload not in payloads]:
+        del _decoded_sizes[payload]
+
+    for payload, entries in items:
+        materialized = sum(
+            ts.is_materialized for time_series in entries.values() for ts in time_series
+        )
+        measured = _decoded_sizes.get(payload)
+        if measured is None or measured[0] != materialized:
+            _decoded_sizes[payload] = (materialized, deep_sizeof(entries))
+
+    entities = dbpedia_registry.sample(_REGISTRY_SAMPLE)
+    registry_size = len(dbpedia_registry)
+    entity_bytes = (
+        sum(deep_sizeof(entity, skip_entities=False) for entity in entities)
+        // len(entities)
+        if entities
+        else 0
+    )
+
+    return {
+        "decoded_payloads": len(items),
+        "decoded_payload_bytes": sum(len(payload) for payload in payloads),
+        "decoded_time_series_bytes": sum(
+            size for _, size in _decoded_sizes.values()
+        ),
+        "registry_entities": registry_size,
+        "registry_bytes": registry_size * entity_bytes,
+    }
+
+
+def deep_sizeof(obj, skip_entities: bool = True, seen: set[int] | None = None) -> int:
+    """
+    Approximates the bytes held by an object and the objects it references
+    (containers, slotted models and strings), counting shared objects once.
+
+    Args:
+        obj: The object to measure.
+        skip_entities (bool): Whether to skip the shared ``DBpediaEntity`` objects,
+                              which belong to the registry. Defaults to True.
+        seen (set[int] or None): The identifiers of the objects already counted.
+
+    Returns:
+        int: The approximate size, in bytes.
+    """
+
+    seen = set() if seen is None else seen
+    stack = [obj]
+    size = 0
+
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or item is None or isinstance(item, (bool, Enum)):
+            continue
+        if skip_entities and isinstance(item, DBpediaEntity):
+            continue
+
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif not isinstance(item, (str, bytes, int, float)):
+            for cls in type(item).__mro__:
+                slots = getattr(cls, "__slots__", ())
+                for slot in (slots,) if isinstance(slots, str) else slots:
+                    stack.append(getattr(item, slot, None))
+
+    return size
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,102 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# The standalone imports, which must not import the modules of ``FORBIDDEN_MODULES``.
+STANDALONE_IMPORT = (
+    "from temporal_normalization import start_conn, extract_temporal_expressions"
+)
+FORBIDDEN_MODULES = ("spacy", "langdetect", "numpy", "pyarrow")
+
+# The default bound of the median import time, in milliseconds.
+MAX_IMPORT_MS = 250.0
+REPEATS = 5
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"ms": elapsed * 1000, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure_import(statement: str = STANDALONE_IMPORT, repeats: int = REPEATS) -> dict:
+    """
+    Measures the time taken by an import statement in fresh interpreters (so the
+    modules are never cached) and lists the modules it imports.
+
+    Args:
+        statement (str): The import statement. Defaults to the standalone imports.
+        repeats (int): The number of interpreters; the median is kept. Defaults to 5.
+
+    Returns:
+        dict: The median and maximum import time (in milliseconds), the forbidden
+              modules which were imported and the number of imported modules.
+    """
+
+    root_path = str(Path(__file__).resolve().parent.parent.parent)
+    timings = []
+    modules = []
+
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(statement=statement)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=root_path,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result["ms"])
+        modules = result["modules"]
+
+    return {
+        "statement": statement,
+        "median_ms": round(statistics.median(timings), 1),
+        "max_ms": round(max(timings), 1),
+        "modules": len(modules),
+        "forbidden": [
+            module
+            for module in FORBIDDEN_MODULES
+            if any(name == module or name.startswith(f"{module}.") for name in modules)
+        ],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Checks that the standalone imports are fast and do not import "
+        "spaCy or langdetect."
+    )
+    parser.add_argument("--statement", default=STANDALONE_IMPORT)
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--max-ms", type=float, default=MAX_IMPORT_MS)
+    args = parser.parse_args()
+
+    result = measure_import(args.statement, args.repeats)
+    print(
+        f"{result['statement']}\n"
+        f"median {result['median_ms']:.1f} ms | max {result['max_ms']:.1f} ms | "
+        f"{result['modules']} modules | "
+        f"forbidden modules: {', '.join(result['forbidden']) or 'none'}"
+    )
+
+    failures = []
+    if result["forbidden"]:
+        failures.append(f"imports {', '.join(result['forbidden'])}")
+    if result["median_ms"] > args.max_ms:
+        failures.append(f"takes more than {args.max_ms:.0f} ms")
+
+    if failures:
+        print(f"FAILED: the statement {' and '.join(failures)}")
+        sys.exit(1)
+
+    print("ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import re
+from pathlib import Path
+
+from temporal_normalization import TemporalType, TimeSeries
+
+_URI_PREFIX = "https://dbpedia.org/page/"
+_EDGES_PATTERN = re.compile(r"\[\{start=(\S+), end=(\S+)\}\]")
+
+
+def load_inp_rows(dataset_type: str = "unique") -> list[list[str]]:
+    """
+    Reads the rows of an INP output file (e.g., ``files/output/inp_unique.csv``).
+
+    Args:
+        dataset_type (str): The name of the INP dataset (``additional``, ``unique``).
+
+    Returns:
+        list[list[str]]: The pipe-separated values of each row, without the header.
+    """
+
+    path = (
+        Path(__file__).resolve().parent.parent
+        / "validation"
+        / "files"
+        / "output"
+        / f"inp_{dataset_type}.csv"
+    )
+
+    with open(path, "r", encoding="utf-8") as csv_file:
+        rows = [line.rstrip("\n").split("|") for line in csv_file]
+
+    return [row for row in rows[1:] if len(row) == 4]
+
+
+def load_inp_json(dataset_type: str = "unique") -> list[tuple[dict, str, str]]:
+    """
+    Rebuilds the JSON objects returned by the TeN Framework from an INP output file,
+    so the models can be benchmarked without starting the Java process.
+
+    Labels and matched types are derived from the DBpedia URIs.
+
+    Args:
+        dataset_type (str): The name of the INP dataset (``additional``, ``unique``).
+
+    Returns:
+        list[tuple[dict, str, str]]: The ``(time series JSON, input value, prepared
+                                     value)`` triplets.
+    """
+
+    items = []
+
+    for input_value, prepared_value, edges, periods in load_inp_rows(dataset_type):
+        match = _EDGES_PATTERN.fullmatch(edges)
+        data = {"periods": []}
+
+        if match:
+            data["edges"] = {
+                "start": _entity(match.group(1), input_value),
+                "end": _entity(match.group(2), input_value),
+            }
+
+        for uri in periods.strip("[]").split(", "):
+            if uri:
+                data["periods"].append(_entity(uri, input_value))
+
+        items.append((data, input_value, prepared_value))
+
+    return items
+
+
+def load_inp_time_series(dataset_type: str = "unique") -> list[TimeSeries]:
+    return [
+        TimeSeries(data, input_value, prepared_value)
+        for data, input_value, prepared_value in load_inp_json(dataset_type)
+    ]
+
+
+def _entity(uri: str, matched_value: str) -> dict:
+    label = uri.replace(_URI_PREFIX, "").replace("_", " ")
+
+    if "millennium" in label:
+        matched_type = TemporalType.MILLENNIUM
+    elif "century" in label:
+        matched_type = TemporalType.CENTURY
+    else:
+        matched_type = TemporalType.YEAR
+
+    return {
+        "uri": uri,
+        "label": label,
+        "matchedValue": matched_value,
+        "matchedType": matched_type.value,
+    }
@@ -0,0 +1,379 @@
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+MODES = ("standalone", "call", "pipe")
+DATASETS = ("all", "unique", "additional")
+BACKENDS = ("stub", "jar")
+
+# The relative change past which a metric is reported as a regression.
+THRESHOLD = 0.1
+
+# The metrics compared by ``compare_results``, and whether higher is better.
+COMPARED_METRICS = {
+    "docs_per_sec": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+    "round_trips_per_doc": False,
+    "peak_rss_mb": False,
+}
+
+
+def run_benchmark(
+    dataset_type: str = "unique",
+    backend: str = "stub",
+    modes: tuple[str, ...] = MODES,
+    limit: int | None = None,
+    model: str | None = None,
+    config: dict | None = None,
+    stub_latency: float = 0.0,
+) -> dict:
+    """
+    Benchmarks the standalone extraction (``extract_temporal_expressions``),
+    ``nlp(...)`` and ``nlp.pipe(...)`` on the lines of an INP input file.
+
+    Each mode runs in a fresh process, so its peak RSS is not affected by the other
+    modes, and reports the throughput, the latency percentiles per doc, the number of
+    Py4J round trips per doc, the peak RSS and the duration of each stage (see
+    ``stage_metrics``).
+
+    Args:
+        dataset_type (str): The INP input file (``all``, ``unique`` or ``additional``).
+                            Defaults to ``unique``.
+        backend (str): ``stub`` to replay the recorded results of the INP output files
+                       (see ``StubGateway``) or ``jar`` to start the Java process.
+                       Defaults to ``stub``.
+        modes (tuple[str, ...]): The benchmarked modes. Defaults to all of them.
+        limit (int or None): The maximum number of lines. Defaults to None.
+        model (str or None): The spaCy model of the ``call`` and ``pipe`` modes. None
+                             uses a blank Romanian pipeline. Defaults to None.
+        config (dict or None): The settings of the ``temporal_normalization``
+                               component. Defaults to None.
+        stub_latency (float): The simulated latency of a stub call, in seconds.
+                              Defaults to 0.
+
+    Returns:
+        dict: The environment (``meta``) and the results of each mode (``results``).
+    """
+
+    context = multiprocessing.get_context("spawn")
+    results = {}
+
+    for mode in modes:
+        with context.Pool(1) as pool:
+            results[mode] = pool.apply(
+                _run_mode,
+                (mode, dataset_type, backend, limit, model, config or {}, stub_latency),
+            )
+        _print_result(mode, results[mode])
+
+    return {
+        "meta": {
+            "dataset": dataset_type,
+            "backend": backend,
+            "limit": limit,
+            "model": model or "blank:ro",
+            "config": config or {},
+            "stub_latency": stub_latency,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict, current: dict, threshold: float = THRESHOLD
+) -> list[str]:
+    """
+    Compares two benchmark results and returns the regressions, i.e., the metrics
+    which got worse by more than ``threshold`` (relative change).
+
+    Args:
+        baseline (dict): The reference result of ``run_benchmark``.
+        current (dict): The result to check.
+        threshold (float): The tolerated relative change. Defaults to 0.1.
+
+    Returns:
+        list[str]: A description of each regression.
+    """
+
+    regressions = []
+
+    for mode, result in current["results"].items():
+        reference = baseline["results"].get(mode)
+        if reference is None:
+            continue
+
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            before, after = reference.get(metric), result.get(metric)
+            if not before or after is None:
+                continue
+
+            change = (after - before) / before
+            regressed = change < -threshold if higher_is_better else change > threshold
+            status = "REGRESSION" if regressed else "ok"
+            line = (
+                f"{mode:>10} | {metric:<20} {before:>10.3f} -> {after:>10.3f} "
+                f"({change:+.1%})"
+            )
+            print(f"{line} {status}")
+
+            if regressed:
+                regressions.append(line)
+
+    return regressions
+
+
+def _run_mode(
+    mode: str,
+    dataset_type: str,
+    backend: str,
+    limit: int | None,
+    model: str | None,
+    config: dict,
+    stub_latency: float,
+) -> dict:
+    """Runs one mode in a worker process and returns its metrics."""
+
+    from contextlib import nullcontext
+
+    import spacy
+
+    import temporal_normalization.factory  # noqa: F401
+    from temporal_normalization import (
+        extract_temporal_expressions,
+        stage_metrics,
+        start_conn,
+        close_conn,
+    )
+    from tests.benchmarks.stub_backend import StubGateway, stub_backend
+    from tests.validation.inp_timespan import InpInputFile
+
+    texts = [text for text in InpInputFile.read_file(dataset_type) if text.strip()]
+    texts = texts[:limit] if limit else texts
+
+    backend_context = (
+        stub_backend(stub_latency) if backend == "stub" else nullcontext(None)
+    )
+
+    with backend_context as stub:
+        if mode == "standalone":
+            if stub is not None:
+                java_process, gateway = None, StubGateway(latency=stub_latency)
+            else:
+                root_path = str(Path(__file__).resolve().parent.parent.parent)
+                java_process, gateway = start_conn(root_path)
+            run = _standalone(gateway, texts, extract_temporal_expressions)
+        else:
+            nlp = spacy.load(model) if model else spacy.blank("ro")
+            component = nlp.add_pipe("temporal_normalization", last=True, config=config)
+            java_process, gateway = component.java_process, component.gateway
+            run = _call(nlp, texts) if mode == "call" else _pipe(nlp, texts)
+
+        round_trips = _RoundTrips(gateway)
+        stage_metrics.reset()
+        stage_metrics.enable()
+
+        started = time.perf_counter()
+        latencies = run()
+        elapsed = time.perf_counter() - started
+
+        trips = round_trips.count()
+        stages = stage_metrics.stats()["stages"]
+        java_rss = _java_peak_rss_mb(java_process)
+
+        if mode == "standalone" and stub is None:
+            close_conn(java_process, gateway)
+
+    latencies.sort()
+
+    return {
+        "docs": len(texts),
+        "elapsed_s": round(elapsed, 3),
+        "docs_per_sec": round(len(texts) / elapsed, 1),
+        "p50_ms": _percentile(latencies, 0.50),
+        "p95_ms": _percentile(latencies, 0.95),
+        "p99_ms": _percentile(latencies, 0.99),
+        "round_trips_per_doc": round(trips / len(texts), 3),
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "java_peak_rss_mb": java_rss,
+        "stages": {
+            stage: {"total_s": metrics["total_s"], "mean_ms": metrics["mean_ms"]}
+            for stage, metrics in stages.items()
+            if metrics["count"]
+        },
+    }
+
+
+def _standalone(gateway, texts: list[str], extract):
+    def run() -> list[float]:
+        latencies = []
+        for text in texts:
+            started = time.perf_counter()
+            extract(gateway, text)
+            latencies.append(time.perf_counter() - started)
+        return latencies
+
+    return run
+
+
+def _call(nlp, texts: list[str]):
+    def run() -> list[float]:
+        latencies = []
+        for text in texts:
+            started = time.perf_counter()
+            nlp(text)
+            latencies.append(time.perf_counter() - started)
+        return latencies
+
+    return run
+
+
+def _pipe(nlp, texts: list[str]):
+    def run() -> list[float]:
+        # the latency of a doc is the time elapsed since the previous doc was yielded
+        latencies = []
+        started = time.perf_counter()
+        for _ in nlp.pipe(texts):
+            now = time.perf_counter()
+            latencies.append(now - started)
+            started = now
+        return latencies
+
+    return run
+
+
+class _RoundTrips:
+    """Counts the Py4J commands sent through the gateway (or the stub calls)."""
+
+    def __init__(self, gateway):
+        self.gateway = gateway
+        self.start = getattr(gateway, "round_trips", 0)
+        self.commands = 0
+
+        client = getattr(gateway, "_gateway_client", None)
+        if client is not None:
+            send_command = client.send_command
+
+            def counted(*args, **kwargs):
+                self.commands += 1
+                return send_command(*args, **kwargs)
+
+            client.send_command = counted
+
+    def count(self) -> int:
+        if hasattr(self.gateway, "round_trips"):
+            return self.gateway.round_trips - self.start
+        return self.commands
+
+
+def _percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    return round(values[min(len(values) - 1, int(q * len(values)))] * 1000, 3)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _java_peak_rss_mb(java_process) -> float | None:
+    pid = getattr(java_process, "pid", None)
+    status = Path(f"/proc/{pid}/status")
+    if pid is None or not status.exists():
+        return None
+
+    for line in status.read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return round(int(line.split()[1]) / 1024, 1)
+
+    return None
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def _print_result(mode: str, result: dict) -> None:
+    print(
+        f"{mode:>10}: {result['docs_per_sec']:10.1f} docs/s | "
+        f"p50 {result['p50_ms']:8.3f} ms | p95 {result['p95_ms']:8.3f} ms | "
+        f"p99 {result['p99_ms']:8.3f} ms | "
+        f"{result['round_trips_per_doc']:6.2f} round trips/doc | "
+        f"{result['peak_rss_mb']:8.1f} MB"
+    )
+    for stage, metrics in result["stages"].items():
+        print(f"{'':>12}{stage:<14} {metrics['total_s']:9.3f} s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the temporal normalization on the INP validation data."
+    )
+    parser.add_argument("--dataset", choices=DATASETS, default="unique")
+    parser.add_argument("--backend", choices=BACKENDS, default="stub")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--model", default=None)
+    parser.add_argument(
+        "--config",
+        type=json.loads,
+        default=None,
+        help='The settings of the component, e.g., \'{"adaptive_batching": true}\'.',
+    )
+    parser.add_argument("--stub-latency", type=float, default=0.0)
+    parser.add_argument("--output", default=None, help="Saves the results as JSON.")
+    parser.add_argument(
+        "--compare",
+        nargs=2,
+        metavar=("BASELINE", "CURRENT"),
+        help="Compares two result files instead of running the benchmark.",
+    )
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, current = (
+            json.loads(Path(path).read_text(encoding="utf-8")) for path in args.compare
+        )
+        regressions = compare_results(baseline, current, args.threshold)
+        print(f"{len(regressions)} regression(s)")
+        sys.exit(1 if regressions else 0)
+
+    result = run_benchmark(
+        args.dataset,
+        args.backend,
+        tuple(args.modes),
+        args.limit,
+        args.model,
+        args.config,
+        args.stub_latency,
+    )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
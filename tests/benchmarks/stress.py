@@ -0,0 +1,254 @@
+import argparse
+import json
+import math
+import random
+import statistics
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Callable
+
+import spacy
+
+import temporal_normalization.factory  # noqa: F401
+from temporal_normalization import extract_temporal_expressions
+from tests.benchmarks.stub_backend import stub_backend
+
+# The number of repetitions of the unit of each family, doubled at each step.
+SIZES = (16, 32, 64, 128, 256, 512, 1024, 2048)
+REPEATS = 3
+
+# The scaling exponent (latency ~ characters ** exponent) past which the growth of a
+# family is reported as super-linear.
+SUPER_LINEAR = 1.25
+
+# The latency (in seconds) past which larger inputs of a family are not generated.
+MAX_LATENCY = 5.0
+
+_MONTHS = (
+    "ianuarie", "februarie", "martie", "aprilie", "mai", "iunie",
+    "iulie", "august", "septembrie", "octombrie", "noiembrie", "decembrie",
+)  # fmt: skip
+_ROMAN = ("I", "V", "X", "L", "C", "D", "M")
+
+
+def _digit_run(n: int, rng: random.Random) -> str:
+    # e.g., OCR of a table of numbers without separators
+    return "Anul " + "".join(rng.choice("0123456789") for _ in range(n * 4))
+
+
+def _sec_tokens(n: int, rng: random.Random) -> str:
+    return "În " + "sec. " * n + "XX"
+
+
+def _roman_numeral(n: int, rng: random.Random) -> str:
+    return "secolul " + "".join(rng.choice(_ROMAN) for _ in range(n)) + " d.Hr."
+
+
+def _dense_dates(n: int, rng: random.Random) -> str:
+    return ", ".join(
+        f"{rng.randint(1, 28)} {rng.choice(_MONTHS)} {rng.randint(1000, 2025)}"
+        for _ in range(n)
+    )
+
+
+def _year_ranges(n: int, rng: random.Random) -> str:
+    years = [rng.randint(1000, 2000) for _ in range(n)]
+    return "; ".join(f"{year}-{year + rng.randint(1, 50)}" for year in years)
+
+
+def _ocr_noise(n: int, rng: random.Random) -> str:
+    fragments = ("l9O3", "(1)838", "sec . XX", "a. Chr", ",,", "-", "1 8 4 8", "î.e.n")
+    return " ".join(rng.choice(fragments) for _ in range(n))
+
+
+def _plain_text(n: int, rng: random.Random) -> str:
+    # the linear baseline: words without temporal expressions
+    words = ("casa", "drumul", "orașul", "pădurea", "râul", "muntele", "satul")
+    return " ".join(rng.choice(words) for _ in range(n))
+
+
+FAMILIES: dict[str, Callable[[int, random.Random], str]] = {
+    "digit_run": _digit_run,
+    "sec_tokens": _sec_tokens,
+    "roman_numeral": _roman_numeral,
+    "dense_dates": _dense_dates,
+    "year_ranges": _year_ranges,
+    "ocr_noise": _ocr_noise,
+    "plain_text": _plain_text,
+}
+
+
+def run_stress(
+    backend: str = "stub",
+    families: tuple[str, ...] = tuple(FAMILIES),
+    sizes: tuple[int, ...] = SIZES,
+    repeats: int = REPEATS,
+    max_latency: float = MAX_LATENCY,
+    seed: int = 13,
+) -> dict:
+    """
+    Measures how the latency of ``extract_temporal_expressions`` and of the spaCy
+    component scales with the size of synthesized adversarial inputs, and reports
+    the families whose latency grows super-linearly with the number of characters.
+
+    Args:
+        backend (str): ``stub`` to synthesize one year per number of the text (see
+                       ``StubGateway``), which stresses the Python side only, or
+                       ``jar`` to start the Java process. Defaults to ``stub``.
+        families (tuple[str, ...]): The input families (see ``FAMILIES``).
+                                    Defaults to all of them.
+        sizes (tuple[int, ...]): The number of units of the inputs of each family.
+        repeats (int): The number of runs per size; the median is kept.
+                       Defaults to 3.
+        max_latency (float): The latency (in seconds) past which larger inputs of a
+                             family are skipped. Defaults to 5.
+        seed (int): The seed of the input generators. Defaults to 13.
+
+    Returns:
+        dict: For each family and target (``extract`` and ``component``), the length,
+              median latency and number of matches of each size, and the scaling
+              exponent.
+    """
+
+    backend_context = (
+        stub_backend(synthesize=True) if backend == "stub" else nullcontext()
+    )
+
+    with backend_context:
+        nlp = spacy.blank("ro")
+        component = nlp.add_pipe(
+            "temporal_normalization", config={"output_mode": "spans"}
+        )
+        gateway = component.gateway
+        results = {}
+
+        for family in families:
+            generate = FAMILIES[family]
+            results[family] = {}
+
+            for target in ("extract", "component"):
+                points = []
+
+                for size in sizes:
+                    text = generate(size, random.Random(seed + size))
+                    latency, matches = _measure(
+                        target, text, gateway, nlp, component, repeats
+                    )
+                    points.append(
+                        {
+                            "size": size,
+                            "chars": len(text),
+                            "median_ms": round(latency * 1000, 3),
+                            "matches": matches,
+                        }
+                    )
+
+                    if latency > max_latency:
+                        break
+
+                exponent = _scaling_exponent(points)
+                results[family][target] = {
+                    "points": points,
+                    "exponent": exponent,
+                    "super_linear": exponent is not None and exponent > SUPER_LINEAR,
+                }
+                _print_family(family, target, results[family][target])
+
+    return results
+
+
+def _measure(
+    target: str, text: str, gateway, nlp, component, repeats: int
+) -> tuple[float, int]:
+    latencies = []
+    matches = 0
+
+    for _ in range(repeats):
+        if target == "extract":
+            started = time.perf_counter()
+            expressions = extract_temporal_expressions(gateway, text)
+            latencies.append(time.perf_counter() - started)
+            matches = sum(len(expression.matches) for expression in expressions)
+        else:
+            doc = nlp.make_doc(text)
+            started = time.perf_counter()
+            component(doc)
+            latencies.append(time.perf_counter() - started)
+            matches = len(doc.spans[component.spans_key])
+
+    return statistics.median(latencies), matches
+
+
+def _scaling_exponent(points: list[dict]) -> float | None:
+    """
+    Returns the slope of the least-squares fit of log(latency) on log(characters)
+    over the larger half of the sizes, where the fixed costs no longer dominate.
+    """
+
+    points = [point for point in points if point["median_ms"] > 0]
+    points = points[len(points) // 2 :]
+    if len(points) < 2:
+        return None
+
+    xs = [math.log(point["chars"]) for point in points]
+    ys = [math.log(point["median_ms"]) for point in points]
+    x_mean, y_mean = statistics.fmean(xs), statistics.fmean(ys)
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    if variance == 0:
+        return None
+
+    slope = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / variance
+
+    return round(slope, 2)
+
+
+def _print_family(family: str, target: str, result: dict) -> None:
+    exponent = result["exponent"]
+    status = "SUPER-LINEAR" if result["super_linear"] else "ok"
+    print(f"{family:>14} | {target:<9} | exponent {exponent} {status}")
+
+    for point in result["points"]:
+        print(
+            f"{'':>14}   {point['chars']:>9} chars {point['median_ms']:>12.3f} ms "
+            f"{point['matches']:>7} matches"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measures the latency scaling of adversarial inputs."
+    )
+    parser.add_argument("--backend", choices=("stub", "jar"), default="stub")
+    parser.add_argument(
+        "--families", nargs="+", choices=FAMILIES, default=list(FAMILIES)
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(SIZES))
+    parser.add_argument("--repeats", type=int, default=REPEATS)
+    parser.add_argument("--max-latency", type=float, default=MAX_LATENCY)
+    parser.add_argument("--output", default=None, help="Saves the results as JSON.")
+    args = parser.parse_args()
+
+    results = run_stress(
+        args.backend,
+        tuple(args.families),
+        tuple(args.sizes),
+        args.repeats,
+        args.max_latency,
+    )
+
+    super_linear = [
+        f"{family}/{target}"
+        for family, targets in results.items()
+        for target, result in targets.items()
+        if result["super_linear"]
+    ]
+    print(f"Super-linear growth: {', '.join(super_linear) or 'none'}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import temporal_normalization.index as index
+from tests.benchmarks.inp_time_series import load_inp_json
+
+_YEAR_PATTERN = re.compile(r"\b\d{3,4}\b")
+
+
+class StubGateway:
+    """
+    A stand-in for the Py4J gateway which replays the results of the TeN Framework
+    recorded in the INP output files, so the Python side of the normalization can be
+    benchmarked without Java.
+
+    The texts which were not recorded (e.g., whole sentences) return an empty result,
+    like the texts without temporal expressions, or, with ``synthesize``, one year time
+    series per number of 3 or 4 digits of the text, so the Python side processes as
+    many expressions as the text contains. Each call can be delayed by ``latency``
+    seconds to simulate the cost of the Java process.
+
+    Attributes:
+        round_trips (int): The number of simulated Py4J calls (the construction of a
+                           ``TimeExpression`` and its ``serialize`` call).
+    """
+
+    def __init__(
+        self,
+        dataset_types: tuple[str, ...] = ("unique", "additional"),
+        latency: float = 0.0,
+        synthesize: bool = False,
+    ):
+        self.latency = latency
+        self.synthesize = synthesize
+        self.round_trips = 0
+        self._lock = threading.Lock()
+
+        grouped: dict[str, dict] = {}
+        for dataset_type in dataset_types:
+            for data, input_value, prepared_value in load_inp_json(dataset_type):
+                result = grouped.setdefault(
+                    input_value,
+                    {
+                        "inputValue": input_value,
+                        "preparedValue": prepared_value,
+                        "timeSeries": [],
+                    },
+                )
+                result["timeSeries"].append(data)
+
+        self._results = {text: json.dumps(result) for text, result in grouped.items()}
+        self.jvm = _Namespace(
+            ro=_Namespace(
+                webdata=_Namespace(
+                    normalization=_Namespace(
+                        timespan=_Namespace(
+                            ro=_Namespace(TimeExpression=self._time_expression)
+                        )
+                    )
+                )
+            )
+        )
+
+    def __len__(self):
+        return len(self._results)
+
+    def shutdown(self) -> None:
+        pass
+
+    def _time_expression(self, text: str) -> "_StubTimeExpression":
+        self._round_trip()
+        result = self._results.get(text.strip())
+
+        if result is None:
+            result = self._synthesized(text) if self.synthesize else "{}"
+
+        return _StubTimeExpression(self, result)
+
+    @staticmethod
+    def _synthesized(text: str) -> str:
+        time_series = []
+
+        for match in _YEAR_PATTERN.finditer(text):
+            entity = {
+                "uri": f"https://dbpedia.org/page/{match.group(0)}",
+                "label": match.group(0),
+                "matchedValue": match.group(0),
+                "matchedType": "year",
+            }
+            time_series.append(
+                {"edges": {"start": entity, "end": entity}, "periods": [entity]}
+            )
+
+        if not time_series:
+            return "{}"
+
+        return json.dumps(
+            {"inputValue": text, "preparedValue": text, "timeSeries": time_series}
+        )
+
+    def _round_trip(self) -> None:
+        with self._lock:
+            self.round_trips += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+
+class _StubTimeExpression:
+    def __init__(self, gateway: StubGateway, result: str):
+        self._gateway = gateway
+        self._result = result
+
+    def serialize(self) -> str:
+        self._gateway._round_trip()
+        return self._result
+
+
+class _StubProcess:
+    pid = None
+
+    def terminate(self) -> None:
+        pass
+
+    def wait(self) -> None:
+        pass
+
+
+class _Namespace:
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+@contextmanager
+def stub_backend(
+    latency: float = 0.0, synthesize: bool = False
+) -> Iterator[StubGateway]:
+    """
+    Replaces the Java process started by the ``temporal_normalization`` component with
+    a ``StubGateway`` while the context is active.
+
+    Example:
+        >>> with stub_backend() as gateway:
+        ...     nlp.add_pipe("temporal_normalization")
+        ...     docs = list(nlp.pipe(texts))
+        >>> gateway.round_trips
+    """
+
+    gateway = StubGateway(latency=latency, synthesize=synthesize)
+    start_conn, close_conn = index.start_conn, index.close_conn
+
+    index.start_conn = lambda root_path, **kwargs: (_StubProcess(), gateway)
+    index.close_conn = lambda java_process, gateway: None
+    try:
+        yield gateway
+    finally:
+        index.start_conn, index.close_conn = start_conn, close_conn
+
+
+if __name__ == "__main__":
+    pass
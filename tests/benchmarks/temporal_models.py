@@ -0,0 +1,96 @@
+import time
+import tracemalloc
+
+from temporal_normalization import dbpedia_registry, TemporalType, TimeSeries
+from tests.benchmarks.inp_time_series import load_inp_json
+
+ROUNDS = 5
+
+
+class LegacyTimeSeries:
+    """The dict-based ``TimeSeries`` implementation, kept as a baseline."""
+
+    def __init__(self, data: dict, input_value: str, prepared_value: str):
+        self.input_value = input_value
+        self.prepared_value = prepared_value
+        self.edges = LegacyEdgeModel(data["edges"]) if "edges" in data else None
+        self.periods = (
+            [LegacyDBpediaModel(item) for item in data["periods"]]
+            if "periods" in data
+            else []
+        )
+        self.matches = list(set([item.matched_value for item in self.periods]))
+
+
+class LegacyDBpediaModel:
+    """The dict-based ``DBpediaModel`` implementation, kept as a baseline."""
+
+    def __init__(self, data: dict):
+        self.uri = data["uri"] if "uri" in data else None
+        self.label = data["label"] if "label" in data else None
+        self.matched_value = data["matchedValue"] if "matchedValue" in data else None
+        try:
+            self.matched_type = (
+                TemporalType(data["matchedType"]) if "matchedType" in data else None
+            )
+        except ValueError:
+            self.matched_type = None
+
+
+class LegacyEdgeModel:
+    """The dict-based ``EdgeModel`` implementation, kept as a baseline."""
+
+    def __init__(self, data: dict):
+        self.start = LegacyDBpediaModel(data["start"]) if "start" in data else None
+        self.end = LegacyDBpediaModel(data["end"]) if "end" in data else None
+
+
+def benchmark_models(dataset_type: str = "unique") -> None:
+    """
+    Compares the construction time and the memory held by the time series models
+    built from the INP validation data against the legacy dict-based models.
+    """
+
+    items = load_inp_json(dataset_type)
+    n_models = sum(
+        1 + len(data["periods"]) + (3 if "edges" in data else 0)
+        for data, _, _ in items
+    )
+
+    print(f"{dataset_type}: {len(items)} time series, {n_models} model objects")
+
+    started = time.perf_counter()
+    _build(TimeSeries, items)
+    elapsed = time.perf_counter() - started
+    print(f"first construction (cold DBpedia registry): {elapsed * 1000:.1f} ms")
+
+    for name, cls in (("legacy", LegacyTimeSeries), ("slotted", TimeSeries)):
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            _build(cls, items)
+        elapsed = (time.perf_counter() - started) / ROUNDS
+
+        tracemalloc.start()
+        time_series = _build(cls, items)
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del time_series
+
+        print(
+            f"{name:>8}: construction {elapsed * 1000:8.1f} ms | "
+            f"memory {size / 1024 / 1024:8.2f} MiB | "
+            f"{size / n_models:6.1f} bytes/object"
+        )
+
+    print(f"DBpedia registry: {dbpedia_registry.stats()}")
+
+
+def _build(cls, items: list[tuple[dict, str, str]]) -> list:
+    return [
+        cls(data, input_value, prepared_value)
+        for data, input_value, prepared_value in items
+    ]
+
+
+if __name__ == "__main__":
+    benchmark_models("unique")
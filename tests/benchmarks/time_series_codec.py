@@ -0,0 +1,111 @@
+import pickle
+import time
+
+import spacy
+from spacy.tokens import Doc, DocBin
+
+from temporal_normalization import register_extensions
+from temporal_normalization.commons.time_series_codec import (
+    decode_time_series,
+    encode_time_series,
+)
+from tests.benchmarks.inp_time_series import load_inp_time_series
+
+SPANS_PER_DOC = 20
+ROUNDS = 5
+
+
+def benchmark_codec(dataset_type: str = "unique") -> None:
+    """
+    Compares the size and the encoding/decoding speed of the binary time series
+    payload against pickle, using the INP validation data grouped into documents of
+    ``SPANS_PER_DOC`` spans.
+    """
+
+    time_series = load_inp_time_series(dataset_type)
+    docs = [
+        {
+            (i * 10, i * 10 + 5): [ts]
+            for i, ts in enumerate(time_series[start : start + SPANS_PER_DOC])
+        }
+        for start in range(0, len(time_series), SPANS_PER_DOC)
+    ]
+
+    print(f"{dataset_type}: {len(time_series)} time series in {len(docs)} docs")
+
+    _report(
+        "pickle",
+        docs,
+        lambda entries: pickle.dumps(entries, protocol=pickle.HIGHEST_PROTOCOL),
+        pickle.loads,
+    )
+    _report("payload", docs, encode_time_series, decode_time_series)
+
+
+def benchmark_doc_bin(dataset_type: str = "unique") -> None:
+    """
+    Measures the ``DocBin`` round trip of docs carrying the time series payload.
+    """
+
+    register_extensions()
+    nlp = spacy.blank("ro")
+    time_series = load_inp_time_series(dataset_type)
+    docs = []
+
+    for start in range(0, len(time_series), SPANS_PER_DOC):
+        chunk = time_series[start : start + SPANS_PER_DOC]
+        doc = Doc(nlp.vocab, words=[ts.input_value for ts in chunk])
+
+        for token, ts in zip(doc, chunk):
+            doc[token.i : token.i + 1]._.time_series = [ts]
+
+        docs.append(doc)
+
+    started = time.perf_counter()
+    doc_bin = DocBin(store_user_data=True, docs=docs)
+    data = doc_bin.to_bytes()
+    serialized = time.perf_counter() - started
+
+    started = time.perf_counter()
+    restored = list(DocBin().from_bytes(data).get_docs(nlp.vocab))
+    n_series = sum(
+        len(span._.time_series) for doc in restored for span in _token_spans(doc)
+    )
+    deserialized = time.perf_counter() - started
+
+    print(
+        f"DocBin: {len(docs)} docs, {n_series} time series, {len(data)} bytes, "
+        f"serialized in {serialized:.3f}s, "
+        f"deserialized and decoded in {deserialized:.3f}s"
+    )
+
+
+def _report(name: str, docs: list[dict], encode, decode) -> None:
+    payloads = [encode(entries) for entries in docs]
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for entries in docs:
+            encode(entries)
+    encoded = (time.perf_counter() - started) / ROUNDS
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        for payload in payloads:
+            decode(payload)
+    decoded = (time.perf_counter() - started) / ROUNDS
+
+    size = sum(len(payload) for payload in payloads)
+    print(
+        f"{name:>8}: {size:>10} bytes | encode {encoded * 1000:8.1f} ms | "
+        f"decode {decoded * 1000:8.1f} ms"
+    )
+
+
+def _token_spans(doc):
+    return [doc[token.i : token.i + 1] for token in doc]
+
+
+if __name__ == "__main__":
+    benchmark_codec("unique")
+    benchmark_doc_bin("unique")
@@ -0,0 +1,53 @@
+import time
+from collections import Counter
+
+from temporal_normalization import TimelineHistogram, TimeSeries
+from tests.benchmarks.inp_time_series import load_inp_time_series
+
+ROUNDS = 5
+
+
+def benchmark_histogram(dataset_type: str = "unique", granularity: str = "decade") -> None:
+    """
+    Compares the vectorized ``TimelineHistogram`` against a Python loop over the
+    years of each time series of the INP validation data.
+    """
+
+    time_series = load_inp_time_series(dataset_type)
+    print(f"{dataset_type}: {len(time_series)} time series, {granularity} bins")
+
+    for name, build in (("loop", _loop_histogram), ("vectorized", _histogram)):
+        started = time.perf_counter()
+        for _ in range(ROUNDS):
+            result = build(time_series, granularity)
+        elapsed = (time.perf_counter() - started) / ROUNDS
+
+        print(f"{name:>10}: {elapsed * 1000:8.1f} ms | {len(result)} bins")
+
+
+def _histogram(time_series: list[TimeSeries], granularity: str) -> dict:
+    histogram = TimelineHistogram(granularity)
+    histogram.add_time_series(time_series)
+    return histogram.to_dict()
+
+
+def _loop_histogram(time_series: list[TimeSeries], granularity: str) -> dict:
+    """The straightforward implementation, kept as a baseline (AD years only)."""
+
+    width = {"year": 1, "decade": 10, "century": 100, "millennium": 1000}[granularity]
+    origin = 0 if width <= 10 else 1
+    counts = Counter()
+
+    for ts in time_series:
+        if ts.start_year is None or ts.end_year is None:
+            continue
+
+        years = ts.end_year - ts.start_year + 1
+        for year in range(ts.start_year, ts.end_year + 1):
+            counts[(year - origin) // width] += 1 / years
+
+    return counts
+
+
+if __name__ == "__main__":
+    benchmark_histogram("unique", "decade")
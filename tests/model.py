@@ -8,13 +8,15 @@ from spacy.cli import download
 from temporal_normalization import console
 
 
-def load_model(model_name: str) -> Language:
+def load_model(model_name: str, config: dict | None = None) -> Language:
     """
     Loads a spaCy language model by name, downloading it if necessary,
     and adds the ``temporal_normalization`` pipeline component.
 
     Args:
         model_name (str): The name of the spaCy model to load (e.g., ``ro_core_news_sm``).
+        config (dict or None): The settings of the ``temporal_normalization`` component
+                               (e.g., ``{"ner_guided": True}``).
 
     Returns:
         Language: The loaded spaCy language model with the temporal normalization component added.
@@ -40,6 +42,6 @@ def load_model(model_name: str) -> Language:
         nlp = spacy.load(model_name)
 
     # Add "temporal_normalization" component to the spaCy pipeline
-    nlp.add_pipe("temporal_normalization", last=True)
+    nlp.add_pipe("temporal_normalization", last=True, config=config or {})
 
     return nlp
@@ -0,0 +1,166 @@
+import json
+import os
+import socket
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import temporal_normalization.batch as batch
+from tests.benchmarks.stub_backend import StubGateway, _StubProcess
+
+# The text of the records whose normalization fails (see ``FailingGateway``).
+FAILING_TEXT = "Text which makes the normalization fail."
+
+# The sockets of the stub backends of the current process, kept open until it exits.
+_sockets = []
+
+
+class FailingGateway(StubGateway):
+    """A ``StubGateway`` which raises an error for the ``FAILING_TEXT`` records."""
+
+    def _time_expression(self, text: str):
+        if text == FAILING_TEXT:
+            raise ValueError("Malformed payload.")
+
+        return super()._time_expression(text)
+
+
+@contextmanager
+def stub_batch_backend(log_dir: str) -> Iterator[None]:
+    """
+    Replaces the Java process of the batch workers with a ``FailingGateway`` while
+    the context is active.
+
+    Like the gateway server of a Java process, each stub backend listens on the port
+    it is started with (the default Py4J port if None), so two backends started on the
+    same port fail. The process identifier and the port of each backend are written
+    to ``log_dir``.
+    """
+
+    def start_conn(root_path: str, output=None, port: int | None = None):
+        server = socket.socket()
+        server.bind(("127.0.0.1", 25333 if port is None else port))
+        server.listen()
+        _sockets.append(server)
+
+        backend = {"pid": os.getpid(), "port": server.getsockname()[1]}
+        Path(log_dir, f"backend-{os.getpid()}.json").write_text(json.dumps(backend))
+
+        return _StubProcess(), FailingGateway(synthesize=True)
+
+    original = batch.start_conn, batch.close_conn
+    batch.start_conn = start_conn
+    batch.close_conn = lambda java_process, gateway: None
+    try:
+        yield
+    finally:
+        batch.start_conn, batch.close_conn = original
+
+
+def check_workers(records: int = 200, workers: int = 2) -> list[dict]:
+    """
+    Runs a batch job with several workers against stub backends, and checks that each
+    worker has a backend of its own and that every record is normalized.
+
+    Returns:
+        list[dict]: The process identifier and the port of each backend.
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = Path(tmp_dir, "input.txt")
+        output_path = Path(tmp_dir, "output.jsonl")
+        log_dir = Path(tmp_dir, "backends")
+        log_dir.mkdir()
+
+        texts = (f"În anul {1500 + i} a avut loc un eveniment." for i in range(records))
+        input_path.write_text("".join(f"{text}\n" for text in texts), encoding="utf-8")
+
+        with stub_batch_backend(str(log_dir)):
+            processed, failed = batch.run_batch(
+                str(input_path), str(output_path), workers=workers, chunk_size=10
+            )
+
+        backends = [json.loads(path.read_text()) for path in log_dir.glob("*.json")]
+        results = [
+            json.loads(line)
+            for line in output_path.read_text(encoding="utf-8").splitlines()
+        ]
+
+    assert processed == records, f"{processed} of {records} records processed"
+    assert failed == 0, f"{failed} records failed"
+    assert [result["id"] for result in results] == list(range(records))
+    assert all(result["expressions"] for result in results), "unnormalized records"
+
+    assert len(backends) == workers, f"{len(backends)} backends for {workers} workers"
+    assert len({backend["pid"] for backend in backends}) == workers
+    assert len({backend["port"] for backend in backends}) == workers, (
+        f"the workers share a port: {backends}"
+    )
+
+    return backends
+
+
+def check_failing_records(output_format: str = "jsonl") -> None:
+    """
+    Runs a batch job whose input contains records which make the normalization fail,
+    and checks that only these records are reported as failed, that the job ends and
+    that the other records are normalized.
+    """
+
+    texts = ["În anul 1600 a avut loc un eveniment.", FAILING_TEXT] * 15
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = Path(tmp_dir, "input.txt")
+        output_path = Path(tmp_dir, "output")
+        log_dir = Path(tmp_dir, "backends")
+        log_dir.mkdir()
+        input_path.write_text("".join(f"{text}\n" for text in texts), encoding="utf-8")
+
+        with stub_batch_backend(str(log_dir)):
+            processed, failed = batch.run_batch(
+                str(input_path),
+                str(output_path),
+                output_format=output_format,
+                workers=2,
+                chunk_size=4,
+            )
+
+        if output_format == "jsonl":
+            results = [
+                json.loads(line)
+                for line in output_path.read_text(encoding="utf-8").splitlines()
+            ]
+            errors = [result["id"] for result in results if "error" in result]
+            normalized = [
+                result["id"] for result in results if result.get("expressions")
+            ]
+        else:
+            # imported on first use, since it imports numpy
+            from temporal_normalization.commons.columnar_export import read_npz
+
+            doc_ids = set()
+            for part in sorted(output_path.glob("part-*")):
+                doc_ids.update(int(doc_id) for doc_id in read_npz(str(part))["doc_id"])
+            errors = [i for i in range(len(texts)) if i not in doc_ids]
+            normalized = sorted(doc_ids)
+
+    expected_errors = [i for i, text in enumerate(texts) if text == FAILING_TEXT]
+
+    assert processed == len(texts), f"{processed} of {len(texts)} records processed"
+    assert failed == len(expected_errors), f"{failed} failed records reported"
+    assert errors == expected_errors, f"unexpected failed records: {errors}"
+    assert normalized == [i for i in range(len(texts)) if i not in expected_errors]
+
+
+def main() -> None:
+    backends = check_workers()
+    print(f"workers: ok ({', '.join(str(backend) for backend in backends)})")
+
+    for output_format in ("jsonl", "npz"):
+        check_failing_records(output_format)
+        print(f"failing records ({output_format}): ok")
+
+
+if __name__ == "__main__":
+    main()
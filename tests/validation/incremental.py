@@ -0,0 +1,63 @@
+import spacy
+
+import temporal_normalization.factory  # noqa: F401
+from temporal_normalization import IncrementalNormalization
+from tests.benchmarks.stub_backend import stub_backend
+
+# The Py4J round trips of the normalization of one sentence (the construction of a
+# ``TimeExpression`` and its ``serialize`` call).
+ROUND_TRIPS_PER_SENTENCE = 2
+
+
+def check_reuse(sentences: int = 20) -> dict:
+    """
+    Normalizes a document, then an edited version of it with one changed sentence and
+    one new sentence repeated twice, and checks that ``last_update`` counts as reused
+    only the sentences whose matches were copied without calling the backend.
+
+    Returns:
+        dict: The ``last_update`` of the edited version.
+    """
+
+    texts = [f"Propoziția {i} se referă la anul {1500 + i}." for i in range(sentences)]
+
+    with stub_backend(synthesize=True) as gateway:
+        nlp = spacy.blank("ro")
+        nlp.add_pipe("sentencizer")
+        component = nlp.add_pipe(
+            "temporal_normalization", config={"output_mode": "spans"}
+        )
+        incremental = IncrementalNormalization(component)
+
+        with nlp.select_pipes(disable=["temporal_normalization"]):
+            incremental(nlp(" ".join(texts)), doc_id="doc")
+            assert incremental.last_update == {
+                "sentences": sentences,
+                "reused": 0,
+                "normalized": sentences,
+            }, incremental.last_update
+
+            texts[3] = "Propoziția 3 a fost schimbată în anul 1999."
+            texts[10:10] = ["O propoziție nouă din anul 1666."] * 2
+
+            round_trips = gateway.round_trips
+            doc = incremental(nlp(" ".join(texts)), doc_id="doc")
+            calls = (gateway.round_trips - round_trips) // ROUND_TRIPS_PER_SENTENCE
+
+    update = incremental.last_update
+
+    # the changed sentence and the new sentence (normalized once) call the backend
+    assert calls == update["normalized"] == 2, (calls, update)
+    assert update["sentences"] == sentences + 2, update
+    assert update["reused"] == sentences - 1, update
+    assert len(doc.spans["temporal"]) == sentences + 2
+
+    return update
+
+
+def main() -> None:
+    print(f"reuse: ok ({check_reuse()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,87 +1,196 @@
+import time
+
 from datasets import load_dataset
 
-from inp_timespan import InpInputFile, InpOutputFile
+from inp_timespan import InpInputFile, InpOutputFile, inp_rows
 from tests.validation.ronec_mock_data import ronec_example
-from tests.model import load_model
-from ronec_timespan import Ronec, RonecOutputFile
+from tests.validation.runner import annotate_texts
+from ronec_timespan import entity_cells, Ronec, RonecOutputFile, RonecTagType
 
 MODEL = "ro_core_news_sm"
+WORKERS = 1
+BATCH_SIZE = 64
 
 
-def validate_ronec_corpus(dataset_type: str, mock_data: bool = False):
+def validate_ronec_corpus(
+    dataset_type: str,
+    mock_data: bool = False,
+    workers: int = WORKERS,
+    batch_size: int = BATCH_SIZE,
+) -> dict:
     """
     Runs a validation loop over a specified dataset (e.g., ``validation``, ``test``,
     or ``train``), applying a spaCy model to all temporal expressions and writing the
     results to file.
 
     The function loads RONEC entries, extracts their associated timespans (temporal
-    expressions), processes each using the NLP model, and writes the annotated output
-    using ``OutputFile``.
+    expressions), processes them in batches with ``nlp.pipe`` (sharded across
+    ``workers`` processes), writes the annotated output through a single buffered
+    ``RonecOutputFile`` and computes the summary metrics in the same pass.
 
     Args:
         dataset_type (str): The name of the dataset split to validate. Expected values:
                             ``validation``, ``test``, and ``train``.
         mock_data (bool): Whether to use a mocked example dataset (useful for testing).
                           Defaults to False.
+        workers (int): The number of worker processes. Defaults to 1.
+        batch_size (int): The batch size of ``nlp.pipe``. Defaults to 64.
+
+    Returns:
+        dict: The summary metrics: the number of entries, of entries and of timespans
+              with a RONEC ``DATETIME`` or ``PERIOD`` tag and, overall and for each tag
+              type, the share of timespans normalized (``recall``) and normalized by
+              an entity with the same text (``exact``).
 
     Example:
         >>> validate_ronec_corpus("validation")
-        >>> validate_ronec_corpus("test")
+        >>> validate_ronec_corpus("test", workers=4)
         >>> validate_ronec_corpus("train", mock_data=True)
 
-    Prints:
-        - Number of total entries in the dataset.
-        - Number of entries containing at least one timespan.
-        - Total number of individual temporal expressions processed.
-
     Note:
         This function assumes that:
             - ``load_model``, ``load_dataset``, ``Ronec``, and ``OutputFile`` are correctly defined and imported.
             - ``ronec_example`` is a valid mock RONEC object when ``mock_data=True``.
     """
 
-    nlp = load_model(MODEL)
-
     ronec = ronec_example if mock_data else load_dataset("ronec")
-    RonecOutputFile.write_header(dataset_type)
     dataset = ronec[dataset_type]
-    total_rows = 0
-    total_timespans = 0
+    timespans = [
+        (ronec_entry, timespan)
+        for ronec_entry in (Ronec(ronec, dataset_type, item) for item in dataset)
+        for timespan in ronec_entry.timespans
+    ]
+    counts = {
+        tag_type: {"timespans": 0, "normalized": 0, "exact_matches": 0}
+        for tag_type in RonecTagType
+    }
 
     print(f"{dataset_type}: no. of entries = {len(dataset)}")
 
-    for i, item in enumerate(dataset):
-        ronec_entry = Ronec(ronec, dataset_type, item)
-
-        if ronec_entry.timespans:
-            print(f"i = {i}")
-            total_rows += 1
+    started = time.perf_counter()
+    results = annotate_texts(
+        [timespan.text for _, timespan in timespans],
+        entity_cells,
+        MODEL,
+        workers=workers,
+        batch_size=batch_size,
+    )
+
+    with RonecOutputFile(dataset_type) as output_file:
+        for (ronec_entry, timespan), cells in zip(timespans, results):
+            output_file.write_entities_entries(ronec_entry, timespan, cells)
+
+            if timespan.tag_type is None:
+                continue
+
+            # the rows of the normalized entities have the labels of their edges
+            normalized = [row for row in cells if row[2] or row[3]]
+            exact = any(row[0] == timespan.text for row in normalized)
+            tag_counts = counts[timespan.tag_type]
+            tag_counts["timespans"] += 1
+            tag_counts["normalized"] += bool(normalized)
+            tag_counts["exact_matches"] += exact
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "entries": len(dataset),
+        "entries_with_timespans": len({id(entry) for entry, _ in timespans}),
+        "timespans": len(timespans),
+        "elapsed_s": round(elapsed, 3),
+        "timespans_per_sec": round(len(timespans) / elapsed, 1) if elapsed else None,
+        **_rates(
+            {
+                key: sum(tag_counts[key] for tag_counts in counts.values())
+                for key in ("timespans", "normalized", "exact_matches")
+            }
+        ),
+        "tag_types": {
+            tag_type.value: _rates(tag_counts)
+            for tag_type, tag_counts in counts.items()
+        },
+    }
+
+    print(
+        f"{dataset_type}: no. of date and periods entries = "
+        f"{summary['entries_with_timespans']}"
+    )
+    print(f"{dataset_type}: TOTAL no. of date and periods = {len(timespans)}")
+    print(
+        f"{dataset_type}: recall = {summary['recall']:.2%} | "
+        f"exact = {summary['exact']:.2%} | "
+        f"{summary['timespans_per_sec']} timespans/s"
+    )
+
+    return summary
+
+
+def validate_inp_data(
+    dataset_type: str, workers: int = WORKERS, batch_size: int = BATCH_SIZE
+) -> dict:
+    """
+    Processes the lines of an INP input file in batches with ``nlp.pipe`` (sharded
+    across ``workers`` processes), writes the normalized values through a single
+    buffered ``InpOutputFile`` and computes the summary metrics in the same pass.
 
-            for timespan in ronec_entry.timespans:
-                doc = nlp(timespan.text)
-                RonecOutputFile.write_entities_entries(
-                    dataset_type, ronec_entry, timespan, doc
-                )
-                total_timespans += 1
+    Args:
+        dataset_type (str): The INP input file (``all``, ``unique`` or ``additional``).
+        workers (int): The number of worker processes. Defaults to 1.
+        batch_size (int): The batch size of ``nlp.pipe``. Defaults to 64.
 
-    print(f"{dataset_type}: no. of date and periods entries = {total_rows}")
-    print(f"{dataset_type}: TOTAL no. of date and periods = {total_timespans}")
+    Returns:
+        dict: The summary metrics: the number of lines, of lines with at least one
+              normalized entity and their share (``coverage``), and the number of
+              rows written and of entities which were not normalized.
 
+    Example:
+        >>> validate_inp_data("unique", workers=4)
+    """
 
-def validate_inp_data(dataset_type: str):
-    nlp = load_model(MODEL)
-    InpOutputFile.write_header(dataset_type)
     raw_timespans = InpInputFile.read_file(dataset_type)
-
-    for raw_timespan in raw_timespans:
-        doc = nlp(raw_timespan)
-
-        for entity in doc.ents:
-            if isinstance(entity._.time_series, list):
-                for entry in entity._.time_series:
-                    InpOutputFile.write_timespan_entry(dataset_type, entry)
-            else:
-                InpOutputFile.write_empty_entry(dataset_type, entity.text)
+    lines = sum(1 for raw_timespan in raw_timespans if raw_timespan.strip())
+    normalized_lines = 0
+    empty_entities = 0
+
+    started = time.perf_counter()
+    results = annotate_texts(
+        raw_timespans, inp_rows, MODEL, workers=workers, batch_size=batch_size
+    )
+
+    with InpOutputFile(dataset_type) as output_file:
+        for rows in results:
+            output_file.write_rows(rows)
+
+            empty = sum(1 for row in rows if row[2] == "[]")
+            empty_entities += empty
+            normalized_lines += len(rows) > empty
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "lines": lines,
+        "normalized_lines": normalized_lines,
+        "coverage": round(normalized_lines / lines, 4) if lines else 0.0,
+        "rows": output_file.rows,
+        "empty_entities": empty_entities,
+        "elapsed_s": round(elapsed, 3),
+        "lines_per_sec": round(lines / elapsed, 1) if elapsed else None,
+    }
+
+    print(
+        f"inp {dataset_type}: {lines} lines | coverage = {summary['coverage']:.2%} | "
+        f"{summary['rows']} rows | {summary['lines_per_sec']} lines/s"
+    )
+
+    return summary
+
+
+def _rates(counts: dict) -> dict:
+    timespans = counts["timespans"]
+
+    return {
+        **counts,
+        "recall": round(counts["normalized"] / timespans, 4) if timespans else 0.0,
+        "exact": round(counts["exact_matches"] / timespans, 4) if timespans else 0.0,
+    }
 
 
 if __name__ == "__main__":
@@ -1,8 +1,13 @@
 import os
 from pathlib import Path
 
+from spacy.tokens import Doc
+
 from temporal_normalization import TimeSeries
 
+# The size of the write buffer of the output files.
+BUFFER_SIZE = 1 << 20
+
 
 class InpInputFile:
     @staticmethod
@@ -22,20 +27,21 @@ class InpInputFile:
 
 
 class InpOutputFile:
-    @staticmethod
-    def get_output_path(dataset_type: str) -> str:
-        path = f"{str(Path(__file__).resolve().parent)}/files/output/inp_{dataset_type}.csv"
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-
-        return path
-
-    @staticmethod
-    def write_header(dataset_type: str) -> None:
-        path = InpOutputFile.get_output_path(dataset_type)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-
-        with open(path, "w", encoding="utf-8") as csv_file:
-            entry = "|".join(
+    """
+    A buffered writer of the INP validation results, which keeps the CSV file open
+    for the whole run instead of reopening it for every row.
+
+    Example:
+        >>> with InpOutputFile("unique") as output_file:
+        ...     output_file.write_rows(inp_rows(doc))
+    """
+
+    def __init__(self, dataset_type: str):
+        self.path = InpOutputFile.get_output_path(dataset_type)
+        self.rows = 0
+        self._csv_file = open(self.path, "w", encoding="utf-8", buffering=BUFFER_SIZE)
+        self._csv_file.write(
+            "|".join(
                 [
                     "input value",
                     "prepared value",
@@ -43,43 +49,54 @@ class InpOutputFile:
                     "normalized values",
                 ]
             )
-            csv_file.write(entry + "\n")
+            + "\n"
+        )
 
-    @staticmethod
-    def write_empty_entry(
-        dataset_type: str,
-        entity_text: str,
-    ):
-        with open(
-            InpOutputFile.get_output_path(dataset_type), "a", encoding="utf-8"
-        ) as csv_file:
-            entry = "|".join(
-                [
-                    entity_text,
-                    entity_text,
-                    "[]",
-                    "[]",
-                ]
-            )
-            csv_file.write(entry + "\n")
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     @staticmethod
-    def write_timespan_entry(
-        dataset_type: str,
-        time_series: TimeSeries,
-    ):
-        with open(
-            InpOutputFile.get_output_path(dataset_type), "a", encoding="utf-8"
-        ) as csv_file:
-            entry = "|".join(
-                [
-                    time_series.input_value,
-                    time_series.prepared_value,
-                    f"[{{start={time_series.edges.start.uri}, end={time_series.edges.end.uri}}}]",
-                    _list_to_string([period.uri for period in time_series.periods]),
-                ]
-            )
-            csv_file.write(entry + "\n")
+    def get_output_path(dataset_type: str) -> str:
+        path = f"{str(Path(__file__).resolve().parent)}/files/output/inp_{dataset_type}.csv"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        return path
+
+    def write_rows(self, rows: list[list[str]]) -> None:
+        self._csv_file.writelines("|".join(row) + "\n" for row in rows)
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        self._csv_file.close()
+
+
+def inp_rows(doc: Doc) -> list[list[str]]:
+    """
+    Returns the CSV rows of a processed INP line: one row per time series of each
+    entity, or an empty row for the entities which were not normalized.
+    """
+
+    rows = []
+
+    for entity in doc.ents:
+        if isinstance(entity._.time_series, list):
+            rows.extend(_timespan_row(entry) for entry in entity._.time_series)
+        else:
+            rows.append([entity.text, entity.text, "[]", "[]"])
+
+    return rows
+
+
+def _timespan_row(time_series: TimeSeries) -> list[str]:
+    return [
+        time_series.input_value,
+        time_series.prepared_value,
+        f"[{{start={time_series.edges.start.uri}, end={time_series.edges.end.uri}}}]",
+        _list_to_string([period.uri for period in time_series.periods]),
+    ]
 
 
 def _list_to_string(input_list: list[str]) -> str:
@@ -0,0 +1,138 @@
+import time
+
+from datasets import load_dataset
+from spacy import Language
+
+from ronec_timespan import Ronec
+from temporal_normalization.index import _candidate_windows, CANDIDATE_LABELS
+from tests.model import load_model
+from tests.validation.ronec_mock_data import ronec_example
+
+MODEL = "ro_core_news_sm"
+CONTEXT_WINDOW = 32
+
+
+def compare_ner_guided(dataset_type: str, mock_data: bool = False):
+    """
+    Compares the NER-guided mode against the full-text mode on the sentences of a
+    RONEC split, in terms of throughput, characters sent to the Java process and
+    normalized spans.
+
+    The spans normalized in full-text mode are used as the reference for the spans
+    normalized in NER-guided mode. Both modes are also checked against the RONEC
+    ``DATETIME`` and ``PERIOD`` timespans: a timespan is found if it overlaps a
+    normalized span.
+
+    Args:
+        dataset_type (str): The name of the dataset split (``validation``, ``test``
+                            or ``train``).
+        mock_data (bool): Whether to use a mocked example dataset. Defaults to False.
+
+    Example:
+        >>> compare_ner_guided("validation")
+    """
+
+    ronec = ronec_example if mock_data else load_dataset("ronec")
+    entries = [Ronec(ronec, dataset_type, item) for item in ronec[dataset_type]]
+    texts = [entry.text for entry in entries]
+    gold = {
+        (i, start, end)
+        for i, entry in enumerate(entries)
+        for start, end in _timespan_offsets(entry)
+    }
+
+    print(f"{dataset_type}: {len(texts)} sentences, {len(gold)} RONEC timespans")
+
+    results = {}
+    for ner_guided in (False, True):
+        mode = "ner-guided" if ner_guided else "full-text"
+        nlp = load_model(
+            MODEL, {"ner_guided": ner_guided, "context_window": CONTEXT_WINDOW}
+        )
+
+        started = time.perf_counter()
+        docs = list(nlp.pipe(texts))
+        elapsed = time.perf_counter() - started
+
+        spans = _normalized_spans(docs)
+        results[mode] = spans
+        spans_by_doc: dict[int, list] = {}
+        for span in spans:
+            spans_by_doc.setdefault(span[0], []).append(span)
+        found = sum(1 for item in gold if _overlaps(item, spans_by_doc))
+
+        print(
+            f"{mode:>10}: {len(texts) / elapsed:8.1f} sentences/s | "
+            f"{_sent_chars(nlp, texts, ner_guided):>9} chars sent | "
+            f"{len(spans):>6} normalized spans | "
+            f"RONEC timespans found: {found / max(len(gold), 1):.2%}"
+        )
+
+    reference, guided = results["full-text"], results["ner-guided"]
+    common = len(reference & guided)
+    print(
+        f"ner-guided vs. full-text: "
+        f"precision {common / max(len(guided), 1):.2%} | "
+        f"recall {common / max(len(reference), 1):.2%}"
+    )
+
+
+def _normalized_spans(docs: list) -> set[tuple[int, int, int, str, str]]:
+    """Returns the normalized spans, with the edges of their time series."""
+
+    spans = set()
+
+    for i, doc in enumerate(docs):
+        for entity in doc.ents:
+            for ts in entity._.time_series or []:
+                edges = ts.edges
+                spans.add(
+                    (
+                        i,
+                        entity.start_char,
+                        entity.end_char,
+                        edges.start.uri if edges and edges.start else None,
+                        edges.end.uri if edges and edges.end else None,
+                    )
+                )
+
+    return spans
+
+
+def _sent_chars(nlp: Language, texts: list[str], ner_guided: bool) -> int:
+    """Returns the number of characters sent to the Java process."""
+
+    if not ner_guided:
+        return sum(len(text) for text in texts)
+
+    with nlp.select_pipes(disable=["temporal_normalization"]):
+        return sum(
+            end - start
+            for doc in nlp.pipe(texts)
+            for start, end in _candidate_windows(doc, CANDIDATE_LABELS, CONTEXT_WINDOW)
+        )
+
+
+def _timespan_offsets(entry: Ronec) -> list[tuple[int, int]]:
+    """Returns the character offsets of the RONEC timespans of a sentence."""
+
+    tokens = entry.sent["tokens"]
+    starts, position = [], 0
+    for token, space in zip(tokens, entry.sent["space_after"]):
+        starts.append(position)
+        position += len(token) + (1 if space else 0)
+
+    return [
+        (starts[timespan.start], starts[timespan.end] + len(tokens[timespan.end]))
+        for timespan in entry.timespans
+    ]
+
+
+def _overlaps(item: tuple[int, int, int], spans_by_doc: dict[int, list]) -> bool:
+    i, start, end = item
+    return any(span[1] < end and start < span[2] for span in spans_by_doc.get(i, ()))
+
+
+if __name__ == "__main__":
+    compare_ner_guided("validation")
+    compare_ner_guided("test")
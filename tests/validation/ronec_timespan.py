@@ -3,12 +3,15 @@ from enum import Enum
 from pathlib import Path
 
 from datasets import DatasetDict, Dataset
-from spacy.tokens import Span, Doc
+from spacy.tokens import Doc
 
 from temporal_normalization import console, TimeSeries
 
 EMPTY_SPACE = " "
 
+# The size of the write buffer of the output files.
+BUFFER_SIZE = 1 << 20
+
 
 class Ronec:
     def __init__(self, dataset_dict: DatasetDict, dataset_type: str, sent: Dataset):
@@ -70,60 +73,21 @@ class RonecTimespan:
 
 
 class RonecOutputFile:
-    @staticmethod
-    def get_output_path(dataset_type: str) -> str:
-        path = f"{str(Path(__file__).resolve().parent)}/files/output/{dataset_type}.csv"
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-
-        return path
-
-    @staticmethod
-    def write_entities_entries(
-        dataset_type: str, ronec_entry: Ronec, ronec_timespan: RonecTimespan, doc: Doc
-    ):
-        counter = 0
-
-        for entity in doc.ents:
-            RonecOutputFile.write_entity_entries(
-                dataset_type, ronec_entry, ronec_timespan, entity
-            )
-            counter += 1
-
-        if counter == 0:
-            RonecOutputFile.write_empty_entry(
-                dataset_type, ronec_entry, ronec_timespan, None
-            )
-
-    @staticmethod
-    def write_entity_entries(
-        dataset_type: str,
-        ronec_entry: Ronec,
-        ronec_timespan: RonecTimespan,
-        entity: Span,
-    ) -> None:
-        time_series = entity._.time_series
-
-        if isinstance(time_series, list):
-            for ts in time_series:
-                if isinstance(ts, TimeSeries):
-                    RonecOutputFile.write_timespan_entry(
-                        dataset_type, ronec_entry, ronec_timespan, entity.text, ts
-                    )
-                else:
-                    RonecOutputFile.write_empty_entry(
-                        dataset_type, ronec_entry, ronec_timespan, entity.text
-                    )
-        else:
-            RonecOutputFile.write_empty_entry(
-                dataset_type, ronec_entry, ronec_timespan, entity.text
-            )
-
-    @staticmethod
-    def write_header(dataset_type: str) -> None:
-        with open(
-            RonecOutputFile.get_output_path(dataset_type), "w", encoding="utf-8"
-        ) as csv_file:
-            entry = "|".join(
+    """
+    A buffered writer of the RONEC validation results, which keeps the CSV file open
+    for the whole run instead of reopening it for every row.
+
+    Example:
+        >>> with RonecOutputFile("validation") as output_file:
+        ...     output_file.write_entities_entries(ronec_entry, timespan, entity_cells(doc))
+    """
+
+    def __init__(self, dataset_type: str):
+        self.path = RonecOutputFile.get_output_path(dataset_type)
+        self.rows = 0
+        self._csv_file = open(self.path, "w", encoding="utf-8", buffering=BUFFER_SIZE)
+        self._csv_file.write(
+            "|".join(
                 [
                     "id",
                     "sentence",
@@ -135,56 +99,84 @@ class RonecOutputFile:
                     "end",
                 ]
             )
-            csv_file.write(entry + "\n")
+            + "\n"
+        )
 
-    @staticmethod
-    def write_empty_entry(
-        dataset_type: str,
-        ronec_entry: Ronec,
-        ronec_timespan: RonecTimespan | None,
-        entity_text: str | None,
-    ) -> None:
-        with open(
-            RonecOutputFile.get_output_path(dataset_type), "a", encoding="utf-8"
-        ) as csv_file:
-            entry = "|".join(
-                [
-                    str(ronec_entry.sent["id"]),
-                    ronec_entry.text,
-                    ronec_timespan.text if ronec_timespan is not None else "",
-                    ronec_timespan.tag_type.value if ronec_timespan is not None else "",
-                    entity_text if entity_text is not None else "",
-                    "",
-                    "",
-                    "",
-                ]
-            )
-            csv_file.write(entry + "\n")
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
     @staticmethod
-    def write_timespan_entry(
-        dataset_type: str,
+    def get_output_path(dataset_type: str) -> str:
+        path = f"{str(Path(__file__).resolve().parent)}/files/output/{dataset_type}.csv"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        return path
+
+    def write_entities_entries(
+        self,
         ronec_entry: Ronec,
         ronec_timespan: RonecTimespan,
-        entity_text: str,
-        time_series: TimeSeries,
+        cells: list[list[str]],
     ) -> None:
-        with open(
-            RonecOutputFile.get_output_path(dataset_type), "a", encoding="utf-8"
-        ) as csv_file:
-            entry = "|".join(
-                [
-                    str(ronec_entry.sent["id"]),
-                    ronec_entry.text,
-                    ronec_timespan.text,
-                    ronec_timespan.tag_type.value,
-                    entity_text,
-                    " ## ".join(time_series.matches),
-                    time_series.edges.start.label,
-                    time_series.edges.end.label,
-                ]
-            )
-            csv_file.write(entry + "\n")
+        """
+        Writes the rows of a RONEC timespan, i.e., the cells returned by
+        ``entity_cells`` prefixed with the sentence and the timespan.
+        """
+
+        prefix = "|".join(
+            [
+                str(ronec_entry.sent["id"]),
+                ronec_entry.text,
+                ronec_timespan.text,
+                ronec_timespan.tag_type.value,
+            ]
+        )
+        self._csv_file.writelines(f"{prefix}|{'|'.join(row)}\n" for row in cells)
+        self.rows += len(cells)
+
+    def close(self) -> None:
+        self._csv_file.close()
+
+
+def entity_cells(doc: Doc) -> list[list[str]]:
+    """
+    Returns the entity cells (``spacy entity``, ``matches``, ``start`` and ``end``) of
+    a processed RONEC timespan: one row per time series of each entity, a row without
+    matches for the entities which were not normalized, or a single empty row if the
+    doc has no entities.
+
+    The cells are plain strings, so they can be returned by the worker processes.
+    """
+
+    cells = []
+
+    for entity in doc.ents:
+        time_series = entity._.time_series
+
+        if not isinstance(time_series, list):
+            cells.append([entity.text, "", "", ""])
+            continue
+
+        for ts in time_series:
+            if isinstance(ts, TimeSeries):
+                cells.append(
+                    [
+                        entity.text,
+                        " ## ".join(ts.matches),
+                        ts.edges.start.label,
+                        ts.edges.end.label,
+                    ]
+                )
+            else:
+                cells.append([entity.text, "", "", ""])
+
+    if not doc.ents:
+        return [["", "", "", ""]]
+
+    return cells
 
 
 def _get_timespans(tokens: list[str], tags: list[str]) -> list[RonecTimespan]:
@@ -0,0 +1,117 @@
+import multiprocessing
+from multiprocessing.util import Finalize
+from typing import Callable, Iterator
+
+from spacy.tokens import Doc
+
+from temporal_normalization import close_conn
+from tests.model import load_model
+
+# The number of texts of a shard sent to a worker process.
+SHARD_SIZE = 512
+
+# The pipeline of the current worker process and its batch size, or the error which
+# prevented it from loading.
+_nlp = None
+_batch_size = 64
+_worker_error: Exception | None = None
+
+
+def annotate_texts(
+    texts: list[str],
+    annotate: Callable[[Doc], object],
+    model: str,
+    config: dict | None = None,
+    workers: int = 1,
+    batch_size: int = 64,
+    shard_size: int = SHARD_SIZE,
+) -> Iterator:
+    """
+    Processes texts with ``nlp.pipe`` and yields ``annotate(doc)`` for each of them,
+    in the order of the texts.
+
+    With several workers, the texts are split into shards of ``shard_size`` texts
+    which are processed by ``workers`` processes, each with its own pipeline (and
+    Java process, on a free port, see ``java_port``). ``annotate`` runs in the worker
+    processes, so it must be a module-level function which returns plain, picklable
+    values.
+
+    Args:
+        texts (list[str]): The texts to process.
+        annotate (Callable[[Doc], object]): Extracts the results of a processed doc.
+        model (str): The spaCy model (see ``load_model``).
+        config (dict or None): The settings of the ``temporal_normalization``
+                               component. Defaults to None.
+        workers (int): The number of worker processes. 1 processes the texts in the
+                       current process. Defaults to 1.
+        batch_size (int): The batch size of ``nlp.pipe``. Defaults to 64.
+        shard_size (int): The number of texts of a shard. Defaults to 512.
+
+    Example:
+        >>> for rows in annotate_texts(texts, inp_rows, "ro_core_news_sm", workers=4):
+        ...     output_file.write_rows(rows)
+    """
+
+    if workers <= 1 or len(texts) <= shard_size:
+        nlp = load_model(model, config)
+        for doc in nlp.pipe(texts, batch_size=batch_size):
+            yield annotate(doc)
+        return
+
+    shards = [
+        (texts[start : start + shard_size], annotate)
+        for start in range(0, len(texts), shard_size)
+    ]
+    workers = min(workers, len(shards))
+    context = multiprocessing.get_context("spawn")
+
+    # each worker starts its own Java process, so they must not share the default port
+    worker_config = {**(config or {}), "java_port": 0}
+
+    with context.Pool(
+        workers, initializer=_init_worker, initargs=(model, worker_config, batch_size)
+    ) as pool:
+        for results in pool.imap(_annotate_shard, shards):
+            yield from results
+
+        pool.close()
+        pool.join()
+
+
+def _init_worker(model: str, config: dict | None, batch_size: int) -> None:
+    """
+    Loads the pipeline of a worker, whose Java process is closed on exit. An error is
+    raised by the first shard of the worker, since a pool whose initializer raises
+    replaces the worker over and over.
+    """
+
+    global _nlp, _batch_size, _worker_error
+
+    try:
+        _nlp = load_model(model, config)
+    except Exception as e:
+        _worker_error = e
+        return
+    _batch_size = batch_size
+
+    component = _nlp.get_pipe("temporal_normalization")
+    Finalize(
+        None,
+        close_conn,
+        (component.java_process, component.gateway),
+        exitpriority=10,
+    )
+
+
+def _annotate_shard(shard: tuple[list[str], Callable[[Doc], object]]) -> list:
+    if _worker_error is not None:
+        raise RuntimeError(
+            "The pipeline of the worker did not load."
+        ) from _worker_error
+
+    texts, annotate = shard
+    return [annotate(doc) for doc in _nlp.pipe(texts, batch_size=_batch_size)]
+
+
+if __name__ == "__main__":
+    pass